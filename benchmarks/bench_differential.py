@@ -0,0 +1,51 @@
+# Decision Ecosystem — ops-health-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Differential run: optimized engines vs update_kill_switch (equivalence + speedup)."""
+
+import logging
+
+from ops_health_core.cache import SignalCache
+from ops_health_core.differential import Candidate, run_differential
+from ops_health_core.latency import ExactLatencyStore, LatencyHistogram
+from ops_health_core.model import OpsState
+
+
+def _cached_engine():
+    caches: dict[int, SignalCache] = {}
+
+    def engine(state, policy, now_ms):
+        cache = caches.get(id(state))
+        if cache is None or cache.state is not state:
+            cache = caches[id(state)] = SignalCache(state, policy)
+        return cache.get(now_ms)
+
+    return engine
+
+
+def main() -> None:
+    logging.disable(logging.WARNING)  # Fault steps log the expected fail-closed warnings
+    candidates = [
+        Candidate("exact-store", state_factory=lambda: OpsState(latency_store=ExactLatencyStore())),
+        Candidate("signal-cache", engine=_cached_engine()),
+        # Approximate by design (slice expiry, bucketed values): expected to diverge
+        Candidate("histogram", state_factory=lambda: OpsState(latency_store=LatencyHistogram())),
+    ]
+    report = run_differential(candidates, scenarios=500, steps=300)
+    print(f"scenarios={report.scenarios} evaluations/engine={report.evaluations}")
+    for name, seconds in report.engine_s.items():
+        speedup = report.speedups.get(name)
+        divergent = report.divergent_scenarios.get(name, 0)
+        print(
+            f"{name:13s} {seconds * 1e3:8.1f} ms  "
+            f"speedup={'-' if speedup is None else f'{speedup:.2f}x':>6s}  "
+            f"divergent scenarios={divergent}"
+        )
+    for divergence in report.divergences.values():
+        print(f"\nfirst divergence: {divergence.candidate} (seed {divergence.seed})")
+        print(f"  expected {divergence.expected}\n  actual   {divergence.actual}")
+        print(divergence.reproducer())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+# Decision Ecosystem — ops-health-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Benchmark: fused prune-and-score vs the previous two-phase evaluation (time + allocations)."""
+
+import copy
+import random
+import time
+import tracemalloc
+
+from ops_health_core.model import OpsPolicy, OpsState
+from ops_health_core.policy import compile_policy
+from ops_health_core.scorer import compute_health_score, score_from_counts
+from ops_health_core.windows import count_in_window, prune_timestamps_inplace
+
+
+def two_phase(state: OpsState, policy, now_ms: int):
+    """Previous evaluation: prune every list, then count and sort again in the scorer."""
+    prune_timestamps_inplace(state.error_timestamps, now_ms, policy.window_ms)
+    prune_timestamps_inplace(state.rate_limit_timestamps, now_ms, policy.window_ms)
+    prune_timestamps_inplace(state.reconnect_timestamps, now_ms, policy.window_ms)
+    cutoff_ms = now_ms - policy.window_ms
+    if state.latency_samples and state.latency_timestamps:
+        min_len = min(len(state.latency_samples), len(state.latency_timestamps))
+        pruned_samples = []
+        pruned_timestamps = []
+        for i in range(min_len):
+            ts = state.latency_timestamps[i]
+            if ts >= cutoff_ms:
+                pruned_samples.append(state.latency_samples[i])
+                pruned_timestamps.append(ts)
+        state.latency_samples[:] = pruned_samples
+        state.latency_timestamps[:] = pruned_timestamps
+    errors = count_in_window(state.error_timestamps, now_ms, policy.window_ms)
+    rate_limits = count_in_window(state.rate_limit_timestamps, now_ms, policy.window_ms)
+    reconnects = count_in_window(state.reconnect_timestamps, now_ms, policy.window_ms)
+    p95 = None
+    min_len = min(len(state.latency_samples), len(state.latency_timestamps))
+    if min_len > 0:
+        latencies = sorted(state.latency_samples[:min_len])
+        p95 = latencies[min(int(0.95 * min_len), min_len - 1)]
+    return score_from_counts(policy, errors, rate_limits, reconnects, p95)
+
+
+def fused(state: OpsState, policy, now_ms: int):
+    return compute_health_score(state, policy, now_ms, prune=True)
+
+
+def _state(events: int, window_ms: int, now_ms: int) -> OpsState:
+    rng = random.Random(1)
+    state = OpsState()
+    for i in range(events):
+        ts = now_ms - int(1.2 * window_ms) + i * int(1.2 * window_ms) // events
+        state.error_timestamps.append(ts)
+        state.rate_limit_timestamps.append(ts)
+        state.reconnect_timestamps.append(ts)
+        state.latency_samples.append(rng.randint(1, 2000))
+        state.latency_timestamps.append(ts)
+    return state
+
+
+def _measure(fn, states, policy, now_ms) -> tuple[float, int]:
+    runs = [copy.deepcopy(s) for s in states]
+    start = time.perf_counter()
+    for s in runs:
+        fn(s, policy, now_ms)
+        fn(s, policy, now_ms)  # Steady state: nothing left to prune
+    elapsed = time.perf_counter() - start
+    runs = [copy.deepcopy(s) for s in states]
+    tracemalloc.start()
+    for s in runs:
+        fn(s, policy, now_ms)
+        fn(s, policy, now_ms)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed / (2 * len(states)), peak
+
+
+def main() -> None:
+    policy = compile_policy(OpsPolicy(window_ms=60_000))
+    now_ms = 1_000_000
+    for events in (100, 1_000, 10_000):
+        states = [_state(events, policy.window_ms, now_ms) for _ in range(20)]
+        assert fused(copy.deepcopy(states[0]), policy, now_ms) == two_phase(
+            copy.deepcopy(states[0]), policy, now_ms
+        )
+        for name, fn in (("two-phase", two_phase), ("fused", fused)):
+            seconds, peak = _measure(fn, states, policy, now_ms)
+            print(f"events={events:6d} {name:9s} {seconds * 1e6:9.1f} us/eval  peak={peak:9d} B")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+# Decision Ecosystem — ops-health-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Benchmark: sharded registry evaluation across thread counts (run on 3.13t for scaling)."""
+
+import os
+import random
+import sys
+import time
+
+from ops_health_core.model import OpsPolicy, OpsState
+from ops_health_core.parallel import ShardedEvaluator, gil_enabled
+
+
+def _registry(entities: int, events: int, window_ms: int, now_ms: int) -> dict[str, OpsState]:
+    rng = random.Random(1)
+    registry = {}
+    for i in range(entities):
+        state = OpsState()
+        for _ in range(events):
+            ts = now_ms - rng.randrange(window_ms)
+            state.record_error(ts)
+            state.record_latency(rng.randint(1, 2000), ts)
+        registry[f"entity-{i}"] = state
+    return registry
+
+
+def main() -> None:
+    policy = OpsPolicy(window_ms=60_000)
+    now_ms = 1_000_000
+    registry = _registry(entities=5_000, events=50, window_ms=policy.window_ms, now_ms=now_ms)
+    cpus = os.cpu_count() or 1
+    counts = sorted({1, 2, 4, 8, 16, 32, cpus} & set(range(1, cpus + 1)) | {1, 2})
+    print(f"python {sys.version.split()[0]}, gil={'on' if gil_enabled() else 'off'}, cpus={cpus}")
+    baseline = None
+    for workers in counts:
+        with ShardedEvaluator(policy, workers=workers) as evaluator:
+            evaluator.evaluate(registry, now_ms)  # Warm-up (also prunes once)
+            runs = 5
+            start = time.perf_counter()
+            for i in range(runs):
+                evaluator.evaluate(registry, now_ms + i)
+            seconds = (time.perf_counter() - start) / runs
+        baseline = baseline or seconds
+        print(
+            f"workers={workers:3d} {seconds * 1e3:8.1f} ms/registry "
+            f"{len(registry) / seconds:10.0f} entities/s  speedup={baseline / seconds:5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
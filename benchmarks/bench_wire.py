@@ -0,0 +1,43 @@
+# Decision Ecosystem — ops-health-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Benchmark: binary wire format vs JSON for OpsSignal (encode + decode)."""
+
+import json
+import timeit
+
+from ops_health_core.kill_switch import update_kill_switch
+from ops_health_core.latency import LatencyHistogram
+from ops_health_core.model import OpsPolicy, OpsState
+from ops_health_core.wire import decode_signal, encode_signal
+
+
+def _signal():
+    policy = OpsPolicy(max_errors_per_window=2, weight_errors=0.9)
+    state = OpsState(latency_store=LatencyHistogram())
+    for ts in range(0, 1000, 100):
+        state.record_error(ts)
+        state.record_latency(200 + ts, ts)
+    return update_kill_switch(state, policy, 1000)
+
+
+def main() -> None:
+    signal = _signal()
+    json_data = json.dumps(signal.to_context()).encode()
+    wire_data = encode_signal(signal)
+    n = 100_000
+    cases = {
+        "json encode": lambda: json.dumps(signal.to_context()).encode(),
+        "wire encode": lambda: encode_signal(signal),
+        "json decode": lambda: json.loads(json_data)["ops_deny_actions"],
+        "wire decode (view field)": lambda: decode_signal(wire_data).deny_actions,
+        "wire decode (to_context)": lambda: decode_signal(wire_data).to_context(),
+    }
+    print(f"sizes: json={len(json_data)} B, wire={len(wire_data)} B")
+    for name, fn in cases.items():
+        seconds = min(timeit.repeat(fn, number=n, repeat=3))
+        print(f"{name:26s} {seconds / n * 1e9:8.0f} ns/op")
+
+
+if __name__ == "__main__":
+    main()
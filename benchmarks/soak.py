@@ -0,0 +1,87 @@
+# Decision Ecosystem — ops-health-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Soak run: synthetic traffic with labeled incidents against update_kill_switch."""
+
+import argparse
+
+from ops_health_core.latency import ExactLatencyStore, LatencyHistogram
+from ops_health_core.loadgen import Incident, LoadProfile, run_soak
+from ops_health_core.model import OpsPolicy, OpsState
+
+STORES = {
+    "list": OpsState,
+    "histogram": lambda: OpsState(latency_store=LatencyHistogram()),
+    "exact": lambda: OpsState(latency_store=ExactLatencyStore()),
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--minutes", type=float, default=30.0, help="Stream time to simulate")
+    parser.add_argument("--entities", type=int, default=50)
+    parser.add_argument("--latency-rate", type=float, default=20.0, help="Samples/s per entity")
+    parser.add_argument("--store", choices=sorted(STORES), default="list")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    duration_ms = int(args.minutes * 60_000)
+    incidents = [
+        Incident(
+            start_ms,
+            90_000,
+            error_rate_per_s=1.0,
+            rate_limit_rate_per_s=0.5,
+            reconnect_rate_per_s=0.2,
+            latency_scale=20.0,
+            entities=max(1, args.entities // 5),
+        )
+        for start_ms in range(300_000, duration_ms, 600_000)
+    ]
+    profile = LoadProfile(
+        duration_ms=duration_ms,
+        entities=args.entities,
+        latency_rate_per_s=args.latency_rate,
+        burst_rate_per_s=0.0005,
+        burst_size=5,
+        disorder_fraction=0.05,
+        disorder_ms=2_000,
+        incidents=incidents,
+    )
+    report = run_soak(
+        profile,
+        OpsPolicy(),
+        report_interval_ms=60_000,
+        seed=args.seed,
+        state_factory=STORES[args.store],
+    )
+
+    print(
+        f"{'stream_s':>8} {'events':>9} {'ev/s':>9} {'p50_us':>8} {'p99_us':>8} {'rss_MB':>7} trips"
+    )
+    for s in report.samples:
+        rss = s.rss_bytes / 2**20 if s.rss_bytes is not None else float("nan")
+        print(
+            f"{s.stream_ms // 1000:8d} {s.events:9d} {s.events_per_s:9.0f} "
+            f"{s.eval_p50_us or 0:8.1f} {s.eval_p99_us or 0:8.1f} {rss:7.1f} {s.trips}"
+        )
+    growth = report.rss_growth_bytes
+    print(
+        f"\nevents={report.events} evals={report.evaluations} wall={report.wall_s:.1f}s "
+        f"throughput={report.events_per_s:.0f} ev/s"
+    )
+    print(
+        f"eval p50={report.eval_p50_us:.1f}us p99={report.eval_p99_us:.1f}us "
+        f"max={report.eval_max_us:.1f}us  rss growth="
+        f"{'n/a' if growth is None else f'{growth / 2**20:.1f} MB'}"
+    )
+    delays = sorted(report.detection_delays_ms)
+    print(
+        f"trips={report.trips} true={report.true_trips} false={report.false_trips} "
+        f"missed={report.missed_incidents} fail_closed={report.fail_closed} "
+        f"median detection={delays[len(delays) // 2] if delays else 'n/a'} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+# Decision Ecosystem — ops-health-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Adaptive rate-limit budget (AIMD rate + token bucket)."""
+
+from dataclasses import dataclass
+
+
+@dataclass
+class RateBudgetPolicy:
+    """Rate budget configuration."""
+
+    initial_rate_per_s: float = 100.0
+    min_rate_per_s: float = 1.0
+    max_rate_per_s: float = 1000.0
+    increase_per_s: float = 5.0  # Additive increase (rate gained per second, no congestion)
+    decrease_factor: float = 0.5  # Multiplicative decrease on 429
+    latency_target_ms: int = 0  # Latency above target counts as congestion (0 = disabled)
+    latency_decrease_factor: float = 0.9  # Multiplicative decrease on slow response
+    decrease_holdoff_ms: int = 1000  # At most one decrease per holdoff (one per burst)
+    burst_s: float = 1.0  # Token bucket capacity = rate * burst_s
+
+
+class RateBudget:
+    """
+    AIMD request-rate budget driven by the 429 and latency streams.
+
+    Every method is O(1). Additive increase is applied lazily from elapsed time;
+    429s (and, if enabled, slow responses) cut the rate multiplicatively, at most
+    once per decrease_holdoff_ms. try_acquire() is a token bucket at the current rate.
+    """
+
+    __slots__ = ("_last_decrease_ms", "_last_update_ms", "policy", "rate_per_s", "tokens")
+
+    def __init__(self, policy: RateBudgetPolicy | None = None) -> None:
+        self.policy = policy if policy is not None else RateBudgetPolicy()
+        self.rate_per_s = min(
+            self.policy.max_rate_per_s,
+            max(self.policy.min_rate_per_s, self.policy.initial_rate_per_s),
+        )
+        self.tokens = self.rate_per_s * self.policy.burst_s
+        self._last_update_ms: int | None = None
+        self._last_decrease_ms: int | None = None
+
+    def _advance(self, now_ms: int) -> None:
+        """Apply additive increase and token accrual up to now_ms (never backwards)."""
+        last = self._last_update_ms
+        if last is None:
+            self._last_update_ms = now_ms
+            return
+        if now_ms <= last:
+            return
+        elapsed_s = (now_ms - last) / 1000.0
+        self._last_update_ms = now_ms
+        self.rate_per_s = min(
+            self.policy.max_rate_per_s, self.rate_per_s + self.policy.increase_per_s * elapsed_s
+        )
+        self.tokens = min(
+            self.rate_per_s * self.policy.burst_s, self.tokens + self.rate_per_s * elapsed_s
+        )
+
+    def _decrease(self, ts_ms: int, factor: float) -> None:
+        last = self._last_decrease_ms
+        if last is not None and ts_ms - last < self.policy.decrease_holdoff_ms:
+            return
+        self._last_decrease_ms = ts_ms
+        self.rate_per_s = max(self.policy.min_rate_per_s, self.rate_per_s * factor)
+        self.tokens = min(self.tokens, self.rate_per_s * self.policy.burst_s)
+
+    def on_429(self, ts_ms: int) -> None:
+        """Consume a rate-limit (429) event."""
+        self._advance(ts_ms)
+        self._decrease(ts_ms, self.policy.decrease_factor)
+
+    def on_latency(self, latency_ms: float, ts_ms: int) -> None:
+        """Consume a latency sample (congestion signal if above latency_target_ms)."""
+        self._advance(ts_ms)
+        target = self.policy.latency_target_ms
+        if target > 0 and latency_ms > target:
+            self._decrease(ts_ms, self.policy.latency_decrease_factor)
+
+    def recommended_rate(self, now_ms: int) -> float:
+        """
+        Recommended request rate at now_ms.
+
+        Returns:
+            Requests per second
+        """
+        self._advance(now_ms)
+        return self.rate_per_s
+
+    def recovered(self, now_ms: int) -> bool:
+        """Whether the rate is back at its initial value (a fresh budget is no more permissive)."""
+        policy = self.policy
+        initial = min(policy.max_rate_per_s, max(policy.min_rate_per_s, policy.initial_rate_per_s))
+        return self.recommended_rate(now_ms) >= initial
+
+    def try_acquire(self, now_ms: int, tokens: float = 1.0) -> bool:
+        """
+        Take tokens from the bucket if available (local throttle).
+
+        Returns:
+            True if the request may proceed
+        """
+        self._advance(now_ms)
+        if self.tokens >= tokens:
+            self.tokens -= tokens
+            return True
+        return False
@@ -0,0 +1,84 @@
+# Decision Ecosystem — ops-health-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Memoized kill-switch evaluation keyed by state version and time quantum."""
+
+import logging
+
+from ops_health_core.kill_switch import fail_closed_signal, update_kill_switch
+from ops_health_core.model import REASON_FAIL_CLOSED, OpsPolicy, OpsSignal, OpsState
+from ops_health_core.policy import CompiledPolicy, as_compiled
+
+logger = logging.getLogger(__name__)
+
+
+class SignalCache:
+    """
+    Memoizing wrapper around update_kill_switch for one OpsState.
+
+    get() returns the cached signal while the state version (bumped by record_*
+    and touch()), the now_ms quantum (now_ms // quantum_ms) and the state's
+    cooldown are unchanged. Cooldown expiry is exact: a cached signal whose
+    cooldown ends at or before now_ms is never returned. Fail-closed signals are
+    never cached, and any error inside the cache itself fails closed.
+
+    Within one quantum, window expiry and time-driven components (drift hold,
+    rate budget) are evaluated at the first call's now_ms; quantum_ms=1 keeps
+    results exact to the millisecond. Returned signals are shared between
+    callers and must be treated as read-only.
+    """
+
+    __slots__ = ("_key", "_signal", "hits", "misses", "policy", "quantum_ms", "state")
+
+    def __init__(
+        self, state: OpsState, policy: OpsPolicy | CompiledPolicy, quantum_ms: int = 1
+    ) -> None:
+        if quantum_ms <= 0:
+            raise ValueError("quantum_ms must be > 0")
+        self.state = state
+        self.policy = as_compiled(policy)
+        self.quantum_ms = quantum_ms
+        self.hits = 0
+        self.misses = 0
+        self._key: tuple[int, int, int | None] | None = None
+        self._signal: OpsSignal | None = None
+
+    def get(self, now_ms: int) -> OpsSignal:
+        """
+        Current signal (cached or freshly evaluated).
+
+        Args:
+            now_ms: Current time (ms)
+
+        Returns:
+            OpsSignal with kill switch recommendations (fail-closed on exception)
+        """
+        try:
+            state = self.state
+            key = (state.version, now_ms // self.quantum_ms, state.cooldown_until_ms)
+            signal = self._signal
+            if (
+                signal is not None
+                and key == self._key
+                and (signal.cooldown_until_ms is None or now_ms < signal.cooldown_until_ms)
+            ):
+                self.hits += 1
+                return signal
+            self.misses += 1
+            signal = update_kill_switch(state, self.policy, now_ms)
+            if REASON_FAIL_CLOSED in signal.reasons:
+                self._key = self._signal = None
+                return signal
+            # Key on the pre-evaluation cooldown: if this evaluation started one, the next
+            # call sees an active cooldown (and its reason) and must evaluate again
+            self._key = key
+            self._signal = signal
+            return signal
+        except Exception as e:
+            logger.warning("Signal cache fail-closed on exception: %s", type(e).__name__)
+            self._key = self._signal = None
+            return fail_closed_signal()
+
+    def invalidate(self) -> None:
+        """Drop the cached signal (e.g. after changing the policy or the state externally)."""
+        self._key = self._signal = None
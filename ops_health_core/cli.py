@@ -10,6 +10,7 @@ from pathlib import Path
 from ops_health_core.contracts import check_schema_compatibility
 from ops_health_core.kill_switch import update_kill_switch
 from ops_health_core.model import OpsPolicy, OpsState
+from ops_health_core.policy import compile_policy
 
 
 def main() -> None:
@@ -37,6 +38,13 @@ def main() -> None:
     else:
         policy = OpsPolicy()
 
+    # Validate and compile policy once (rejects invalid configs at load time)
+    try:
+        compiled = compile_policy(policy)
+    except ValueError as e:
+        print(f"[FAIL] Invalid policy: {e}")
+        return
+
     # Load events
     if args.events:
         with open(args.events, "r") as f:
@@ -69,7 +77,7 @@ def main() -> None:
             state.latency_timestamps.append(ts_ms)
 
     # Update kill switch
-    signal = update_kill_switch(state, policy, now_ms)
+    signal = update_kill_switch(state, compiled, now_ms)
 
     # Print results
     print(f"Health Score: {signal.score:.3f}")
@@ -0,0 +1,330 @@
+# Decision Ecosystem — ops-health-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Randomized differential testing of kill-switch engines against update_kill_switch."""
+
+import random
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+
+from ops_health_core.kill_switch import Engine, update_kill_switch
+from ops_health_core.model import (
+    EVENT_429,
+    EVENT_ERROR,
+    EVENT_RECONNECT,
+    OpsPolicy,
+    OpsSignal,
+    OpsState,
+)
+from ops_health_core.policy import CompiledPolicy, compile_policy
+from ops_health_core.sweep import EVENT_LATENCY
+
+STEP_TICK = "tick"  # Evaluate at ts_ms
+STEP_FAULT = "fault"  # Evaluate at ts_ms with a poisoned window (exercises fail-closed)
+
+# Signal fields that make up the kill-switch decision (compared by default)
+DECISION_FIELDS = (
+    "score",
+    "state",
+    "deny_actions",
+    "cooldown_until_ms",
+    "recommended_action",
+    "reasons",
+)
+
+
+@dataclass(frozen=True)
+class Step:
+    """One scenario step: an event (EVENT_* or "latency") or an evaluation."""
+
+    kind: str
+    ts_ms: int
+    value: float = 0.0  # Latency (ms) for latency events
+
+
+@dataclass
+class Candidate:
+    """Engine under test: evaluator plus the state it evaluates (e.g. a faster store)."""
+
+    name: str
+    engine: Engine = update_kill_switch
+    state_factory: Callable[[], OpsState] = OpsState
+
+
+REFERENCE = Candidate("reference")
+
+
+def generate_scenario(rng: random.Random, steps: int = 200) -> tuple[OpsPolicy, list[Step]]:
+    """
+    Random policy and step sequence biased toward edge cases.
+
+    Clock increments are drawn from {0, 1, window_ms +- 1, cooldown_ms +- 1}, so
+    evaluations land exactly on window and cooldown boundaries; event timestamps
+    include the exact window cutoff and out-of-order arrivals; budgets may be 0
+    (disabled); latencies repeat and straddle max_p95_latency_ms.
+    """
+    window_ms = rng.choice([1, 5, 50, 100, 1000])
+    red = rng.choice([0.0, 0.3, 0.5, 1.0])
+    policy = OpsPolicy(
+        window_ms=window_ms,
+        max_errors_per_window=rng.randint(0, 5),
+        max_429_per_window=rng.randint(0, 5),
+        max_reconnects_per_window=rng.randint(0, 3),
+        max_p95_latency_ms=rng.choice([0, 10, 100]),
+        cooldown_ms=rng.choice([0, 1, window_ms, 2 * window_ms + 1, 500]),
+        score_threshold_red=red,
+        score_threshold_yellow=rng.choice([red, (red + 1.0) / 2, 1.0]),
+        weight_errors=rng.choice([0.0, 0.4, 0.9]),
+        weight_429=rng.choice([0.0, 0.3]),
+        weight_reconnects=rng.choice([0.0, 0.2]),
+        weight_latency=rng.choice([0.0, 0.1, 0.5]),
+    )
+    increments = [0, 1, 1, 2, window_ms - 1, window_ms, window_ms + 1]
+    increments += [policy.cooldown_ms - 1, policy.cooldown_ms, policy.cooldown_ms + 1]
+    now = rng.randint(0, 1000)
+    scenario = []
+    for _ in range(steps):
+        roll = rng.random()
+        if roll < 0.25:
+            now += max(0, rng.choice(increments))
+            scenario.append(Step(STEP_TICK, now))
+        elif roll < 0.27:
+            scenario.append(Step(STEP_FAULT, now))
+        else:
+            ts = now - rng.choice([0, 0, 1, window_ms, window_ms + 1, rng.randint(0, window_ms)])
+            kind = rng.choice([EVENT_ERROR, EVENT_429, EVENT_RECONNECT, EVENT_LATENCY])
+            value = rng.choice([0, 5, 10, 11, 99, 100, 101, 250]) if kind == EVENT_LATENCY else 0
+            scenario.append(Step(kind, ts, value))
+    scenario.append(Step(STEP_TICK, now))
+    return policy, scenario
+
+
+def _apply(state: OpsState, step: Step) -> None:
+    if step.kind == EVENT_ERROR:
+        state.record_error(step.ts_ms)
+    elif step.kind == EVENT_429:
+        state.record_429(step.ts_ms)
+    elif step.kind == EVENT_RECONNECT:
+        state.record_reconnect(step.ts_ms)
+    elif step.kind == EVENT_LATENCY:
+        state.record_latency(step.value, step.ts_ms)
+    else:
+        raise ValueError(f"unknown step kind: {step.kind!r}")
+
+
+def _evaluate(engine: Engine, state: OpsState, policy: CompiledPolicy, step: Step) -> OpsSignal:
+    if step.kind != STEP_FAULT:
+        return engine(state, policy, step.ts_ms)
+    # Non-comparable timestamp: pruning raises inside the evaluation
+    state.error_timestamps.insert(0, None)  # type: ignore[arg-type]
+    state.touch()
+    try:
+        return engine(state, policy, step.ts_ms)
+    finally:
+        if state.error_timestamps and state.error_timestamps[0] is None:
+            del state.error_timestamps[0]
+        state.touch()
+
+
+def _outcome(signal: OpsSignal, state: OpsState, fields: Sequence[str]) -> tuple:
+    return (*(getattr(signal, name) for name in fields), state.cooldown_until_ms)
+
+
+def _trace(
+    candidate: Candidate,
+    policy: CompiledPolicy,
+    steps: Sequence[Step],
+    fields: Sequence[str],
+) -> tuple[list[tuple], int]:
+    """Outcome per step (None for recorded events) and engine time (ns)."""
+    state = candidate.state_factory()
+    outcomes: list[tuple] = []
+    engine_ns = 0
+    for step in steps:
+        try:
+            if step.kind in (STEP_TICK, STEP_FAULT):
+                start = time.perf_counter_ns()
+                signal = _evaluate(candidate.engine, state, policy, step)
+                engine_ns += time.perf_counter_ns() - start
+                outcomes.append(_outcome(signal, state, fields))
+            else:
+                _apply(state, step)
+                outcomes.append(None)
+        except Exception as e:
+            outcomes.append(("raised", type(e).__name__))
+            break
+    return outcomes, engine_ns
+
+
+def _first_divergence(expected: list[tuple], actual: list[tuple]) -> int | None:
+    for index, (a, b) in enumerate(zip(expected, actual, strict=False)):
+        if a != b:
+            return index
+    if len(expected) != len(actual):
+        return min(len(expected), len(actual))
+    return None
+
+
+@dataclass
+class Divergence:
+    """First step where a candidate's outcome differs from the reference."""
+
+    candidate: str
+    seed: int  # Scenario seed (generate_scenario(random.Random(seed), ...))
+    policy: OpsPolicy
+    steps: list[Step]  # Minimized scenario; the last step diverges
+    expected: tuple | None  # Reference outcome: DECISION_FIELDS..., state.cooldown_until_ms
+    actual: tuple | None
+
+    def reproducer(self) -> str:
+        """Python source replaying the minimized scenario (expects a `candidate` variable)."""
+        lines = [
+            "from ops_health_core.differential import Step, replay",
+            "from ops_health_core.model import OpsPolicy",
+            f"policy = {self.policy!r}",
+            "steps = [",
+            *(f"    {step!r}," for step in self.steps),
+            "]",
+            "replay(candidate, policy, steps)  # candidate: the engine under test",
+        ]
+        return "\n".join(lines)
+
+
+@dataclass
+class DifferentialReport:
+    """Differential run outcome with engine timings (reference and candidates)."""
+
+    scenarios: int
+    evaluations: int  # Per engine
+    divergences: dict[str, Divergence] = field(default_factory=dict)  # First per candidate
+    divergent_scenarios: dict[str, int] = field(default_factory=dict)
+    engine_s: dict[str, float] = field(default_factory=dict)  # Total engine time per name
+
+    @property
+    def speedups(self) -> dict[str, float]:
+        """Reference engine time / candidate engine time."""
+        reference = self.engine_s[REFERENCE.name]
+        return {
+            name: reference / seconds if seconds else float("inf")
+            for name, seconds in self.engine_s.items()
+            if name != REFERENCE.name
+        }
+
+
+def replay(
+    candidate: Candidate,
+    policy: OpsPolicy,
+    steps: Sequence[Step],
+    fields: Sequence[str] = DECISION_FIELDS,
+) -> int | None:
+    """
+    Replay a scenario through the reference and a candidate.
+
+    Returns:
+        Index of the first divergent step, or None if the traces match
+    """
+    compiled = compile_policy(policy)
+    expected, _ = _trace(REFERENCE, compiled, steps, fields)
+    actual, _ = _trace(candidate, compiled, steps, fields)
+    return _first_divergence(expected, actual)
+
+
+def minimize(
+    candidate: Candidate,
+    policy: OpsPolicy,
+    steps: Sequence[Step],
+    fields: Sequence[str] = DECISION_FIELDS,
+    max_replays: int = 2000,
+) -> list[Step]:
+    """
+    Shrink a divergent scenario (truncate, then delete chunks while it still diverges).
+
+    Returns:
+        Smallest scenario found whose last step is the first divergence
+    """
+    index = replay(candidate, policy, steps, fields)
+    if index is None:
+        raise ValueError("scenario does not diverge")
+    current = list(steps[: index + 1])
+    replays = 1
+    chunk = max(1, len(current) // 2)
+    while chunk >= 1 and replays < max_replays:
+        shrunk = False
+        start = 0
+        while start < len(current) - 1 and replays < max_replays:
+            trial = current[:start] + current[start + chunk :]
+            if not trial:
+                break
+            replays += 1
+            index = replay(candidate, policy, trial, fields)
+            if index is not None:
+                current = trial[: index + 1]
+                shrunk = True
+            else:
+                start += chunk
+        if not shrunk:
+            chunk //= 2
+    return current
+
+
+def run_differential(
+    candidates: Sequence[Candidate],
+    scenarios: int = 200,
+    steps: int = 200,
+    seed: int = 0,
+    fields: Sequence[str] = DECISION_FIELDS,
+) -> DifferentialReport:
+    """
+    Run random scenarios through the reference and every candidate.
+
+    Scenario i uses seed + i, so any divergence is reproducible from its seed.
+    The first divergence per candidate is minimized (see Divergence.reproducer).
+
+    Args:
+        candidates: Engines under test (names must be unique and not "reference")
+        scenarios: Number of scenarios
+        steps: Steps per scenario
+        seed: Base seed
+        fields: Signal fields compared (besides state.cooldown_until_ms)
+
+    Returns:
+        DifferentialReport with divergences and engine timings
+
+    Raises:
+        ValueError: If candidate names collide
+    """
+    names = [c.name for c in candidates]
+    if len(set(names)) != len(names) or REFERENCE.name in names:
+        raise ValueError(f"candidate names must be unique and not {REFERENCE.name!r}")
+    report = DifferentialReport(scenarios=scenarios, evaluations=0)
+    engine_ns = dict.fromkeys([REFERENCE.name, *names], 0)
+    for i in range(scenarios):
+        policy, scenario = generate_scenario(random.Random(seed + i), steps)
+        compiled = compile_policy(policy)
+        expected, ns = _trace(REFERENCE, compiled, scenario, fields)
+        engine_ns[REFERENCE.name] += ns
+        report.evaluations += sum(1 for s in scenario if s.kind in (STEP_TICK, STEP_FAULT))
+        for candidate in candidates:
+            actual, ns = _trace(candidate, compiled, scenario, fields)
+            engine_ns[candidate.name] += ns
+            if _first_divergence(expected, actual) is None:
+                continue
+            report.divergent_scenarios[candidate.name] = (
+                report.divergent_scenarios.get(candidate.name, 0) + 1
+            )
+            if candidate.name not in report.divergences:
+                minimal = minimize(candidate, policy, scenario, fields)
+                compiled_min = compile_policy(policy)
+                exp, _ = _trace(REFERENCE, compiled_min, minimal, fields)
+                act, _ = _trace(candidate, compiled_min, minimal, fields)
+                report.divergences[candidate.name] = Divergence(
+                    candidate=candidate.name,
+                    seed=seed + i,
+                    policy=policy,
+                    steps=minimal,
+                    expected=exp[-1] if len(exp) == len(minimal) else None,
+                    actual=act[-1] if len(act) == len(minimal) else None,
+                )
+    report.engine_s = {name: ns / 1e9 for name, ns in engine_ns.items()}
+    return report
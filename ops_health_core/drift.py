@@ -0,0 +1,198 @@
+# Decision Ecosystem — ops-health-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Streaming drift detection (Page-Hinkley, upward changes)."""
+
+import math
+from dataclasses import dataclass
+
+REASON_LATENCY_DRIFT = "latency_drift_detected"
+REASON_ERROR_RATE_DRIFT = "error_rate_drift_detected"
+
+_WARMUP = 64  # Observations before update_many() switches to the closed form
+
+
+def _harmonic_gap(a: int, b: int) -> float:
+    """H(a) - H(b) for a >= b >= _WARMUP (asymptotic expansion, error < 1e-13)."""
+
+    def tail(m: int) -> float:
+        inv = 1.0 / m
+        return inv / 2 - inv * inv / 12 + inv**4 / 120
+
+    return math.log(a / b) + tail(a) - tail(b)
+
+
+class PageHinkley:
+    """
+    One-sided Page-Hinkley test for an upward shift in the mean.
+
+    Formula:
+        mean_t = running mean of x
+        m_t    = m_{t-1} + (x_t - mean_t - delta)
+        M_t    = min(M_{t-1}, m_t)
+        drift  = (t >= min_samples) and (m_t - M_t > threshold)
+
+    Constant memory, O(1) per update. Statistics reset after a detection so the
+    detector re-learns the new level. update_many() consumes repeated observations
+    in closed form (bulk counts are never expanded).
+    """
+
+    __slots__ = ("_cum", "_mean", "_min_cum", "_n", "delta", "min_samples", "threshold")
+
+    def __init__(self, delta: float, threshold: float, min_samples: int = 30) -> None:
+        self.delta = delta
+        self.threshold = threshold
+        self.min_samples = min_samples
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset statistics."""
+        self._n = 0
+        self._mean = 0.0
+        self._cum = 0.0
+        self._min_cum = 0.0
+
+    def update(self, x: float) -> bool:
+        """
+        Consume one observation.
+
+        Returns:
+            True if an upward drift is detected (statistics are reset)
+        """
+        self._n += 1
+        self._mean += (x - self._mean) / self._n
+        self._cum += x - self._mean - self.delta
+        self._min_cum = min(self._min_cum, self._cum)
+        if self._n >= self.min_samples and self._cum - self._min_cum > self.threshold:
+            self.reset()
+            return True
+        return False
+
+    def _cum_after(self, x: float, k: int) -> float:
+        # The k-th repeat of x leaves x - mean_k = (x - mean_0) * n0 / (n0 + k)
+        n0 = self._n
+        gap = _harmonic_gap(n0 + k, n0)
+        return self._cum + (x - self._mean) * n0 * gap - k * self.delta
+
+    def _advance(self, x: float, k: int) -> None:
+        n = self._n + k
+        self._cum = self._cum_after(x, k)
+        self._mean = x - (x - self._mean) * self._n / n
+        self._n = n
+        self._min_cum = min(self._min_cum, self._cum)
+
+    def update_many(self, x: float, count: int) -> bool:
+        """
+        Consume count identical observations (count update(x) calls, up to rounding).
+
+        Runs update() for the first max(min_samples, 64) observations after a
+        reset, then jumps in closed form: the increments x - mean_k - delta
+        decrease in k, so m_t rises then falls, the first detection is found by
+        binary search and the remainder is applied in O(1). A negative delta
+        falls back to one update() per observation.
+
+        Returns:
+            True if a drift was detected (statistics are reset at each detection)
+        """
+        detected = False
+        warm = max(self.min_samples, _WARMUP)
+        while count > 0:
+            if self._n < warm or self.delta < 0:
+                detected |= self.update(x)
+                count -= 1
+                continue
+            n0 = self._n
+            d0 = x - self._mean
+
+            def step(j: int, d0: float = d0, n0: int = n0) -> float:
+                return d0 * n0 / (n0 + j) - self.delta
+
+            if step(1) <= 0:
+                # m_t never rises again: no detection, the minimum follows m_t
+                self._advance(x, count)
+                return detected
+            rising = count  # Leading observations that increase m_t (d0 > 0)
+            if self.delta > 0:
+                rising = min(count, max(1, math.ceil(d0 * n0 / self.delta - n0)))
+                while rising > 1 and step(rising) <= 0:
+                    rising -= 1
+                while rising < count and step(rising + 1) > 0:
+                    rising += 1
+            limit = self._min_cum + self.threshold
+            if self._cum_after(x, rising) <= limit:
+                self._advance(x, rising)
+                count -= rising
+                continue
+            low, high = 1, rising  # First k with m_k above the limit
+            while low < high:
+                mid = (low + high) // 2
+                if self._cum_after(x, mid) > limit:
+                    high = mid
+                else:
+                    low = mid + 1
+            self.reset()
+            detected = True
+            count -= low
+        return detected
+
+
+@dataclass
+class DriftPolicy:
+    """Drift detector configuration."""
+
+    latency_delta_ms: float = 10.0  # Tolerated mean increase per sample (ms)
+    latency_threshold_ms: float = 5_000.0  # Cumulative excess that triggers drift (ms)
+    error_delta: float = 0.005  # Tolerated error-rate increase per outcome
+    error_threshold: float = 5.0  # Cumulative excess errors that trigger drift
+    min_samples: int = 30
+    hold_ms: int = 60_000  # Drift flag stays raised this long after a detection
+
+
+class DriftMonitor:
+    """
+    Drift flags for the latency and error-rate streams.
+
+    The error-rate stream is the outcome sequence fed by OpsState.record_error (1)
+    and OpsState.record_latency (0, a completed request), so error-rate drift
+    needs latency samples as the success denominator.
+    """
+
+    __slots__ = ("_error_at_ms", "_latency_at_ms", "error_rate", "latency", "policy")
+
+    def __init__(self, policy: DriftPolicy | None = None) -> None:
+        self.policy = policy if policy is not None else DriftPolicy()
+        self.latency = PageHinkley(
+            self.policy.latency_delta_ms, self.policy.latency_threshold_ms, self.policy.min_samples
+        )
+        self.error_rate = PageHinkley(
+            self.policy.error_delta, self.policy.error_threshold, self.policy.min_samples
+        )
+        self._latency_at_ms: int | None = None
+        self._error_at_ms: int | None = None
+
+    def on_latency(self, latency_ms: float, ts_ms: int) -> None:
+        """Consume a latency sample (also a successful outcome)."""
+        if self.latency.update(latency_ms):
+            self._latency_at_ms = ts_ms
+        if self.error_rate.update(0.0):
+            self._error_at_ms = ts_ms
+
+    def on_error(self, ts_ms: int, count: int = 1) -> None:
+        """Consume count error outcomes (O(1) in count, see PageHinkley.update_many)."""
+        if count > 0 and self.error_rate.update_many(1.0, count):
+            self._error_at_ms = ts_ms
+
+    def reasons(self, now_ms: int) -> list[str]:
+        """
+        Active drift reasons at now_ms.
+
+        Returns:
+            Subset of [REASON_LATENCY_DRIFT, REASON_ERROR_RATE_DRIFT]
+        """
+        hold_ms = self.policy.hold_ms
+        reasons = []
+        if self._latency_at_ms is not None and now_ms - self._latency_at_ms < hold_ms:
+            reasons.append(REASON_LATENCY_DRIFT)
+        if self._error_at_ms is not None and now_ms - self._error_at_ms < hold_ms:
+            reasons.append(REASON_ERROR_RATE_DRIFT)
+        return reasons
@@ -0,0 +1,116 @@
+# Decision Ecosystem — ops-health-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Change-only signal emission (epsilon, hysteresis and debounce)."""
+
+from dataclasses import dataclass
+
+from ops_health_core.model import HealthState, OpsPolicy, OpsSignal
+from ops_health_core.policy import CompiledPolicy, as_compiled
+
+_RANK = {HealthState.RED: 0, HealthState.YELLOW: 1, HealthState.GREEN: 2}
+
+
+@dataclass
+class EmitPolicy:
+    """Change-only emission configuration."""
+
+    score_epsilon: float = 0.01  # Publish when |score - published score| > epsilon
+    debounce_ms: int = 0  # A new state must persist this long before it is published
+    hysteresis: float = 0.0  # Score margin past the threshold to publish a state change
+
+
+class SignalEmitter:
+    """
+    Publish a signal only when it differs from the last published one.
+
+    A signal is published when deny_actions, cooldown_until_ms or the reasons
+    change (always immediately: the kill switch is never delayed), when the
+    state changes (subject to debounce and hysteresis), or when the score moves
+    by more than score_epsilon while the state is unchanged. Score-only updates
+    are held back while a state change is pending, so a debounced state never
+    leaks through a score update.
+
+    Hysteresis needs the ops policy thresholds: a state change is published
+    only once the score is at least `hysteresis` past the threshold between the
+    published and the new state.
+    """
+
+    def __init__(
+        self,
+        policy: EmitPolicy | None = None,
+        ops_policy: OpsPolicy | CompiledPolicy | None = None,
+    ) -> None:
+        self.policy = policy if policy is not None else EmitPolicy()
+        if self.policy.score_epsilon < 0 or self.policy.debounce_ms < 0:
+            raise ValueError("score_epsilon and debounce_ms must be >= 0")
+        if self.policy.hysteresis < 0:
+            raise ValueError("hysteresis must be >= 0")
+        if self.policy.hysteresis and ops_policy is None:
+            raise ValueError("hysteresis requires ops_policy (state thresholds)")
+        self._thresholds = None
+        if ops_policy is not None:
+            compiled = as_compiled(ops_policy)
+            self._thresholds = (compiled.threshold_red, compiled.threshold_yellow)
+        self.last: OpsSignal | None = None  # Last published signal
+        self.published = 0
+        self.suppressed = 0
+        self._pending_state: HealthState | None = None
+        self._pending_since_ms = 0
+
+    def _past_hysteresis(self, score: float, old: HealthState, new: HealthState) -> bool:
+        if not self.policy.hysteresis or self._thresholds is None:
+            return True
+        red, yellow = self._thresholds
+        if _RANK[new] < _RANK[old]:  # Degrading: threshold just below the published state
+            threshold = yellow if old == HealthState.GREEN else red
+            return score <= threshold - self.policy.hysteresis
+        threshold = red if old == HealthState.RED else yellow  # Recovering
+        return score >= threshold + self.policy.hysteresis
+
+    def _state_settled(self, signal: OpsSignal, published: HealthState, now_ms: int) -> bool:
+        """Whether a state change is ready to publish (debounce and hysteresis)."""
+        if self._pending_state != signal.state:
+            self._pending_state = signal.state
+            self._pending_since_ms = now_ms
+        if now_ms - self._pending_since_ms < self.policy.debounce_ms:
+            return False
+        return self._past_hysteresis(signal.score, published, signal.state)
+
+    def offer(self, signal: OpsSignal, now_ms: int) -> OpsSignal | None:
+        """
+        Offer a freshly evaluated signal.
+
+        Args:
+            signal: Signal from update_kill_switch (or any evaluator)
+            now_ms: Evaluation time (ms)
+
+        Returns:
+            The signal if it should be published, else None
+        """
+        last = self.last
+        if (
+            last is None
+            or signal.deny_actions != last.deny_actions
+            or signal.cooldown_until_ms != last.cooldown_until_ms
+            or signal.reasons != last.reasons
+        ):
+            publish = True
+        elif signal.state != last.state:
+            publish = self._state_settled(signal, last.state, now_ms)
+        else:
+            self._pending_state = None
+            publish = abs(signal.score - last.score) > self.policy.score_epsilon
+
+        if not publish:
+            self.suppressed += 1
+            return None
+        self.last = signal
+        self.published += 1
+        self._pending_state = None
+        return signal
+
+    def reset(self) -> None:
+        """Forget the published signal (the next offer is always published)."""
+        self.last = None
+        self._pending_state = None
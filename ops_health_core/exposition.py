@@ -0,0 +1,272 @@
+# Decision Ecosystem — ops-health-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Prometheus text exposition of ops signals (stdlib HTTP endpoint, cached rendering)."""
+
+import logging
+import math
+import threading
+import time
+from collections.abc import Callable, Mapping
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from ops_health_core.cache import SignalCache
+from ops_health_core.model import STATE_CODES, OpsPolicy, OpsSignal, OpsState
+from ops_health_core.policy import CompiledPolicy, as_compiled
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# (name, help); every family is a gauge. Order fixes the rendered layout.
+METRIC_FAMILIES: tuple[tuple[str, str], ...] = (
+    ("ops_score", "Health score [0, 1]"),
+    ("ops_state", "Health state code (0 green, 1 yellow, 2 red)"),
+    ("ops_deny_actions", "1 while actions are denied (red or cooldown)"),
+    ("ops_cooldown_until_ms", "Kill-switch cooldown end (ms), present while set"),
+    ("ops_reason", "1 per active reason"),
+    ("ops_recommended_rate_per_s", "Rate budget recommendation"),
+    ("ops_latency_ms", "Latency percentiles from the latency store"),
+    ("ops_latency_sample_rate", "Retained/seen latency samples"),
+    ("ops_latency_rank_error", "95% bound on percentile rank error (fraction)"),
+)
+_HEADERS = tuple(
+    f"# HELP {name} {text}\n# TYPE {name} gauge\n".encode() for name, text in METRIC_FAMILIES
+)
+
+
+def _value(value: float) -> str:
+    if isinstance(value, int):
+        return str(value)
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(value)
+
+
+def _escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def render_signal(signal: OpsSignal, labels: str = "") -> tuple[bytes, ...]:
+    """
+    Sample lines of one signal, one bytes chunk per METRIC_FAMILIES entry.
+
+    Args:
+        signal: Ops signal
+        labels: Pre-escaped label pairs without braces (e.g. 'entity="a"'), or ""
+
+    Returns:
+        Tuple aligned with METRIC_FAMILIES (b"" where the family has no sample)
+    """
+
+    def line(name: str, value: float, extra: str = "") -> str:
+        pairs = ",".join(p for p in (labels, extra) if p)
+        return f"{name}{{{pairs}}} {_value(value)}\n" if pairs else f"{name} {_value(value)}\n"
+
+    percentiles = signal.latency_percentiles or {}
+    chunks = (
+        line("ops_score", signal.score),
+        line("ops_state", STATE_CODES[signal.state]),
+        line("ops_deny_actions", int(signal.deny_actions)),
+        ""
+        if signal.cooldown_until_ms is None
+        else line("ops_cooldown_until_ms", signal.cooldown_until_ms),
+        "".join(line("ops_reason", 1, f'reason="{_escape(r)}"') for r in signal.reasons),
+        ""
+        if signal.recommended_rate_per_s is None
+        else line("ops_recommended_rate_per_s", signal.recommended_rate_per_s),
+        "".join(
+            line("ops_latency_ms", v, f'quantile="{_escape(q)}"') for q, v in percentiles.items()
+        ),
+        ""
+        if signal.latency_sample_rate is None
+        else line("ops_latency_sample_rate", signal.latency_sample_rate),
+        ""
+        if signal.latency_rank_error is None
+        else line("ops_latency_rank_error", signal.latency_rank_error),
+    )
+    return tuple(chunk.encode() for chunk in chunks)
+
+
+class MetricsExposition:
+    """
+    Cached Prometheus text rendering for one or many entities.
+
+    Signals arrive with update() (push: from an existing evaluation loop) or are
+    pulled from tracked states through a SignalCache per entity at most once per
+    quantum. An entity's lines are re-rendered only when its signal changes;
+    render() returns the cached body and rebuilds it (a join, no evaluations)
+    only after a change. Thread-safe.
+
+    Push is the cheap mode: a scrape costs a join at most. Pull costs one
+    evaluation per tracked entity whose state version or quantum changed, i.e.
+    O(entities) per scrape once scrapes are further apart than quantum_ms. Those
+    evaluations run outside the lock that guards the body, so update() and
+    concurrent scrapes are never blocked by them (a scrape arriving while another
+    one refreshes serves the cached body).
+    """
+
+    def __init__(self, label: str = "entity") -> None:
+        self.label = label
+        self.renders = 0  # Body rebuilds
+        self._lock = threading.Lock()  # Signals, lines, body and tracked sources
+        self._refresh_lock = threading.Lock()  # One pull refresh at a time (owns _caches)
+        self._signals: dict[str | None, OpsSignal] = {}
+        self._lines: dict[str | None, tuple[bytes, ...]] = {}
+        self._body: bytes | None = b""
+        self._tracked: list[tuple[OpsState | Mapping[str, OpsState], CompiledPolicy, int]] = []
+        self._caches: dict[tuple[int, str | None], SignalCache] = {}
+
+    def _labels(self, entity: str | None) -> str:
+        return "" if entity is None else f'{self.label}="{_escape(entity)}"'
+
+    def _update_locked(self, entity: str | None, signal: OpsSignal) -> bool:
+        old = self._signals.get(entity)
+        if old is signal or old == signal:
+            return False
+        self._signals[entity] = signal
+        self._lines[entity] = render_signal(signal, self._labels(entity))
+        self._body = None
+        return True
+
+    def update(self, entity: str | None, signal: OpsSignal) -> bool:
+        """
+        Publish an entity's latest signal (entity None = unlabeled single state).
+
+        Returns:
+            True if the signal changed (the cached body is invalidated)
+        """
+        with self._lock:
+            return self._update_locked(entity, signal)
+
+    def remove(self, entity: str | None) -> None:
+        """Stop exposing an entity."""
+        with self._lock:
+            if self._lines.pop(entity, None) is not None:
+                self._body = None
+            self._signals.pop(entity, None)
+
+    def track(
+        self,
+        source: OpsState | Mapping[str, OpsState],
+        policy: OpsPolicy | CompiledPolicy,
+        quantum_ms: int = 1000,
+    ) -> None:
+        """
+        Evaluate a state (unlabeled) or a registry of states on render(now_ms).
+
+        Each entity is evaluated through a SignalCache, so repeated scrapes within
+        quantum_ms of an unchanged state cost no evaluation; otherwise a scrape
+        evaluates every changed or expired entity (prefer update() for large
+        registries). Entities added to or removed from a tracked mapping are picked
+        up on the next render.
+
+        Raises:
+            ValueError: If quantum_ms <= 0 or the policy is invalid
+        """
+        if quantum_ms <= 0:
+            raise ValueError("quantum_ms must be > 0")
+        with self._lock:
+            self._tracked.append((source, as_compiled(policy), quantum_ms))
+
+    def _refresh(self, now_ms: int) -> None:
+        """Evaluate tracked sources (caller holds _refresh_lock, not _lock)."""
+        with self._lock:
+            tracked = list(self._tracked)
+        caches: dict[tuple[int, str | None], SignalCache] = {}
+        signals: list[tuple[str | None, OpsSignal]] = []
+        for index, (source, policy, quantum_ms) in enumerate(tracked):
+            if isinstance(source, OpsState):
+                entries: list[tuple[str | None, OpsState]] = [(None, source)]
+            else:
+                entries = list(source.items())
+            for entity, state in entries:
+                cache = self._caches.get((index, entity))
+                if cache is None or cache.state is not state:
+                    cache = SignalCache(state, policy, quantum_ms)
+                caches[index, entity] = cache
+                signals.append((entity, cache.get(now_ms)))
+        with self._lock:
+            for entity, signal in signals:
+                self._update_locked(entity, signal)
+            for _, entity in self._caches.keys() - caches.keys():
+                if self._lines.pop(entity, None) is not None:
+                    self._body = None
+                self._signals.pop(entity, None)
+        self._caches = caches
+
+    def render(self, now_ms: int | None = None) -> bytes:
+        """
+        Prometheus text body.
+
+        Args:
+            now_ms: Evaluation time for tracked states (default: wall clock)
+
+        Returns:
+            Cached body (rebuilt only after a signal change)
+        """
+        if self._tracked and self._refresh_lock.acquire(blocking=False):
+            try:
+                self._refresh(int(time.time() * 1000) if now_ms is None else now_ms)
+            finally:
+                self._refresh_lock.release()
+        with self._lock:
+            if self._body is None:
+                parts = []
+                for i, header in enumerate(_HEADERS):
+                    samples = b"".join(lines[i] for lines in self._lines.values())
+                    if samples:
+                        parts.append(header)
+                        parts.append(samples)
+                self._body = b"".join(parts)
+                self.renders += 1
+            return self._body
+
+
+def serve_metrics(
+    exposition: MetricsExposition,
+    host: str = "127.0.0.1",
+    port: int = 9464,
+    path: str = "/metrics",
+    clock: Callable[[], int] | None = None,
+) -> ThreadingHTTPServer:
+    """
+    Serve an exposition over HTTP in a daemon thread (stdlib only).
+
+    Args:
+        exposition: Metrics to serve
+        host: Bind address (default: loopback only)
+        port: Bind port (0 = any free port; see server.server_address)
+        path: Scrape path
+        clock: now_ms source for tracked states (default: wall clock)
+
+    Returns:
+        Running server; call shutdown() and server_close() to stop it
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if self.path.split("?", 1)[0] != path:
+                self.send_error(404)
+                return
+            try:
+                body = exposition.render(clock() if clock is not None else None)
+            except Exception as e:
+                logger.warning("Metrics render failed on exception: %s", type(e).__name__)
+                self.send_error(500)
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: object) -> None:
+            pass  # Scrapes are frequent; keep stderr quiet
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="ops-metrics", daemon=True).start()
+    return server
@@ -0,0 +1,140 @@
+# Decision Ecosystem — ops-health-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Saturation gauges (windowed max and time-weighted average)."""
+
+import sys
+from collections import deque
+
+# Conventional gauge names (any name may be used with OpsPolicy.saturation_limits)
+GAUGE_QUEUE_DEPTH = "queue_depth"
+GAUGE_INFLIGHT = "inflight"
+GAUGE_POOL_UTILIZATION = "pool_utilization"
+
+
+class WindowedGauge:
+    """
+    Gauge samples with windowed max and time-weighted average.
+
+    A sample holds its value until the next sample. The value in effect at the
+    window start (carry-in) counts towards both statistics. Max uses a monotonic
+    deque; the average keeps a running area over sample segments. record() and
+    prune() are amortized O(1). Samples older than the latest one are ignored.
+    shrink() bounds the segment count between evaluations.
+    """
+
+    __slots__ = ("_area", "_peaks", "_segments")
+
+    def __init__(self) -> None:
+        self._segments: deque[tuple[int, float]] = deque()  # (ts_ms, value), ascending ts
+        self._peaks: deque[tuple[int, float]] = deque()  # (ts_ms, value), decreasing value
+        self._area = 0.0  # Sum of value * duration over completed segments
+
+    def record(self, value: float, ts_ms: int) -> None:
+        """Record a gauge sample."""
+        segments = self._segments
+        if segments:
+            last_ts, last_value = segments[-1]
+            if ts_ms < last_ts:
+                return
+            self._area += last_value * (ts_ms - last_ts)
+        segments.append((ts_ms, value))
+        peaks = self._peaks
+        while peaks and peaks[-1][1] <= value:
+            peaks.pop()
+        peaks.append((ts_ms, value))
+
+    def prune(self, cutoff_ms: int) -> None:
+        """Drop samples superseded before cutoff_ms (keeps the carry-in sample)."""
+        segments = self._segments
+        while len(segments) >= 2 and segments[1][0] <= cutoff_ms:
+            ts0, value0 = segments.popleft()
+            self._area -= value0 * (segments[0][0] - ts0)
+        if not segments:
+            return
+        start = segments[0][0]
+        peaks = self._peaks
+        while peaks and peaks[0][0] < start:
+            peaks.popleft()
+
+    def shrink(self, max_segments: int) -> None:
+        """
+        Merge older segments pairwise until at most max(2, max_segments // 2) remain.
+
+        No-op while len(self) <= max_segments. A merged segment starts at the older
+        sample, ends where the newer one ended and holds the larger value, so the
+        windowed max and average can only be over-estimated (fail-closed) and merged
+        values expire no earlier. The newest sample is kept as is. O(n) per call,
+        amortized O(1) per record().
+        """
+        segments = self._segments
+        if len(segments) <= max_segments:
+            return
+        while len(segments) > max(2, max_segments // 2):
+            last = segments.pop()
+            older = list(segments)
+            segments.clear()
+            for i in range(0, len(older), 2):
+                pair = older[i : i + 2]
+                segments.append((pair[0][0], max(value for _, value in pair)))
+            segments.append(last)
+        area = 0.0
+        peaks = self._peaks
+        peaks.clear()
+        prev_ts, prev_value = segments[0]
+        for ts_ms, value in segments:
+            area += prev_value * (ts_ms - prev_ts)
+            prev_ts, prev_value = ts_ms, value
+            while peaks and peaks[-1][1] <= value:
+                peaks.pop()
+            peaks.append((ts_ms, value))
+        self._area = area
+
+    def max_value(self) -> float | None:
+        """Windowed max (after prune), or None if no samples."""
+        return self._peaks[0][1] if self._peaks else None
+
+    def average(self, now_ms: int, cutoff_ms: int) -> float | None:
+        """
+        Time-weighted average over [cutoff_ms, now_ms] (after prune).
+
+        Returns:
+            Average value, or None if no samples
+        """
+        segments = self._segments
+        if not segments:
+            return None
+        ts0, value0 = segments[0]
+        last_ts, last_value = segments[-1]
+        start = max(ts0, cutoff_ms)
+        if now_ms <= start:
+            return last_value
+        area = self._area - value0 * (start - ts0) + last_value * max(0, now_ms - last_ts)
+        return area / (now_ms - start)
+
+    def stats(self, now_ms: int, window_ms: int) -> tuple[float, float] | None:
+        """
+        Prune to the window and return (time-weighted average, max).
+
+        Returns:
+            Tuple of (average, max), or None if no samples
+        """
+        cutoff_ms = now_ms - window_ms
+        self.prune(cutoff_ms)
+        peak = self.max_value()
+        if peak is None:
+            return None
+        return self.average(now_ms, cutoff_ms), peak
+
+    def memory_usage(self) -> int:
+        """Approximate memory footprint (bytes)."""
+        entries = len(self._segments) + len(self._peaks)
+        return (
+            sys.getsizeof(self)
+            + sys.getsizeof(self._segments)
+            + sys.getsizeof(self._peaks)
+            + entries * (sys.getsizeof((0, 0)) + 2 * sys.getsizeof(1 << 40))
+        )
+
+    def __len__(self) -> int:
+        return len(self._segments)
@@ -0,0 +1,171 @@
+# Decision Ecosystem — ops-health-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Fixed-capacity columnar history of emitted signals."""
+
+import sys
+from array import array
+from typing import Any
+
+from ops_health_core.model import STATE_CODES, OpsSignal, reasons_to_flags
+
+# Column name -> array typecode (NumPy/Arrow types follow the typecode)
+HISTORY_COLUMNS: dict[str, str] = {
+    "ts_ms": "q",  # int64
+    "score": "d",  # float64
+    "state": "b",  # int8, STATE_CODES
+    "deny": "b",  # int8, 0/1
+    "cooldown_until_ms": "q",  # int64, -1 when no cooldown
+    "reason_flags": "I",  # uint32, see reasons_to_flags
+}
+
+NO_COOLDOWN = -1
+
+
+class SignalHistory:
+    """
+    Ring buffer of the last `capacity` signals, stored column-wise.
+
+    Columns are preallocated typed arrays: append() is O(1) and allocation-free,
+    memory is fixed at construction (about 30 bytes per row). Until the buffer
+    wraps, exports are zero-copy views over the column buffers; once it wraps,
+    ordered exports cost one copy per column (use ordered=False plus start() to
+    avoid it).
+
+    NumPy and PyArrow are optional and imported only by the export methods.
+    """
+
+    __slots__ = ("_columns", "_next", "_size", "capacity")
+
+    def __init__(self, capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be > 0")
+        self.capacity = capacity
+        self._columns: dict[str, array] = {
+            name: array(typecode, bytes(array(typecode).itemsize * capacity))
+            for name, typecode in HISTORY_COLUMNS.items()
+        }
+        self._next = 0  # Slot written by the next append
+        self._size = 0
+
+    def append(self, signal: OpsSignal, ts_ms: int) -> None:
+        """Record a signal evaluated at ts_ms (overwrites the oldest row when full)."""
+        i = self._next
+        columns = self._columns
+        columns["ts_ms"][i] = ts_ms
+        columns["score"][i] = signal.score
+        columns["state"][i] = STATE_CODES[signal.state]
+        columns["deny"][i] = 1 if signal.deny_actions else 0
+        cooldown = signal.cooldown_until_ms
+        columns["cooldown_until_ms"][i] = NO_COOLDOWN if cooldown is None else cooldown
+        columns["reason_flags"][i] = reasons_to_flags(signal.reasons) if signal.reasons else 0
+        i += 1
+        self._next = 0 if i == self.capacity else i
+        if self._size < self.capacity:
+            self._size += 1
+
+    def clear(self) -> None:
+        """Forget all rows (buffers are kept)."""
+        self._next = 0
+        self._size = 0
+
+    def start(self) -> int:
+        """Slot of the oldest row in the raw column buffers."""
+        return self._next if self._size == self.capacity else 0
+
+    def raw_columns(self) -> dict[str, memoryview]:
+        """
+        Zero-copy views of the raw column buffers (first len(self) slots are valid).
+
+        Rows are in slot order; the oldest row is at start(). Views are live:
+        later appends overwrite the rows they show.
+        """
+        return {name: memoryview(column)[: self._size] for name, column in self._columns.items()}
+
+    def column(self, name: str) -> list[Any]:
+        """One column as a list, oldest row first."""
+        column = self._columns[name]
+        start = self.start()
+        if start == 0:
+            return column[: self._size].tolist()
+        return column[start:].tolist() + column[:start].tolist()
+
+    def to_numpy(self, ordered: bool = True) -> dict[str, Any]:
+        """
+        Columns as NumPy arrays.
+
+        Args:
+            ordered: Oldest row first. Zero-copy until the buffer wraps, then one
+                copy per column. With ordered=False views are always zero-copy and
+                in slot order (oldest row at start()).
+
+        Returns:
+            Dict of column name -> numpy.ndarray (read-write views share memory)
+
+        Raises:
+            ImportError: If numpy is not installed
+        """
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise ImportError(
+                "SignalHistory.to_numpy() requires numpy (pip install ops-health-core[numpy])"
+            ) from e
+        start = self.start()
+        arrays = {}
+        for name, view in self.raw_columns().items():
+            values = np.frombuffer(view, dtype=view.format)
+            if ordered and start:
+                values = np.concatenate((values[start:], values[:start]))
+            arrays[name] = values
+        return arrays
+
+    def to_arrow(self) -> Any:
+        """
+        Columns as a pyarrow.RecordBatch, oldest row first.
+
+        Zero-copy until the buffer wraps (the batch wraps the column buffers),
+        then one copy per column.
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        try:
+            import pyarrow as pa
+        except ImportError as e:
+            raise ImportError(
+                "SignalHistory.to_arrow() requires pyarrow (pip install ops-health-core[arrow])"
+            ) from e
+        types = {"q": pa.int64(), "d": pa.float64(), "b": pa.int8(), "I": pa.uint32()}
+        start = self.start()
+        arrays = []
+        for name, view in self.raw_columns().items():
+            arrow_type = types[HISTORY_COLUMNS[name]]
+            values = pa.Array.from_buffers(arrow_type, len(view), [None, pa.py_buffer(view)])
+            if start:
+                values = pa.concat_arrays([values.slice(start), values.slice(0, start)])
+            arrays.append(values)
+        return pa.RecordBatch.from_arrays(arrays, names=list(HISTORY_COLUMNS))
+
+    def write_arrow_ipc(self, sink: Any) -> None:
+        """
+        Write the history as an Arrow IPC stream (one record batch).
+
+        Args:
+            sink: Path, file object or pyarrow NativeFile
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        batch = self.to_arrow()
+        import pyarrow as pa
+
+        with pa.ipc.new_stream(sink, batch.schema) as writer:
+            writer.write_batch(batch)
+
+    def memory_usage(self) -> int:
+        """Approximate memory footprint (bytes); fixed after construction."""
+        return sys.getsizeof(self) + sum(sys.getsizeof(c) for c in self._columns.values())
+
+    def __len__(self) -> int:
+        return self._size
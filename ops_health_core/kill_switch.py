@@ -4,103 +4,140 @@
 """Kill switch logic."""
 
 import logging
-
-from ops_health_core.model import HealthState, OpsPolicy, OpsSignal, OpsState
+from collections.abc import Callable
+from typing import Protocol
+
+from ops_health_core.latency import SampledLatencyStore, latency_summary
+from ops_health_core.model import (
+    REASON_COOLDOWN_ACTIVE,
+    REASON_FAIL_CLOSED,
+    REASON_HEALTH_RED,
+    HealthState,
+    OpsPolicy,
+    OpsSignal,
+    OpsState,
+)
+from ops_health_core.policy import CompiledPolicy, as_compiled
 from ops_health_core.scorer import compute_health_score
 from decision_schema.types import Action
 
 logger = logging.getLogger(__name__)
 
+# Evaluator with update_kill_switch's signature (pluggable engine of the harnesses)
+Engine = Callable[[OpsState, CompiledPolicy, int], OpsSignal]
 
-def update_kill_switch(
-    state: OpsState,
-    policy: OpsPolicy,
+
+class CooldownHolder(Protocol):
+    """Anything carrying kill-switch cooldown state (OpsState, RollupNode, ...)."""
+
+    cooldown_until_ms: int | None
+
+
+def fail_closed_signal() -> OpsSignal:
+    """Signal returned when evaluation raises (deny_actions=True, HOLD)."""
+    return OpsSignal(
+        score=0.0,
+        state=HealthState.RED,
+        deny_actions=True,
+        cooldown_until_ms=None,
+        recommended_action=Action.HOLD,
+        reasons=[REASON_FAIL_CLOSED],
+    )
+
+
+def apply_kill_switch(
+    holder: CooldownHolder,
+    policy: CompiledPolicy,
+    score: float,
+    health_state: HealthState,
     now_ms: int,
 ) -> OpsSignal:
     """
-    Update kill switch state and produce signal.
+    Apply cooldown logic to a computed score and build the signal.
 
-    If state == RED => set cooldown_until = now + cooldown_ms
-    During cooldown => deny_actions = True, recommended_action = HOLD
-    On any exception: fail-closed (deny_actions=True, recommended_action=HOLD).
+    If state == RED and not in cooldown => holder.cooldown_until_ms = now + cooldown_ms
+    During cooldown or RED => deny_actions = True, recommended_action = HOLD
 
     Args:
-        state: Current ops state
-        policy: Ops policy
+        holder: Object carrying cooldown_until_ms (mutated)
+        policy: Compiled ops policy
+        score: Health score
+        health_state: Health state
         now_ms: Current time (ms)
 
     Returns:
         OpsSignal with kill switch recommendations
     """
-    # Prune timestamps in-place to avoid unbounded growth (F2 fix)
-    from ops_health_core.windows import prune_timestamps_inplace
-
-    prune_timestamps_inplace(state.error_timestamps, now_ms, policy.window_ms)
-    prune_timestamps_inplace(state.rate_limit_timestamps, now_ms, policy.window_ms)
-    prune_timestamps_inplace(state.reconnect_timestamps, now_ms, policy.window_ms)
-
-    # Prune latency_samples and latency_timestamps together (P1 fix)
-    # Keep only samples with timestamps within window
-    cutoff_ms = now_ms - policy.window_ms
-    if state.latency_samples and state.latency_timestamps:
-        # Ensure same length (take minimum)
-        min_len = min(len(state.latency_samples), len(state.latency_timestamps))
-        pruned_samples = []
-        pruned_timestamps = []
-        for i in range(min_len):
-            ts = state.latency_timestamps[i]
-            if ts >= cutoff_ms:
-                pruned_samples.append(state.latency_samples[i])
-                pruned_timestamps.append(ts)
-        state.latency_samples[:] = pruned_samples
-        state.latency_timestamps[:] = pruned_timestamps
-    elif state.latency_timestamps:
-        # Only timestamps exist, prune them
-        prune_timestamps_inplace(state.latency_timestamps, now_ms, policy.window_ms)
-    elif state.latency_samples:
-        # Only samples exist (legacy), clear them
-        state.latency_samples.clear()
-
-    try:
-        score, health_state = compute_health_score(state, policy, now_ms)
-    except Exception as e:
-        logger.warning("Kill switch fail-closed on exception: %s", type(e).__name__)
-        return OpsSignal(
-            score=0.0,
-            state=HealthState.RED,
-            deny_actions=True,
-            cooldown_until_ms=None,
-            recommended_action=Action.HOLD,
-            reasons=["fail_closed_exception"],
-        )
-
     # Check if already in cooldown
-    in_cooldown = state.cooldown_until_ms is not None and now_ms < state.cooldown_until_ms
+    in_cooldown = holder.cooldown_until_ms is not None and now_ms < holder.cooldown_until_ms
 
     # If RED state, activate kill switch
     if health_state == HealthState.RED and not in_cooldown:
-        state.cooldown_until_ms = now_ms + policy.cooldown_ms
+        holder.cooldown_until_ms = now_ms + policy.cooldown_ms
 
     # Update cooldown status
-    if state.cooldown_until_ms is not None and now_ms >= state.cooldown_until_ms:
+    if holder.cooldown_until_ms is not None and now_ms >= holder.cooldown_until_ms:
         # Cooldown expired
-        state.cooldown_until_ms = None
+        holder.cooldown_until_ms = None
         in_cooldown = False
 
     # Build reasons
     reasons = []
     if health_state == HealthState.RED:
-        reasons.append("health_score_below_red_threshold")
+        reasons.append(REASON_HEALTH_RED)
     if in_cooldown:
-        reasons.append("kill_switch_cooldown_active")
+        reasons.append(REASON_COOLDOWN_ACTIVE)
 
+    deny = in_cooldown or health_state == HealthState.RED
     return OpsSignal(
         score=score,
         state=health_state,
-        deny_actions=in_cooldown or health_state == HealthState.RED,
-        cooldown_until_ms=state.cooldown_until_ms,
-        recommended_action=Action.HOLD
-        if (in_cooldown or health_state == HealthState.RED)
-        else Action.ACT,
+        deny_actions=deny,
+        cooldown_until_ms=holder.cooldown_until_ms,
+        recommended_action=Action.HOLD if deny else Action.ACT,
         reasons=reasons,
     )
+
+
+def update_kill_switch(
+    state: OpsState,
+    policy: OpsPolicy | CompiledPolicy,
+    now_ms: int,
+) -> OpsSignal:
+    """
+    Update kill switch state and produce signal.
+
+    If state == RED => set cooldown_until = now + cooldown_ms
+    During cooldown => deny_actions = True, recommended_action = HOLD
+    On any exception: fail-closed (deny_actions=True, recommended_action=HOLD).
+
+    Args:
+        state: Current ops state
+        policy: Ops policy (raw or compiled; compile once for hot paths)
+        now_ms: Current time (ms)
+
+    Returns:
+        OpsSignal with kill switch recommendations
+    """
+    try:
+        compiled = as_compiled(policy)
+        # Fused pass: prunes windowed state in place (F2/P1 fixes) while counting
+        score, health_state = compute_health_score(state, compiled, now_ms, prune=True)
+        signal = apply_kill_switch(state, compiled, score, health_state, now_ms)
+        if state.drift is not None:
+            signal.reasons.extend(state.drift.reasons(now_ms))
+
+        # Rate budget recommendation (advisory; published alongside the decision)
+        if state.rate_budget is not None:
+            signal.recommended_rate_per_s = state.rate_budget.recommended_rate(now_ms)
+
+        if state.latency_store is not None:
+            signal.latency_percentiles = latency_summary(state.latency_store)
+            if isinstance(state.latency_store, SampledLatencyStore):
+                signal.latency_sample_rate = state.latency_store.sampling_rate()
+                signal.latency_rank_error = state.latency_store.rank_error()
+    except Exception as e:
+        logger.warning("Kill switch fail-closed on exception: %s", type(e).__name__)
+        return fail_closed_signal()
+
+    return signal
@@ -0,0 +1,529 @@
+# Decision Ecosystem — ops-health-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Windowed latency stores (log-linear histogram, sampled reservoir, exact order statistics)."""
+
+import heapq
+import math
+import random
+import sys
+from collections.abc import Sequence
+from typing import Protocol
+
+# Percentiles published in OpsSignal.latency_percentiles (key -> quantile)
+SUMMARY_QUANTILES: dict[str, float] = {"p50": 0.50, "p95": 0.95, "p99": 0.99}
+
+
+class LatencyStore(Protocol):
+    """Windowed latency sample store usable as OpsState.latency_store."""
+
+    def record(self, latency_ms: float, ts_ms: int) -> None:
+        """Record one latency sample."""
+        ...
+
+    def prune(self, cutoff_ms: int) -> None:
+        """Drop samples with ts < cutoff_ms."""
+        ...
+
+    def quantiles(self, qs: Sequence[float]) -> list[float] | None:
+        """Quantiles (rank min(int(q*n), n-1), ascending order) or None if empty."""
+        ...
+
+    def quantile(self, q: float) -> float | None:
+        """Single quantile or None if empty."""
+        ...
+
+    def max_value(self) -> float | None:
+        """Largest retained sample or None if empty."""
+        ...
+
+    def __len__(self) -> int: ...
+
+
+def latency_summary(store: LatencyStore) -> dict[str, float] | None:
+    """
+    Summary percentiles (p50/p95/p99/max) of a latency store.
+
+    Values are floats even for integer samples (the wire format carries them as f64).
+
+    Returns:
+        Dict keyed by SUMMARY_QUANTILES names plus "max", or None if the store is empty
+    """
+    values = store.quantiles(list(SUMMARY_QUANTILES.values()))
+    if values is None:
+        return None
+    summary = {name: float(value) for name, value in zip(SUMMARY_QUANTILES, values, strict=True)}
+    summary["max"] = float(store.max_value())
+    return summary
+
+
+class _Slice:
+    """Counts of one time slice (sparse: bucket index -> count)."""
+
+    __slots__ = ("counts", "max", "n")
+
+    def __init__(self) -> None:
+        self.counts: dict[int, int] = {}
+        self.n = 0
+        self.max = 0
+
+
+class LatencyHistogram:
+    """
+    HDR-style log-linear latency histogram over a sliding window.
+
+    Values below 2**precision_bits are exact; above, each power-of-two range is
+    split into 2**(precision_bits-1) linear buckets (relative error < 2**(1-precision_bits)).
+    The window is divided into time slices; prune() drops whole slices, so up to
+    one slice width of samples older than the cutoff may be retained.
+
+    record() is O(1); quantiles() is O(buckets) regardless of sample count.
+    Quantiles report the bucket's highest equivalent value, clamped to the window max.
+    """
+
+    __slots__ = (
+        "_bits",
+        "_half",
+        "_low_water_ms",
+        "_n",
+        "_slices",
+        "_sub",
+        "_totals",
+        "slice_ms",
+        "window_ms",
+    )
+
+    def __init__(
+        self,
+        window_ms: int = 60_000,
+        slices: int = 16,
+        precision_bits: int = 6,
+        max_value_ms: int = (1 << 22) - 1,
+    ) -> None:
+        if window_ms <= 0 or slices <= 0:
+            raise ValueError("window_ms and slices must be > 0")
+        if not 2 <= precision_bits <= 16:
+            raise ValueError("precision_bits must be in [2, 16]")
+        self.window_ms = window_ms
+        self.slice_ms = -(-window_ms // slices)
+        self._bits = precision_bits
+        self._sub = 1 << precision_bits
+        self._half = self._sub >> 1
+        self._totals = [0] * (self.bucket_index(max(max_value_ms, self._sub)) + 1)
+        self._slices: dict[int, _Slice] = {}
+        self._n = 0
+        self._low_water_ms: int | None = None
+
+    def bucket_index(self, value: int) -> int:
+        """Log-linear bucket index of a non-negative integer value."""
+        if value < self._sub:
+            return value
+        e = value.bit_length() - self._bits
+        return self._sub + (e - 1) * self._half + ((value >> e) - self._half)
+
+    def bucket_upper(self, index: int) -> int:
+        """Highest value mapping to bucket index."""
+        if index < self._sub:
+            return index
+        k = index - self._sub
+        e = k // self._half + 1
+        m = k % self._half + self._half
+        return ((m + 1) << e) - 1
+
+    def record(self, latency_ms: float, ts_ms: int) -> None:
+        """Record one latency sample (O(1)). Samples older than the last prune are ignored."""
+        if self._low_water_ms is not None and ts_ms < self._low_water_ms:
+            return
+        value = max(0, math.ceil(latency_ms))
+        index = min(self.bucket_index(value), len(self._totals) - 1)
+        slice_id = ts_ms // self.slice_ms
+        sl = self._slices.get(slice_id)
+        if sl is None:
+            sl = self._slices[slice_id] = _Slice()
+        sl.counts[index] = sl.counts.get(index, 0) + 1
+        sl.n += 1
+        sl.max = max(sl.max, value)
+        self._totals[index] += 1
+        self._n += 1
+
+    def prune(self, cutoff_ms: int) -> None:
+        """Drop slices that lie entirely before cutoff_ms."""
+        if self._low_water_ms is None or cutoff_ms > self._low_water_ms:
+            self._low_water_ms = cutoff_ms
+        expired = [sid for sid in self._slices if (sid + 1) * self.slice_ms <= cutoff_ms]
+        totals = self._totals
+        for sid in expired:
+            sl = self._slices.pop(sid)
+            for index, count in sl.counts.items():
+                totals[index] -= count
+            self._n -= sl.n
+
+    def coarsen(self) -> None:
+        """Double the slice width, merging neighbouring slices (samples may expire later)."""
+        self.slice_ms *= 2
+        merged: dict[int, _Slice] = {}
+        for sid, sl in self._slices.items():
+            target = merged.get(sid // 2)
+            if target is None:
+                merged[sid // 2] = sl
+                continue
+            for index, count in sl.counts.items():
+                target.counts[index] = target.counts.get(index, 0) + count
+            target.n += sl.n
+            target.max = max(target.max, sl.max)
+        self._slices = merged
+
+    def slice_count(self) -> int:
+        """Number of retained time slices."""
+        return len(self._slices)
+
+    def quantiles(self, qs: Sequence[float]) -> list[float] | None:
+        """Quantiles in one O(buckets) walk, or None if empty."""
+        n = self._n
+        if n == 0:
+            return None
+        if not qs:
+            return []
+        window_max = self.max_value()
+        order = sorted(range(len(qs)), key=lambda i: qs[i])
+        out = [0.0] * len(qs)
+        pos = 0
+        rank = min(int(qs[order[0]] * n), n - 1)
+        cumulative = 0
+        for index, count in enumerate(self._totals):
+            if not count:
+                continue
+            cumulative += count
+            while cumulative > rank:
+                out[order[pos]] = min(self.bucket_upper(index), window_max)
+                pos += 1
+                if pos == len(order):
+                    return out
+                rank = min(int(qs[order[pos]] * n), n - 1)
+        return out
+
+    def quantile(self, q: float) -> float | None:
+        """Single quantile, or None if empty."""
+        values = self.quantiles([q])
+        return None if values is None else values[0]
+
+    def max_value(self) -> float | None:
+        """Exact maximum over retained slices (O(slices))."""
+        if self._n == 0:
+            return None
+        return max(sl.max for sl in self._slices.values() if sl.n)
+
+    def buckets(self) -> list[tuple[int, int]]:
+        """Non-empty buckets as (highest equivalent value clamped to max, count), ascending."""
+        window_max = self.max_value()
+        return [
+            (min(self.bucket_upper(index), window_max), count)
+            for index, count in enumerate(self._totals)
+            if count
+        ]
+
+    def memory_usage(self) -> int:
+        """Approximate memory footprint (bytes)."""
+        size = sys.getsizeof(self) + sys.getsizeof(self._totals) + sys.getsizeof(self._slices)
+        for sl in self._slices.values():
+            size += sys.getsizeof(sl) + sys.getsizeof(sl.counts)
+        return size
+
+    def __len__(self) -> int:
+        return self._n
+
+
+class _Reservoir:
+    """Uniform reservoir of one time slice."""
+
+    __slots__ = ("max", "samples", "seen")
+
+    def __init__(self) -> None:
+        self.samples: list[float] = []
+        self.seen = 0
+        self.max = 0.0
+
+
+class SampledLatencyStore:
+    """
+    Latency store capping retained samples per window (opt-in for high event rates).
+
+    Each time slice keeps a uniform reservoir (Algorithm R) of at most
+    max_samples // slices samples; a retained sample stands for seen / retained
+    samples of its slice, so weighted percentiles stay unbiased. While no slice
+    overflows, results equal the exact list computation. Once pruned to the window,
+    memory and query cost are bounded by max_samples regardless of event rate (slices
+    accumulate until the next prune). Whole slices expire, as in LatencyHistogram.
+    Deterministic for a given seed.
+    """
+
+    __slots__ = (
+        "_low_water_ms",
+        "_retained",
+        "_rng",
+        "_seen",
+        "_slices",
+        "_sorted",
+        "per_slice",
+        "slice_ms",
+        "window_ms",
+    )
+
+    def __init__(
+        self,
+        window_ms: int = 60_000,
+        max_samples: int = 2048,
+        slices: int = 16,
+        seed: int = 0,
+    ) -> None:
+        if window_ms <= 0 or slices <= 0 or max_samples < slices:
+            raise ValueError("window_ms and slices must be > 0 and max_samples >= slices")
+        self.window_ms = window_ms
+        self.slice_ms = -(-window_ms // slices)
+        self.per_slice = max_samples // slices
+        self._rng = random.Random(seed)
+        self._slices: dict[int, _Reservoir] = {}
+        self._seen = 0
+        self._retained = 0
+        self._sorted: list[tuple[float, float]] | None = None  # (value, weight), cached
+        self._low_water_ms: int | None = None
+
+    def record(self, latency_ms: float, ts_ms: int) -> None:
+        """Record one latency sample (O(1)). Samples older than the last prune are ignored."""
+        if self._low_water_ms is not None and ts_ms < self._low_water_ms:
+            return
+        slice_id = ts_ms // self.slice_ms
+        res = self._slices.get(slice_id)
+        if res is None:
+            res = self._slices[slice_id] = _Reservoir()
+        res.seen += 1
+        self._seen += 1
+        res.max = max(res.max, latency_ms)
+        if len(res.samples) < self.per_slice:
+            res.samples.append(latency_ms)
+            self._retained += 1
+        else:
+            j = self._rng.randrange(res.seen)
+            if j >= self.per_slice:
+                return
+            res.samples[j] = latency_ms
+        self._sorted = None
+
+    def prune(self, cutoff_ms: int) -> None:
+        """Drop slices that lie entirely before cutoff_ms."""
+        if self._low_water_ms is None or cutoff_ms > self._low_water_ms:
+            self._low_water_ms = cutoff_ms
+        expired = [sid for sid in self._slices if (sid + 1) * self.slice_ms <= cutoff_ms]
+        for sid in expired:
+            res = self._slices.pop(sid)
+            self._seen -= res.seen
+            self._retained -= len(res.samples)
+        if expired:
+            self._sorted = None
+
+    def _weighted(self) -> list[tuple[float, float]]:
+        if self._sorted is None:
+            pairs = []
+            for res in self._slices.values():
+                if res.samples:
+                    weight = res.seen / len(res.samples)
+                    pairs.extend((value, weight) for value in res.samples)
+            pairs.sort()
+            self._sorted = pairs
+        return self._sorted
+
+    def quantiles(self, qs: Sequence[float]) -> list[float] | None:
+        """Weighted quantiles (rank min(int(q*n), n-1) over seen samples), or None if empty."""
+        n = self._seen
+        if n == 0:
+            return None
+        pairs = self._weighted()
+        order = sorted(range(len(qs)), key=lambda i: qs[i])
+        out = [pairs[-1][0]] * len(qs)
+        pos = 0
+        cumulative = 0.0
+        for value, weight in pairs:
+            cumulative += weight
+            # Tolerance absorbs float error of fractional weights
+            while pos < len(order) and cumulative > min(int(qs[order[pos]] * n), n - 1) + 1e-9:
+                out[order[pos]] = value
+                pos += 1
+            if pos == len(order):
+                break
+        return out
+
+    def quantile(self, q: float) -> float | None:
+        """Single quantile, or None if empty."""
+        values = self.quantiles([q])
+        return None if values is None else values[0]
+
+    def max_value(self) -> float | None:
+        """Exact maximum over retained slices."""
+        if self._seen == 0:
+            return None
+        return max(res.max for res in self._slices.values() if res.seen)
+
+    def memory_usage(self) -> int:
+        """Approximate memory footprint (bytes)."""
+        size = sys.getsizeof(self) + sys.getsizeof(self._slices)
+        for res in self._slices.values():
+            size += sys.getsizeof(res) + sys.getsizeof(res.samples)
+        size += self._retained * sys.getsizeof(1.0)
+        if self._sorted is not None:
+            size += sys.getsizeof(self._sorted) + len(self._sorted) * sys.getsizeof((0, 0))
+        return size
+
+    def sampling_rate(self) -> float:
+        """Retained / seen samples in the window (1.0 when nothing was dropped)."""
+        return self._retained / self._seen if self._seen else 1.0
+
+    def rank_error(self, confidence: float = 0.95) -> float:
+        """
+        Bound on the quantile rank error at the given confidence (DKW inequality).
+
+        Formula:
+            eps = sqrt(ln(2 / (1 - confidence)) / (2 * retained)), 0.0 when unsampled
+
+        Returns:
+            Maximum absolute error of the estimated CDF (fraction of samples)
+        """
+        if self._retained == 0 or self._retained == self._seen:
+            return 0.0
+        return math.sqrt(math.log(2.0 / (1.0 - confidence)) / (2.0 * self._retained))
+
+    def __len__(self) -> int:
+        return self._seen
+
+
+class _SkipNode:
+    __slots__ = ("next", "value", "width")
+
+    def __init__(self, value: float, next: list, width: list) -> None:
+        self.value = value
+        self.next = next
+        self.width = width
+
+
+_SKIP_END = _SkipNode(math.inf, [], [])  # Sentinel: greater than every finite sample
+
+
+class ExactLatencyStore:
+    """
+    Exact windowed order statistics (for audited policies).
+
+    Samples live in an indexable skip list (each link knows how many samples it
+    skips), so insert, removal and select-by-rank are O(log n) expected; a heap
+    orders samples by timestamp for expiry. Quantiles equal the list computation
+    exactly (rank min(int(q*n), n-1) of the sorted samples) and return the
+    recorded values themselves. Samples expire individually (no slice
+    granularity). Latencies must be finite.
+    """
+
+    __slots__ = ("_expiry", "_head", "_n", "_rng", "_seq", "levels")
+
+    def __init__(self, expected_size: int = 1 << 16, seed: int = 0) -> None:
+        self.levels = max(1, int(math.log2(max(2, expected_size))) + 1)
+        self._head = _SkipNode(-math.inf, [_SKIP_END] * self.levels, [1] * self.levels)
+        self._expiry: list[tuple[int, int, float]] = []  # (ts_ms, seq, value) min-heap
+        self._seq = 0
+        self._n = 0
+        self._rng = random.Random(seed)
+
+    def _insert(self, value: float) -> None:
+        levels = self.levels
+        chain: list[_SkipNode] = [self._head] * levels
+        steps_at_level = [0] * levels
+        node = self._head
+        for level in range(levels - 1, -1, -1):
+            while node.next[level].value <= value:
+                steps_at_level[level] += node.width[level]
+                node = node.next[level]
+            chain[level] = node
+        height = 1
+        while height < levels and self._rng.random() < 0.5:
+            height += 1
+        new = _SkipNode(value, [None] * height, [0] * height)
+        steps = 0
+        for level in range(height):
+            prev = chain[level]
+            new.next[level] = prev.next[level]
+            prev.next[level] = new
+            new.width[level] = prev.width[level] - steps
+            prev.width[level] = steps + 1
+            steps += steps_at_level[level]
+        for level in range(height, levels):
+            chain[level].width[level] += 1
+
+    def _remove(self, value: float) -> None:
+        levels = self.levels
+        chain: list[_SkipNode] = [self._head] * levels
+        node = self._head
+        for level in range(levels - 1, -1, -1):
+            while node.next[level].value < value:
+                node = node.next[level]
+            chain[level] = node
+        target = chain[0].next[0]
+        for level in range(len(target.next)):
+            prev = chain[level]
+            prev.width[level] += target.width[level] - 1
+            prev.next[level] = target.next[level]
+        for level in range(len(target.next), levels):
+            chain[level].width[level] -= 1
+
+    def _select(self, rank: int) -> float:
+        """Value of the rank-th smallest sample (0-based)."""
+        node = self._head
+        i = rank + 1
+        for level in range(self.levels - 1, -1, -1):
+            while node.width[level] <= i:
+                i -= node.width[level]
+                node = node.next[level]
+        return node.value
+
+    def record(self, latency_ms: float, ts_ms: int) -> None:
+        """
+        Record one latency sample.
+
+        Raises:
+            ValueError: If latency_ms is not finite
+        """
+        if not math.isfinite(latency_ms):
+            raise ValueError("latency must be finite")
+        self._insert(latency_ms)
+        heapq.heappush(self._expiry, (ts_ms, self._seq, latency_ms))
+        self._seq += 1
+        self._n += 1
+
+    def prune(self, cutoff_ms: int) -> None:
+        """Drop samples with ts < cutoff_ms."""
+        expiry = self._expiry
+        while expiry and expiry[0][0] < cutoff_ms:
+            self._remove(heapq.heappop(expiry)[2])
+            self._n -= 1
+
+    def quantiles(self, qs: Sequence[float]) -> list[float] | None:
+        """Exact quantiles (rank min(int(q*n), n-1)), or None if empty."""
+        n = self._n
+        if n == 0:
+            return None
+        return [self._select(min(int(q * n), n - 1)) for q in qs]
+
+    def quantile(self, q: float) -> float | None:
+        """Single exact quantile or None if empty."""
+        n = self._n
+        if n == 0:
+            return None
+        return self._select(min(int(q * n), n - 1))
+
+    def max_value(self) -> float | None:
+        """Largest retained sample or None if empty."""
+        return self._select(self._n - 1) if self._n else None
+
+    def memory_usage(self) -> int:
+        """Approximate memory footprint (bytes); about two links per sample."""
+        node = sys.getsizeof(_SKIP_END) + 2 * sys.getsizeof([None, None]) + sys.getsizeof(1.0)
+        item = sys.getsizeof((0, 0, 0.0)) + 2 * sys.getsizeof(1 << 40)
+        return sys.getsizeof(self) + self._n * (node + item) + sys.getsizeof(self._expiry)
+
+    def __len__(self) -> int:
+        return self._n
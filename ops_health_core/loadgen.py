@@ -0,0 +1,430 @@
+# Decision Ecosystem — ops-health-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Synthetic load generator and soak harness for kill-switch engines."""
+
+import heapq
+import math
+import os
+import random
+import sys
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+from ops_health_core.kill_switch import Engine, update_kill_switch
+from ops_health_core.latency import LatencyHistogram
+from ops_health_core.model import (
+    EVENT_429,
+    EVENT_ERROR,
+    EVENT_RECONNECT,
+    REASON_FAIL_CLOSED,
+    HealthState,
+    OpsPolicy,
+    OpsState,
+)
+from ops_health_core.policy import CompiledPolicy, as_compiled
+from ops_health_core.sweep import EVENT_LATENCY
+
+LATENCY_DISTRIBUTIONS = ("lognormal", "exponential", "pareto", "constant")
+
+
+@dataclass
+class Incident:
+    """Labeled degradation: extra event rates (per entity) for a time interval."""
+
+    start_ms: int
+    duration_ms: int
+    error_rate_per_s: float = 0.0
+    rate_limit_rate_per_s: float = 0.0
+    reconnect_rate_per_s: float = 0.0
+    latency_scale: float = 1.0  # Multiplier on latency samples during the incident
+    entities: int | None = None  # Affects entities 0..entities-1 (None = all)
+
+    @property
+    def end_ms(self) -> int:
+        return self.start_ms + self.duration_ms
+
+    def affects(self, entity: int) -> bool:
+        return self.entities is None or entity < self.entities
+
+
+@dataclass
+class LoadProfile:
+    """
+    Synthetic traffic shape. Rates are per entity (Poisson arrivals).
+
+    Bursts are short unlabeled error storms (burst_size errors at one instant);
+    with disorder_fraction > 0, that share of events arrives up to disorder_ms
+    late, i.e. out of timestamp order.
+    """
+
+    duration_ms: int = 60_000
+    entities: int = 1
+    tick_ms: int = 100  # Generation granularity (rates are constant within a tick)
+    error_rate_per_s: float = 0.02
+    rate_limit_rate_per_s: float = 0.01
+    reconnect_rate_per_s: float = 0.001
+    latency_rate_per_s: float = 20.0
+    latency_distribution: str = "lognormal"
+    latency_median_ms: float = 50.0
+    latency_shape: float = 0.5  # lognormal sigma or pareto alpha (ignored otherwise)
+    burst_rate_per_s: float = 0.0
+    burst_size: int = 20
+    disorder_fraction: float = 0.0
+    disorder_ms: int = 0
+    incidents: list[Incident] = field(default_factory=list)
+
+
+def _validate(profile: LoadProfile) -> None:
+    if profile.duration_ms <= 0 or profile.tick_ms <= 0 or profile.entities <= 0:
+        raise ValueError("duration_ms, tick_ms and entities must be > 0")
+    if profile.latency_distribution not in LATENCY_DISTRIBUTIONS:
+        raise ValueError(f"latency_distribution must be one of {LATENCY_DISTRIBUTIONS}")
+    if not 0.0 <= profile.disorder_fraction <= 1.0 or profile.disorder_ms < 0:
+        raise ValueError("disorder_fraction must be in [0, 1] and disorder_ms >= 0")
+    rates = (
+        profile.error_rate_per_s,
+        profile.rate_limit_rate_per_s,
+        profile.reconnect_rate_per_s,
+        profile.latency_rate_per_s,
+        profile.burst_rate_per_s,
+    )
+    if any(rate < 0 for rate in rates):
+        raise ValueError("rates must be >= 0")
+
+
+def _poisson(rng: random.Random, mean: float) -> int:
+    """Poisson draw (Knuth for small means, normal approximation above 30)."""
+    if mean <= 0:
+        return 0
+    if mean > 30:
+        return max(0, round(rng.gauss(mean, math.sqrt(mean))))
+    limit = math.exp(-mean)
+    k, p = 0, rng.random()
+    while p > limit:
+        k += 1
+        p *= rng.random()
+    return k
+
+
+def _latency(rng: random.Random, profile: LoadProfile) -> float:
+    median = profile.latency_median_ms
+    kind = profile.latency_distribution
+    if kind == "lognormal":
+        return rng.lognormvariate(math.log(median), profile.latency_shape)
+    if kind == "exponential":
+        return rng.expovariate(math.log(2) / median)
+    if kind == "pareto":  # Scaled so the median is latency_median_ms
+        alpha = profile.latency_shape
+        return median / 2 ** (1 / alpha) * rng.paretovariate(alpha)
+    return median
+
+
+def generate_events(profile: LoadProfile, seed: int = 0) -> Iterator[dict[str, Any]]:
+    """
+    Generate a synthetic event stream in arrival order.
+
+    Events use the CLI format plus routing fields: {"type", "ts_ms", "entity",
+    "arrival_ms"} and "latency_ms" for latency events. The stream is fully
+    determined by (profile, seed).
+
+    Args:
+        profile: Traffic shape
+        seed: Random seed
+
+    Yields:
+        Event dicts ordered by arrival_ms (ts_ms may be out of order)
+
+    Raises:
+        ValueError: If the profile is invalid
+    """
+    _validate(profile)
+    rng = random.Random(seed)
+    tick_s = profile.tick_ms / 1000
+    pending: list[tuple[int, int, dict[str, Any]]] = []  # (arrival_ms, seq, event)
+    seq = 0
+
+    for tick_start in range(0, profile.duration_ms, profile.tick_ms):
+        tick_end = min(tick_start + profile.tick_ms, profile.duration_ms)
+        active = [i for i in profile.incidents if i.start_ms < tick_end and tick_start < i.end_ms]
+        for entity in range(profile.entities):
+            rates = {
+                EVENT_ERROR: profile.error_rate_per_s,
+                EVENT_429: profile.rate_limit_rate_per_s,
+                EVENT_RECONNECT: profile.reconnect_rate_per_s,
+            }
+            latency_scale = 1.0
+            for incident in active:
+                if incident.affects(entity):
+                    rates[EVENT_ERROR] += incident.error_rate_per_s
+                    rates[EVENT_429] += incident.rate_limit_rate_per_s
+                    rates[EVENT_RECONNECT] += incident.reconnect_rate_per_s
+                    latency_scale *= incident.latency_scale
+
+            events = []
+            for kind, rate in rates.items():
+                for _ in range(_poisson(rng, rate * tick_s)):
+                    events.append({"type": kind, "ts_ms": rng.randrange(tick_start, tick_end)})
+            for _ in range(_poisson(rng, profile.burst_rate_per_s * tick_s)):
+                ts = rng.randrange(tick_start, tick_end)
+                events.extend({"type": EVENT_ERROR, "ts_ms": ts} for _ in range(profile.burst_size))
+            for _ in range(_poisson(rng, profile.latency_rate_per_s * tick_s)):
+                events.append(
+                    {
+                        "type": EVENT_LATENCY,
+                        "ts_ms": rng.randrange(tick_start, tick_end),
+                        "latency_ms": _latency(rng, profile) * latency_scale,
+                    }
+                )
+
+            for event in events:
+                event["entity"] = entity
+                arrival = event["ts_ms"]
+                if profile.disorder_fraction and rng.random() < profile.disorder_fraction:
+                    arrival += rng.randint(0, profile.disorder_ms)
+                event["arrival_ms"] = arrival
+                heapq.heappush(pending, (arrival, seq, event))
+                seq += 1
+
+        while pending and pending[0][0] < tick_end:
+            yield heapq.heappop(pending)[2]
+    while pending:
+        yield heapq.heappop(pending)[2]
+
+
+def record_event(state: OpsState, event: dict[str, Any]) -> None:
+    """Apply one generated (or CLI-format) event to an OpsState."""
+    kind = event["type"]
+    if kind == EVENT_ERROR:
+        state.record_error(event["ts_ms"])
+    elif kind == EVENT_429:
+        state.record_429(event["ts_ms"])
+    elif kind == EVENT_RECONNECT:
+        state.record_reconnect(event["ts_ms"])
+    elif kind == EVENT_LATENCY:
+        state.record_latency(event.get("latency_ms", 0), event["ts_ms"])
+    else:
+        raise ValueError(f"unknown event type: {kind!r}")
+
+
+def rss_bytes() -> int | None:
+    """Current resident set size (Linux /proc), else peak RSS, else None."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+@dataclass
+class SoakSample:
+    """Progress checkpoint of a soak run (one per report interval of stream time)."""
+
+    stream_ms: int  # Stream time at the checkpoint
+    events: int  # Events ingested so far
+    evaluations: int  # Engine calls so far
+    events_per_s: float  # Events per wall-clock second since the previous checkpoint
+    eval_p50_us: float | None  # Engine call latency since the previous checkpoint
+    eval_p99_us: float | None
+    eval_max_us: float | None
+    rss_bytes: int | None
+    trips: int  # Kill-switch trips so far (RED outside an active cooldown)
+
+
+@dataclass
+class SoakReport:
+    """Soak run outcome: throughput, tail evaluation latency, RSS growth and trip correctness."""
+
+    events: int
+    evaluations: int
+    wall_s: float
+    events_per_s: float
+    eval_p50_us: float | None  # Run-wide percentiles from a log-linear histogram (< 1% error)
+    eval_p99_us: float | None
+    eval_max_us: float | None  # Exact
+    rss_start_bytes: int | None
+    rss_end_bytes: int | None
+    trips: int
+    true_trips: int  # Trips on an entity inside a labeled incident (or its window tail)
+    false_trips: int  # All other trips
+    missed_incidents: int  # (incident, affected entity) pairs that never tripped
+    detection_delays_ms: list[int]  # First trip - incident start, per detected pair
+    fail_closed: int  # Signals with the fail-closed reason
+    samples: list[SoakSample]
+
+    @property
+    def rss_growth_bytes(self) -> int | None:
+        if self.rss_start_bytes is None or self.rss_end_bytes is None:
+            return None
+        return self.rss_end_bytes - self.rss_start_bytes
+
+
+def _percentile(ordered: list[float], q: float) -> float | None:
+    n = len(ordered)
+    return ordered[min(int(q * n), n - 1)] if n else None
+
+
+def run_soak(
+    profile: LoadProfile,
+    policy: OpsPolicy | CompiledPolicy,
+    engine: Engine = update_kill_switch,
+    eval_interval_ms: int = 1000,
+    report_interval_ms: int = 10_000,
+    seed: int = 0,
+    state_factory: Callable[[], OpsState] = OpsState,
+) -> SoakReport:
+    """
+    Drive an engine with a generated stream and measure it.
+
+    Events are recorded into one OpsState per entity in arrival order; every
+    eval_interval_ms of arrival time the engine evaluates every entity. A trip
+    is a RED signal while the entity was not already in cooldown (as in
+    sweep_policies, so cooldown_ms=0 trips on every RED evaluation); it is
+    correct when the entity is affected by an incident active at the trip time
+    (or within window_ms after it ended, while its events are still in the
+    window). Evaluation timings are kept per checkpoint period and in a bounded
+    histogram, so memory does not grow with the run length.
+
+    Args:
+        profile: Traffic shape
+        policy: Ops policy
+        engine: Evaluator with update_kill_switch's signature
+        eval_interval_ms: Evaluation period (stream time)
+        report_interval_ms: Checkpoint period (stream time) for SoakSample records
+        seed: Random seed for the generator
+        state_factory: Builds each entity's OpsState (e.g. with a latency store)
+
+    Returns:
+        SoakReport
+
+    Raises:
+        ValueError: If the profile or the intervals are invalid
+    """
+    if eval_interval_ms <= 0 or report_interval_ms <= 0:
+        raise ValueError("eval_interval_ms and report_interval_ms must be > 0")
+    compiled = as_compiled(policy)
+    states = [state_factory() for _ in range(profile.entities)]
+    cooldowns: list[int | None] = [None] * profile.entities  # From each entity's last signal
+    first_trip: dict[tuple[int, int], int] = {}
+    # Engine call time (ns) over the whole run; the max is tracked exactly
+    timings = LatencyHistogram(window_ms=1, slices=1, precision_bits=8, max_value_ms=(1 << 40) - 1)
+    max_ns = 0
+    period_timings: list[float] = []
+    samples: list[SoakSample] = []
+    events = evaluations = trips = true_trips = false_trips = fail_closed = 0
+    period_events = 0
+    tail_ms = compiled.window_ms
+
+    def evaluate(now_ms: int) -> None:
+        nonlocal evaluations, trips, true_trips, false_trips, fail_closed, max_ns
+        for entity, state in enumerate(states):
+            start = time.perf_counter_ns()
+            signal = engine(state, compiled, now_ms)
+            elapsed_ns = time.perf_counter_ns() - start
+            period_timings.append(elapsed_ns / 1000)
+            timings.record(elapsed_ns, 0)
+            max_ns = max(max_ns, elapsed_ns)
+            evaluations += 1
+            if REASON_FAIL_CLOSED in signal.reasons:
+                fail_closed += 1
+                continue
+            previous = cooldowns[entity]
+            cooldowns[entity] = signal.cooldown_until_ms
+            if signal.state != HealthState.RED or (previous is not None and now_ms < previous):
+                continue
+            trips += 1
+            matched = False
+            for index, incident in enumerate(profile.incidents):
+                if incident.affects(entity) and (
+                    incident.start_ms <= now_ms <= incident.end_ms + tail_ms
+                ):
+                    matched = True
+                    first_trip.setdefault((index, entity), now_ms)
+            if matched:
+                true_trips += 1
+            else:
+                false_trips += 1
+
+    rss_start = rss_bytes()
+    wall_start = period_start = time.perf_counter()
+    next_eval = eval_interval_ms
+    next_report = report_interval_ms
+
+    def checkpoint(stream_ms: int) -> None:
+        nonlocal period_start, period_events, period_timings
+        now = time.perf_counter()
+        ordered = sorted(period_timings)
+        samples.append(
+            SoakSample(
+                stream_ms=stream_ms,
+                events=events,
+                evaluations=evaluations,
+                events_per_s=period_events / (now - period_start) if now > period_start else 0.0,
+                eval_p50_us=_percentile(ordered, 0.5),
+                eval_p99_us=_percentile(ordered, 0.99),
+                eval_max_us=ordered[-1] if ordered else None,
+                rss_bytes=rss_bytes(),
+                trips=trips,
+            )
+        )
+        period_timings = []
+        period_start = now
+        period_events = 0
+
+    def advance(until_ms: int) -> None:
+        """Run every evaluation (and checkpoint) due up to until_ms."""
+        nonlocal next_eval, next_report
+        while next_eval <= until_ms:
+            evaluate(next_eval)
+            if next_eval >= next_report:
+                checkpoint(next_eval)
+                next_report += report_interval_ms
+            next_eval += eval_interval_ms
+
+    for event in generate_events(profile, seed):
+        advance(min(event["arrival_ms"], profile.duration_ms))
+        record_event(states[event["entity"]], event)
+        events += 1
+        period_events += 1
+    advance(profile.duration_ms)
+    if not samples or samples[-1].stream_ms < profile.duration_ms:
+        checkpoint(profile.duration_ms)
+
+    wall_s = time.perf_counter() - wall_start
+    p50_ns, p99_ns = timings.quantiles([0.5, 0.99]) or (None, None)
+    pairs = [
+        (index, entity)
+        for index, incident in enumerate(profile.incidents)
+        for entity in range(profile.entities)
+        if incident.affects(entity) and incident.start_ms < profile.duration_ms
+    ]
+    return SoakReport(
+        events=events,
+        evaluations=evaluations,
+        wall_s=wall_s,
+        events_per_s=events / wall_s if wall_s > 0 else 0.0,
+        eval_p50_us=None if p50_ns is None else p50_ns / 1000,
+        eval_p99_us=None if p99_ns is None else p99_ns / 1000,
+        eval_max_us=max_ns / 1000 if evaluations else None,
+        rss_start_bytes=rss_start,
+        rss_end_bytes=rss_bytes(),
+        trips=trips,
+        true_trips=true_trips,
+        false_trips=false_trips,
+        missed_incidents=sum(1 for pair in pairs if pair not in first_trip),
+        detection_delays_ms=[
+            first_trip[pair] - profile.incidents[pair[0]].start_ms
+            for pair in pairs
+            if pair in first_trip
+        ],
+        fail_closed=fail_closed,
+        samples=samples,
+    )
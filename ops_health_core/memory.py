@@ -0,0 +1,77 @@
+# Decision Ecosystem — ops-health-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Memory accounting for OpsState and registries."""
+
+import sys
+from collections.abc import Mapping
+from typing import Any
+
+from ops_health_core.model import OpsState
+
+
+def _list_size(values: list) -> int:
+    """List footprint with elements sized from a representative (first) element."""
+    size = sys.getsizeof(values)
+    if values:
+        size += len(values) * sys.getsizeof(values[0])
+    return size
+
+
+def _component_size(component: Any) -> int:
+    if component is None:
+        return 0
+    usage = getattr(component, "memory_usage", None)
+    return usage() if callable(usage) else sys.getsizeof(component)
+
+
+def state_memory_usage(state: OpsState) -> int:
+    """
+    Approximate memory footprint of one OpsState (bytes).
+
+    Counts event lists, aggregated counts and attached components. A shared
+    rollup node is not counted (it is owned by the tree).
+
+    Args:
+        state: Ops state
+
+    Returns:
+        Approximate bytes
+    """
+    size = sys.getsizeof(state)
+    size += _list_size(state.error_timestamps)
+    size += _list_size(state.rate_limit_timestamps)
+    size += _list_size(state.reconnect_timestamps)
+    size += _list_size(state.latency_samples)
+    size += _list_size(state.latency_timestamps)
+    size += sys.getsizeof(state.aggregated)
+    for counted in state.aggregated.values():
+        size += counted.memory_usage()
+    size += sys.getsizeof(state.gauges)
+    for gauge in state.gauges.values():
+        size += gauge.memory_usage()
+    size += _component_size(state.latency_store)
+    size += _component_size(state.latency_overflow)
+    size += _component_size(state.rate_budget)
+    size += _component_size(state.drift)
+    return size
+
+
+def memory_usage(target: OpsState | Mapping[str, OpsState]) -> int:
+    """
+    Approximate memory footprint of a state or a registry of states (bytes).
+
+    Suitable for export as a metric; cost is O(number of lists), not O(events).
+
+    Args:
+        target: OpsState, or mapping of entity key -> OpsState
+
+    Returns:
+        Approximate bytes
+    """
+    if isinstance(target, OpsState):
+        return state_memory_usage(target)
+    size = sys.getsizeof(target)
+    for key, state in target.items():
+        size += sys.getsizeof(key) + state_memory_usage(state)
+    return size
@@ -5,10 +5,25 @@
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from decision_schema.types import Action
 
+from ops_health_core.budget import RateBudget
+from ops_health_core.drift import REASON_ERROR_RATE_DRIFT, REASON_LATENCY_DRIFT, DriftMonitor
+from ops_health_core.gauges import WindowedGauge
+from ops_health_core.latency import LatencyHistogram, LatencyStore
+from ops_health_core.windows import CountedTimestamps, as_int64_array, collapse_timestamps
+
+if TYPE_CHECKING:
+    from ops_health_core.rollup import RollupNode
+
+
+# Event kinds (keys of OpsState.aggregated; same names as CLI event types)
+EVENT_ERROR = "error"
+EVENT_429 = "429"
+EVENT_RECONNECT = "reconnect"
+
 
 class HealthState(str, Enum):
     """Health state levels."""
@@ -18,6 +33,59 @@ class HealthState(str, Enum):
     RED = "RED"
 
 
+# Compact state codes (signal history, wire format)
+STATE_CODES: dict[HealthState, int] = {
+    HealthState.GREEN: 0,
+    HealthState.YELLOW: 1,
+    HealthState.RED: 2,
+}
+STATES_BY_CODE: tuple[HealthState, ...] = (HealthState.GREEN, HealthState.YELLOW, HealthState.RED)
+
+# Signal reasons, in the order update_kill_switch produces them
+REASON_HEALTH_RED = "health_score_below_red_threshold"
+REASON_COOLDOWN_ACTIVE = "kill_switch_cooldown_active"
+REASON_FAIL_CLOSED = "fail_closed_exception"
+KNOWN_REASONS: tuple[str, ...] = (
+    REASON_HEALTH_RED,
+    REASON_COOLDOWN_ACTIVE,
+    REASON_LATENCY_DRIFT,
+    REASON_ERROR_RATE_DRIFT,
+    REASON_FAIL_CLOSED,
+)
+REASON_BITS: dict[str, int] = {reason: 1 << i for i, reason in enumerate(KNOWN_REASONS)}
+REASON_OTHER_BIT = 1 << 31  # Set for any reason not in KNOWN_REASONS
+
+
+def reasons_to_flags(reasons: list[str]) -> int:
+    """
+    Encode reasons as a bit set (bit i = KNOWN_REASONS[i]).
+
+    Unknown reasons set REASON_OTHER_BIT, so the encoding is lossy for them.
+
+    Args:
+        reasons: Signal reasons
+
+    Returns:
+        Reason flags (fits in uint32)
+    """
+    flags = 0
+    for reason in reasons:
+        flags |= REASON_BITS.get(reason, REASON_OTHER_BIT)
+    return flags
+
+
+def flags_to_reasons(flags: int) -> list[str]:
+    """
+    Decode reason flags into reasons, in KNOWN_REASONS order.
+
+    Raises:
+        ValueError: If REASON_OTHER_BIT is set (reason text not recoverable)
+    """
+    if flags & REASON_OTHER_BIT:
+        raise ValueError("reason flags contain an unknown reason")
+    return [reason for reason in KNOWN_REASONS if flags & REASON_BITS[reason]]
+
+
 @dataclass
 class OpsPolicy:
     """Operational health policy configuration."""
@@ -35,6 +103,10 @@ class OpsPolicy:
     weight_429: float = 0.3
     weight_reconnects: float = 0.2
     weight_latency: float = 0.1
+    # Saturation: gauge name -> level at which the penalty saturates (see gauges.py)
+    saturation_limits: dict[str, float] = field(default_factory=dict)
+    weight_saturation: float = 0.0
+    weight_drift: float = 0.0  # Penalty while a drift flag is raised (OpsState.drift)
 
 
 @dataclass
@@ -47,6 +119,194 @@ class OpsState:
     latency_samples: list[int] = field(default_factory=list)
     latency_timestamps: list[int] = field(default_factory=list)
     cooldown_until_ms: int | None = None
+    rate_budget: RateBudget | None = None  # Optional AIMD budget fed by record_429/record_latency
+    latency_store: LatencyStore | None = None  # Optional; replaces latency_samples when attached
+    gauges: dict[str, WindowedGauge] = field(default_factory=dict)  # Saturation gauges by name
+    drift: DriftMonitor | None = None  # Optional drift flags fed by record_error/record_latency
+    rollup: "RollupNode | None" = None  # Optional leaf of a rollup tree (pushes deltas upward)
+    # Hard cap per event list (record_* only); overflow collapses into aggregated counts
+    max_events: int | None = None
+    overflow_bucket_ms: int = 1000  # Granularity of collapsed counts
+    aggregated: dict[str, CountedTimestamps] = field(default_factory=dict)  # By EVENT_* kind
+    latency_overflow: LatencyHistogram | None = None  # Collapsed latency samples
+    version: int = 0  # Bumped by every record_* call (and touch()); see SignalCache
+
+    def touch(self) -> None:
+        """Mark the state changed (call after mutating event lists directly)."""
+        self.version += 1
+
+    def _shrink_aggregated(self, counted: CountedTimestamps) -> None:
+        """Coarsen aggregated counts past max_events down to half of it (amortized O(1))."""
+        if self.max_events is not None and len(counted) > self.max_events:
+            counted.shrink(self.max_events // 2, self.overflow_bucket_ms)
+
+    def _enforce_cap(self, kind: str, timestamps: list[int]) -> None:
+        """Collapse the oldest half of a list that exceeds max_events (amortized O(1))."""
+        if self.max_events is None or len(timestamps) <= self.max_events:
+            return
+        counted = self.aggregated.get(kind)
+        if counted is None:
+            counted = self.aggregated[kind] = CountedTimestamps()
+        n = len(timestamps) - self.max_events // 2
+        collapse_timestamps(timestamps, counted, n, self.overflow_bucket_ms)
+        self._shrink_aggregated(counted)
+
+    def _enforce_latency_cap(self) -> None:
+        if self.max_events is None or len(self.latency_samples) <= self.max_events:
+            return
+        if self.latency_overflow is None:
+            self.latency_overflow = LatencyHistogram(window_ms=self.overflow_bucket_ms, slices=1)
+        n = min(len(self.latency_samples), len(self.latency_timestamps))
+        n = max(0, n - self.max_events // 2)
+        overflow = self.latency_overflow
+        for latency_ms, ts_ms in zip(
+            self.latency_samples[:n], self.latency_timestamps[:n], strict=True
+        ):
+            overflow.record(latency_ms, ts_ms)
+        del self.latency_samples[:n]
+        del self.latency_timestamps[:n]
+        if overflow.slice_count() > self.max_events:
+            while overflow.slice_count() > max(2, self.max_events // 2):
+                overflow.coarsen()
+
+    def record_error(self, ts_ms: int) -> None:
+        """Record an error event."""
+        self.version += 1
+        self.error_timestamps.append(ts_ms)
+        self._enforce_cap(EVENT_ERROR, self.error_timestamps)
+        if self.drift is not None:
+            self.drift.on_error(ts_ms)
+        if self.rollup is not None:
+            self.rollup.record_error(ts_ms)
+
+    def record_429(self, ts_ms: int) -> None:
+        """Record a rate-limit (429) event."""
+        self.version += 1
+        self.rate_limit_timestamps.append(ts_ms)
+        self._enforce_cap(EVENT_429, self.rate_limit_timestamps)
+        if self.rate_budget is not None:
+            self.rate_budget.on_429(ts_ms)
+        if self.rollup is not None:
+            self.rollup.record_429(ts_ms)
+
+    def record_reconnect(self, ts_ms: int) -> None:
+        """Record a reconnect event."""
+        self.version += 1
+        self.reconnect_timestamps.append(ts_ms)
+        self._enforce_cap(EVENT_RECONNECT, self.reconnect_timestamps)
+        if self.rollup is not None:
+            self.rollup.record_reconnect(ts_ms)
+
+    def record_latency(self, latency_ms: int, ts_ms: int) -> None:
+        """Record a latency sample (into latency_store if attached)."""
+        self.version += 1
+        if self.latency_store is not None:
+            self.latency_store.record(latency_ms, ts_ms)
+        else:
+            self.latency_samples.append(latency_ms)
+            self.latency_timestamps.append(ts_ms)
+            self._enforce_latency_cap()
+        if self.rate_budget is not None:
+            self.rate_budget.on_latency(latency_ms, ts_ms)
+        if self.drift is not None:
+            self.drift.on_latency(latency_ms, ts_ms)
+        if self.rollup is not None:
+            self.rollup.record_latency(latency_ms, ts_ms)
+
+    def _record_many(
+        self, kind: str, ts: Any, counts: Any, want_entries: bool
+    ) -> list[tuple[int, int]]:
+        """Bulk-add (ts, count) entries to aggregated[kind]; returns them if hooks need them."""
+        self.version += 1
+        counted = self.aggregated.get(kind)
+        if counted is None:
+            counted = self.aggregated[kind] = CountedTimestamps()
+        start = len(counted)
+        counted.extend(ts, counts)
+        entries = []
+        if want_entries:
+            entries = list(zip(counted.ts[start:], counted.counts[start:], strict=True))
+        self._shrink_aggregated(counted)
+        return entries
+
+    def record_errors(self, ts: Any, counts: Any = None) -> None:
+        """
+        Record error events in bulk, stored as (ts, count) entries (never expanded).
+
+        Args:
+            ts: Timestamps (ms) - array('q'), NumPy int64 array or iterable of ints
+            counts: Events per timestamp (same length); None means one event each
+        """
+        entries = self._record_many(
+            EVENT_ERROR, ts, counts, self.drift is not None or self.rollup is not None
+        )
+        for ts_ms, count in entries:
+            if self.drift is not None:
+                self.drift.on_error(ts_ms, count)
+            if self.rollup is not None:
+                self.rollup.record_error(ts_ms, count)
+
+    def record_429s(self, ts: Any, counts: Any = None) -> None:
+        """Record rate-limit (429) events in bulk (see record_errors)."""
+        entries = self._record_many(
+            EVENT_429, ts, counts, self.rate_budget is not None or self.rollup is not None
+        )
+        for ts_ms, count in entries:
+            if self.rate_budget is not None and count:
+                self.rate_budget.on_429(ts_ms)
+            if self.rollup is not None:
+                self.rollup.record_429(ts_ms, count)
+
+    def record_reconnects(self, ts: Any, counts: Any = None) -> None:
+        """Record reconnect events in bulk (see record_errors)."""
+        entries = self._record_many(EVENT_RECONNECT, ts, counts, self.rollup is not None)
+        if self.rollup is not None:
+            for ts_ms, count in entries:
+                self.rollup.record_reconnect(ts_ms, count)
+
+    def record_latencies(self, latencies: Any, ts: Any) -> None:
+        """
+        Record latency samples in bulk.
+
+        Args:
+            latencies: Latency values (ms) - NumPy array, array or iterable
+            ts: Timestamps (ms), same length as latencies
+
+        Raises:
+            ValueError: If lengths differ
+        """
+        self.version += 1
+        values = latencies.tolist() if hasattr(latencies, "tolist") else list(latencies)
+        stamps = as_int64_array(ts).tolist()
+        if len(values) != len(stamps):
+            raise ValueError("latencies and ts must have the same length")
+        if self.latency_store is not None:
+            record = self.latency_store.record
+            for latency_ms, ts_ms in zip(values, stamps, strict=True):
+                record(latency_ms, ts_ms)
+        else:
+            self.latency_samples.extend(values)
+            self.latency_timestamps.extend(stamps)
+            self._enforce_latency_cap()
+        if self.rate_budget is not None:
+            for latency_ms, ts_ms in zip(values, stamps, strict=True):
+                self.rate_budget.on_latency(latency_ms, ts_ms)
+        if self.drift is not None:
+            for latency_ms, ts_ms in zip(values, stamps, strict=True):
+                self.drift.on_latency(latency_ms, ts_ms)
+        if self.rollup is not None:
+            for latency_ms, ts_ms in zip(values, stamps, strict=True):
+                self.rollup.record_latency(latency_ms, ts_ms)
+
+    def record_gauge(self, name: str, value: float, ts_ms: int) -> None:
+        """Record a saturation gauge sample (queue depth, in-flight, pool utilization, ...)."""
+        self.version += 1
+        gauge = self.gauges.get(name)
+        if gauge is None:
+            gauge = self.gauges[name] = WindowedGauge()
+        gauge.record(value, ts_ms)
+        if self.max_events is not None:
+            gauge.shrink(self.max_events)
 
 
 @dataclass
@@ -59,6 +319,10 @@ class OpsSignal:
     cooldown_until_ms: int | None
     recommended_action: Action
     reasons: list[str] = field(default_factory=list)
+    recommended_rate_per_s: float | None = None  # From OpsState.rate_budget, if attached
+    latency_percentiles: dict[str, float] | None = None  # p50/p95/p99/max from latency_store
+    latency_sample_rate: float | None = None  # Retained/seen, from SampledLatencyStore
+    latency_rank_error: float | None = None  # 95% bound on percentile rank error (fraction)
 
     def to_context(self) -> dict[str, Any]:
         """
@@ -67,10 +331,19 @@ class OpsSignal:
         Returns:
             Dict with ops_health fields
         """
-        return {
+        context = {
             "ops_score": self.score,
             "ops_state": self.state.value,
             "ops_deny_actions": self.deny_actions,
             "ops_cooldown_until_ms": self.cooldown_until_ms,
             "ops_reasons": self.reasons,
         }
+        if self.recommended_rate_per_s is not None:
+            context["ops_recommended_rate_per_s"] = self.recommended_rate_per_s
+        if self.latency_percentiles is not None:
+            for name, value in self.latency_percentiles.items():
+                context[f"ops_latency_{name}_ms"] = value
+        if self.latency_sample_rate is not None:
+            context["ops_latency_sample_rate"] = self.latency_sample_rate
+            context["ops_latency_rank_error"] = self.latency_rank_error
+        return context
@@ -0,0 +1,134 @@
+# Decision Ecosystem — ops-health-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Sharded registry evaluation on a thread pool (scales on free-threaded Python)."""
+
+import logging
+import os
+import sys
+import zlib
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from typing import Self
+
+from ops_health_core.kill_switch import Engine, fail_closed_signal, update_kill_switch
+from ops_health_core.model import OpsPolicy, OpsSignal, OpsState
+from ops_health_core.policy import CompiledPolicy, as_compiled
+
+logger = logging.getLogger(__name__)
+
+
+def gil_enabled() -> bool:
+    """Whether the running interpreter holds a GIL (True before 3.13)."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def shard_of(entity: str, shards: int) -> int:
+    """Stable shard index of an entity (CRC32, identical across processes)."""
+    return zlib.crc32(entity.encode("utf-8")) % shards
+
+
+def _evaluate_shard(
+    engine: Engine,
+    items: list[tuple[str, OpsState]],
+    policy: CompiledPolicy,
+    now_ms: int,
+) -> dict[str, OpsSignal]:
+    """Evaluate one shard into a shard-local map (fail-closed per entity)."""
+    signals: dict[str, OpsSignal] = {}
+    for entity, state in items:
+        try:
+            signals[entity] = engine(state, policy, now_ms)
+        except Exception as e:
+            logger.warning("Shard evaluation fail-closed on exception: %s", type(e).__name__)
+            signals[entity] = fail_closed_signal()
+    return signals
+
+
+class ShardedEvaluator:
+    """
+    Evaluate a registry of OpsStates across a thread pool.
+
+    Entities are partitioned by shard_of(entity); each shard is evaluated by one
+    pool job into its own result map, so workers share no locks and no state (an
+    OpsState is only ever touched by the job owning its shard). The maps are
+    merged by the caller's thread.
+
+    Threads only pay off when the interpreter runs without a GIL: by default the
+    pool has os.cpu_count() workers on free-threaded builds and evaluation runs
+    inline on the calling thread on GIL builds. An explicit workers > 1 always
+    uses the pool (e.g. for engines that release the GIL).
+    """
+
+    def __init__(
+        self,
+        policy: OpsPolicy | CompiledPolicy,
+        workers: int | None = None,
+        engine: Engine = update_kill_switch,
+    ) -> None:
+        if workers is not None and workers <= 0:
+            raise ValueError("workers must be > 0")
+        self.policy = as_compiled(policy)
+        self.engine = engine
+        if workers is None:
+            workers = 1 if gil_enabled() else os.cpu_count() or 1
+        self.workers = workers
+        self._pool = (
+            ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ops-shard")
+            if workers > 1
+            else None
+        )
+
+    def evaluate(self, registry: Mapping[str, OpsState], now_ms: int) -> dict[str, OpsSignal]:
+        """
+        Evaluate every entity (same results as update_kill_switch per entity).
+
+        Args:
+            registry: Entity id -> OpsState (not mutated structurally during the call)
+            now_ms: Current time (ms)
+
+        Returns:
+            Entity id -> OpsSignal, in registry order (fail-closed per failed entity)
+        """
+        if self._pool is None or len(registry) < 2:
+            return _evaluate_shard(self.engine, list(registry.items()), self.policy, now_ms)
+        shards: list[list[tuple[str, OpsState]]] = [[] for _ in range(self.workers)]
+        for item in registry.items():
+            shards[shard_of(item[0], self.workers)].append(item)
+        futures = [
+            self._pool.submit(_evaluate_shard, self.engine, items, self.policy, now_ms)
+            for items in shards
+            if items
+        ]
+        merged: dict[str, OpsSignal] = {}
+        for future in futures:
+            merged.update(future.result())
+        return {entity: merged[entity] for entity in registry}
+
+    def close(self) -> None:
+        """Shut down the pool (idempotent)."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def evaluate_registry(
+    registry: Mapping[str, OpsState],
+    policy: OpsPolicy | CompiledPolicy,
+    now_ms: int,
+    workers: int | None = None,
+) -> dict[str, OpsSignal]:
+    """
+    One-shot sharded evaluation (builds and closes a ShardedEvaluator).
+
+    Prefer a long-lived ShardedEvaluator on hot paths to reuse its pool.
+    """
+    with ShardedEvaluator(policy, workers) as evaluator:
+        return evaluator.evaluate(registry, now_ms)
@@ -0,0 +1,167 @@
+# Decision Ecosystem — ops-health-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Compiled (validated, precomputed) policy."""
+
+import math
+from dataclasses import dataclass
+
+from ops_health_core.model import OpsPolicy
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledPolicy:
+    """
+    Immutable, precomputed form of OpsPolicy.
+
+    Build once with compile_policy(); the scorer and kill switch then run
+    straight-line arithmetic with the zero-guards resolved up front: a disabled
+    budget (max_* <= 0) is stored as inf, so count / max is 0.0. Penalties divide
+    by the budget (not multiply by a reciprocal) so scores are bit-identical to
+    the raw-policy formulas at threshold boundaries.
+    """
+
+    source: OpsPolicy
+    window_ms: int
+    cooldown_ms: int
+    max_errors: float  # inf when disabled
+    max_429: float
+    max_reconnects: float
+    max_p95_latency_ms: float
+    weights: tuple[float, float, float, float]  # errors, 429, reconnects, latency
+    threshold_red: float
+    threshold_yellow: float
+    saturation_limits: tuple[tuple[str, float], ...]  # (gauge name, 1/limit)
+    weight_saturation: float
+    weight_drift: float
+
+
+def _reciprocal(limit: float) -> float:
+    return 1.0 / limit if limit > 0 else 0.0
+
+
+def _budget(limit: float) -> float:
+    return float(limit) if limit > 0 else math.inf
+
+
+def _is_finite_real(value: object) -> bool:
+    return isinstance(value, int | float) and not isinstance(value, bool) and math.isfinite(value)
+
+
+def _finite(policy: OpsPolicy, name: str) -> float:
+    value = getattr(policy, name)
+    if not _is_finite_real(value):
+        raise ValueError(f"{name} must be a finite number, got {value!r}")
+    return value
+
+
+def validate_policy(policy: OpsPolicy) -> None:
+    """
+    Validate policy configuration.
+
+    Budgets of 0 are allowed (they disable the corresponding penalty).
+
+    Args:
+        policy: Ops policy
+
+    Raises:
+        ValueError: If any parameter is not a finite number, is out of range, or
+            thresholds are misordered
+    """
+    window_ms = _finite(policy, "window_ms")
+    if window_ms <= 0:
+        raise ValueError(f"window_ms must be > 0, got {window_ms}")
+    cooldown_ms = _finite(policy, "cooldown_ms")
+    if cooldown_ms < 0:
+        raise ValueError(f"cooldown_ms must be >= 0, got {cooldown_ms}")
+    for name in (
+        "max_errors_per_window",
+        "max_429_per_window",
+        "max_reconnects_per_window",
+        "max_p95_latency_ms",
+        "weight_errors",
+        "weight_429",
+        "weight_reconnects",
+        "weight_latency",
+        "weight_saturation",
+        "weight_drift",
+    ):
+        value = _finite(policy, name)
+        if value < 0:
+            raise ValueError(f"{name} must be >= 0, got {value}")
+    for gauge, limit in policy.saturation_limits.items():
+        if not _is_finite_real(limit) or limit <= 0:
+            raise ValueError(f"saturation_limits[{gauge!r}] must be finite and > 0, got {limit!r}")
+    red = _finite(policy, "score_threshold_red")
+    yellow = _finite(policy, "score_threshold_yellow")
+    if not 0.0 <= red <= yellow <= 1.0:
+        raise ValueError(
+            "thresholds must satisfy 0 <= score_threshold_red <= score_threshold_yellow <= 1, "
+            f"got red={red}, yellow={yellow}"
+        )
+
+
+def compile_policy(policy: OpsPolicy, *, validate: bool = True) -> CompiledPolicy:
+    """
+    Compile OpsPolicy into CompiledPolicy.
+
+    Args:
+        policy: Ops policy
+        validate: Reject invalid configs (default: True)
+
+    Returns:
+        CompiledPolicy
+
+    Raises:
+        ValueError: If validate is True and the policy is invalid
+    """
+    if validate:
+        validate_policy(policy)
+    return CompiledPolicy(
+        source=policy,
+        window_ms=policy.window_ms,
+        cooldown_ms=policy.cooldown_ms,
+        max_errors=_budget(policy.max_errors_per_window),
+        max_429=_budget(policy.max_429_per_window),
+        max_reconnects=_budget(policy.max_reconnects_per_window),
+        max_p95_latency_ms=_budget(policy.max_p95_latency_ms),
+        weights=(
+            policy.weight_errors,
+            policy.weight_429,
+            policy.weight_reconnects,
+            policy.weight_latency,
+        ),
+        threshold_red=policy.score_threshold_red,
+        threshold_yellow=policy.score_threshold_yellow,
+        saturation_limits=tuple(
+            (gauge, _reciprocal(limit)) for gauge, limit in policy.saturation_limits.items()
+        ),
+        weight_saturation=policy.weight_saturation,
+        weight_drift=policy.weight_drift,
+    )
+
+
+# Last raw OpsPolicy compiled by as_compiled: (policy, field snapshot, compiled form)
+_last_compiled: tuple[OpsPolicy, dict[str, object], CompiledPolicy] | None = None
+
+
+def as_compiled(policy: OpsPolicy | CompiledPolicy) -> CompiledPolicy:
+    """
+    Return policy as CompiledPolicy (compiles OpsPolicy without validation).
+
+    Unvalidated compilation accepts any raw OpsPolicy the scorer accepted before, with
+    identical scores. The most recent raw policy is cached (by identity, invalidated when
+    any field changes), so callers reusing one OpsPolicy compile it once; alternating
+    between raw policies recompiles on every call, so compile those up front.
+    """
+    global _last_compiled
+    if isinstance(policy, CompiledPolicy):
+        return policy
+    cached = _last_compiled
+    if cached is not None and cached[0] is policy and cached[1] == vars(policy):
+        return cached[2]
+    compiled = compile_policy(policy, validate=False)
+    snapshot = dict(vars(policy))
+    snapshot["saturation_limits"] = dict(policy.saturation_limits)
+    _last_compiled = (policy, snapshot, compiled)
+    return compiled
@@ -0,0 +1,261 @@
+# Decision Ecosystem — ops-health-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Entity registry with idle eviction (TTL / LRU budget) and spill-to-disk for cooldowns."""
+
+import os
+import pickle
+import sqlite3
+import zlib
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass
+
+from ops_health_core.memory import memory_usage, state_memory_usage
+from ops_health_core.model import OpsPolicy, OpsState
+from ops_health_core.policy import CompiledPolicy, as_compiled
+from ops_health_core.scorer import prune_window
+
+
+@dataclass
+class EvictionPolicy:
+    """When OpsRegistry.evict() removes idle entities (any combination; None = off)."""
+
+    idle_ttl_ms: int | None = None  # Entities not accessed for this long
+    max_entities: int | None = None  # LRU cap on resident entities
+    memory_budget_bytes: int | None = None  # LRU cap on resident memory (state_memory_usage)
+
+
+@dataclass
+class EvictionStats:
+    """Outcome of one eviction pass."""
+
+    dropped: int  # Empty window, no active cooldown: forgotten
+    spilled: int  # Empty window, active cooldown: moved to the spill store
+    expired: int  # Spilled records whose cooldown ended (deleted from disk)
+    resident: int  # Resident entities after the pass
+
+
+class SpillStore:
+    """
+    Compact on-disk store for evicted states that still have a cooldown (sqlite3).
+
+    States are pickled and zlib-compressed; only load files written by this
+    process or another trusted one. Not thread-safe (owned by one registry).
+    """
+
+    def __init__(self, path: str | os.PathLike[str] = ":memory:") -> None:
+        self._db = sqlite3.connect(os.fspath(path))
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS spilled ("
+            "entity TEXT PRIMARY KEY, cooldown_until_ms INTEGER NOT NULL, state BLOB NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS spilled_cooldown ON spilled (cooldown_until_ms)"
+        )
+
+    def put(self, entity: str, state: OpsState) -> None:
+        """
+        Spill a state (replaces an existing record for the entity).
+
+        Raises:
+            ValueError: If the state has no cooldown
+        """
+        if state.cooldown_until_ms is None:
+            raise ValueError("only states with a cooldown are spilled")
+        payload = zlib.compress(pickle.dumps(state, pickle.HIGHEST_PROTOCOL))
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO spilled VALUES (?, ?, ?)",
+                (entity, state.cooldown_until_ms, payload),
+            )
+
+    def take(self, entity: str) -> OpsState | None:
+        """Remove and return a spilled state, or None if the entity is not spilled."""
+        row = self._db.execute("SELECT state FROM spilled WHERE entity = ?", (entity,)).fetchone()
+        if row is None:
+            return None
+        with self._db:
+            self._db.execute("DELETE FROM spilled WHERE entity = ?", (entity,))
+        return pickle.loads(zlib.decompress(row[0]))
+
+    def discard_expired(self, now_ms: int) -> int:
+        """Delete records whose cooldown ended at or before now_ms; returns the count."""
+        with self._db:
+            cursor = self._db.execute("DELETE FROM spilled WHERE cooldown_until_ms <= ?", (now_ms,))
+        return cursor.rowcount
+
+    def size_bytes(self) -> int:
+        """Database size on disk (pages in use)."""
+        pages = self._db.execute("PRAGMA page_count").fetchone()[0]
+        return pages * self._db.execute("PRAGMA page_size").fetchone()[0]
+
+    def __contains__(self, entity: object) -> bool:
+        query = "SELECT 1 FROM spilled WHERE entity = ?"
+        return self._db.execute(query, (entity,)).fetchone() is not None
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM spilled").fetchone()[0]
+
+    def close(self) -> None:
+        self._db.close()
+
+
+def _holds_restrictions(state: OpsState, now_ms: int) -> bool:
+    """Drift hold or rate budget below its initial rate: a fresh state would be more permissive."""
+    if state.drift is not None and state.drift.reasons(now_ms):
+        return True
+    return state.rate_budget is not None and not state.rate_budget.recovered(now_ms)
+
+
+def _window_empty(state: OpsState, policy: CompiledPolicy, now_ms: int) -> bool:
+    """Prune the state's windows (as an evaluation would) and check nothing is left."""
+    if any(prune_window(state, policy, now_ms)) or state.latency_samples:
+        return False
+    if state.latency_store is not None and len(state.latency_store):
+        return False
+    if state.latency_overflow is not None and len(state.latency_overflow):
+        return False
+    cutoff_ms = now_ms - policy.window_ms
+    for gauge in state.gauges.values():
+        gauge.prune(cutoff_ms)
+        if len(gauge):
+            return False
+    return True
+
+
+class OpsRegistry(Mapping[str, OpsState]):
+    """
+    Entity id -> OpsState with idle eviction.
+
+    Use state(entity, now_ms) on the event path: it creates, or lazily
+    rehydrates a spilled state, and marks the entity used (LRU order).
+    evict(now_ms) then removes entities whose windows are empty: without an
+    active cooldown they are dropped, with one they are spilled to the
+    SpillStore (kept resident if there is none). Entities with events in the
+    window, an active drift hold, a rate budget still below its initial rate,
+    or attached to a rollup tree are never evicted, so a dropped entity's next
+    signal is never more permissive than the one it would have had, and memory
+    scales with active entities. Drift detector statistics restart on drop.
+
+    The Mapping view (iteration, len, [] and evaluation helpers that take a
+    registry) covers resident entities only; spilled entities are in cooldown
+    and show up again on their next event (or via state()).
+    """
+
+    def __init__(
+        self,
+        policy: OpsPolicy | CompiledPolicy,
+        eviction: EvictionPolicy | None = None,
+        spill: SpillStore | None = None,
+        state_factory: Callable[[], OpsState] = OpsState,
+    ) -> None:
+        self.policy = as_compiled(policy)
+        self.eviction = eviction if eviction is not None else EvictionPolicy()
+        for name in ("idle_ttl_ms", "max_entities", "memory_budget_bytes"):
+            value = getattr(self.eviction, name)
+            if value is not None and value < 0:
+                raise ValueError(f"{name} must be >= 0, got {value}")
+        self.spill = spill
+        self.state_factory = state_factory
+        self.rehydrated = 0
+        self._states: OrderedDict[str, OpsState] = OrderedDict()  # LRU first
+        self._last_seen: dict[str, int] = {}
+
+    def state(self, entity: str, now_ms: int) -> OpsState:
+        """
+        State of an entity for recording (created or rehydrated on demand).
+
+        Args:
+            entity: Entity id
+            now_ms: Current time (ms), used for idle tracking
+
+        Returns:
+            The entity's resident OpsState
+        """
+        state = self._states.get(entity)
+        if state is not None:
+            self._states.move_to_end(entity)
+        else:
+            state = self.spill.take(entity) if self.spill is not None else None
+            if state is not None:
+                self.rehydrated += 1
+            else:
+                state = self.state_factory()
+            self._states[entity] = state
+        self._last_seen[entity] = now_ms
+        return state
+
+    def is_spilled(self, entity: str) -> bool:
+        """Whether the entity currently lives in the spill store."""
+        return self.spill is not None and entity not in self._states and entity in self.spill
+
+    def evict(self, now_ms: int) -> EvictionStats:
+        """
+        Run one eviction pass (least recently used first).
+
+        TTL evicts idle entities; max_entities and memory_budget_bytes keep
+        evicting eligible entities in LRU order until the registry is within
+        budget (it may stay above it if too many entities are active).
+
+        Args:
+            now_ms: Current time (ms)
+
+        Returns:
+            EvictionStats
+        """
+        policy = self.eviction
+        expired = self.spill.discard_expired(now_ms) if self.spill is not None else 0
+        sizes: dict[str, int] = {}
+        total = 0
+        if policy.memory_budget_bytes is not None:
+            sizes = {entity: state_memory_usage(s) for entity, s in self._states.items()}
+            total = sum(sizes.values())
+
+        def over_budget() -> bool:
+            if policy.max_entities is not None and len(self._states) > policy.max_entities:
+                return True
+            return policy.memory_budget_bytes is not None and total > policy.memory_budget_bytes
+
+        dropped = spilled = 0
+        for entity in list(self._states):
+            idle = (
+                policy.idle_ttl_ms is not None
+                and now_ms - self._last_seen[entity] >= policy.idle_ttl_ms
+            )
+            if not idle and not over_budget():
+                if policy.idle_ttl_ms is None:
+                    break  # Within budget and no TTL: nothing else to evict
+                continue
+            state = self._states[entity]
+            if (
+                state.rollup is not None
+                or _holds_restrictions(state, now_ms)
+                or not _window_empty(state, self.policy, now_ms)
+            ):
+                continue
+            cooldown = state.cooldown_until_ms
+            if cooldown is not None and now_ms < cooldown:
+                if self.spill is None:
+                    continue
+                self.spill.put(entity, state)
+                spilled += 1
+            else:
+                dropped += 1
+            del self._states[entity]
+            del self._last_seen[entity]
+            total -= sizes.get(entity, 0)
+        return EvictionStats(dropped, spilled, expired, len(self._states))
+
+    def memory_usage(self) -> int:
+        """Approximate memory footprint of the resident states (bytes)."""
+        return memory_usage(self._states)
+
+    def __getitem__(self, entity: str) -> OpsState:
+        return self._states[entity]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._states)
+
+    def __len__(self) -> int:
+        return len(self._states)
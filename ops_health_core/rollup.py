@@ -0,0 +1,161 @@
+# Decision Ecosystem — ops-health-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Hierarchical health rollup (instance -> service -> fleet)."""
+
+import heapq
+import logging
+
+from ops_health_core.kill_switch import apply_kill_switch, fail_closed_signal
+from ops_health_core.latency import LatencyHistogram
+from ops_health_core.model import HealthState, OpsPolicy, OpsSignal
+from ops_health_core.policy import CompiledPolicy, as_compiled
+from ops_health_core.scorer import score_from_counts
+
+logger = logging.getLogger(__name__)
+
+_ERRORS, _RATE_LIMITS, _RECONNECTS = 0, 1, 2
+
+
+class RollupNode:
+    """
+    Node of a health rollup tree.
+
+    Events recorded on a node (usually a leaf attached as OpsState.rollup) are
+    pushed as count and histogram deltas to every ancestor: O(depth) per event.
+    Each node keeps time-sliced counters and a LatencyHistogram for its subtree,
+    so reading any node's score is O(1) when cached and recomputation only
+    happens on nodes along a changed leaf's path (or when a slice expires).
+
+    Windows expire by whole slices, so up to one slice width of older events may
+    still count (conservative: never under-counts). Saturation and drift are
+    per-state signals and are not rolled up.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        policy: OpsPolicy | CompiledPolicy,
+        parent: "RollupNode | None" = None,
+        slices: int = 16,
+    ) -> None:
+        self.name = name
+        self.policy = as_compiled(policy)
+        self.parent = parent
+        self.children: dict[str, RollupNode] = {}
+        self.cooldown_until_ms: int | None = None
+        self.num_slices = slices
+        self.slice_ms = -(-self.policy.window_ms // slices)
+        self.latency = LatencyHistogram(self.policy.window_ms, slices)
+        self._slices: dict[int, list[int]] = {}  # slice id -> [errors, 429, reconnects]
+        self._slice_heap: list[int] = []
+        self._totals = [0, 0, 0]
+        self._low_water_ms: int | None = None
+        self._cached: tuple[float, HealthState] | None = None
+        if parent is not None:
+            parent.children[name] = self
+
+    def child(self, name: str) -> "RollupNode":
+        """Get or create a child node sharing this node's policy and slicing."""
+        node = self.children.get(name)
+        if node is None:
+            node = RollupNode(name, self.policy, parent=self, slices=self.num_slices)
+        return node
+
+    def path(self) -> list[str]:
+        """Names from the root to this node."""
+        names = []
+        node: RollupNode | None = self
+        while node is not None:
+            names.append(node.name)
+            node = node.parent
+        return names[::-1]
+
+    # --- recording (propagates to ancestors) ---
+
+    def _add_count(self, kind: int, ts_ms: int, count: int) -> None:
+        node: RollupNode | None = self
+        while node is not None:
+            if node._low_water_ms is None or ts_ms >= node._low_water_ms:
+                slice_id = ts_ms // node.slice_ms
+                counts = node._slices.get(slice_id)
+                if counts is None:
+                    counts = node._slices[slice_id] = [0, 0, 0]
+                    heapq.heappush(node._slice_heap, slice_id)
+                counts[kind] += count
+                node._totals[kind] += count
+                node._cached = None
+            node = node.parent
+
+    def record_error(self, ts_ms: int, count: int = 1) -> None:
+        """Record error event(s) on this node and its ancestors."""
+        self._add_count(_ERRORS, ts_ms, count)
+
+    def record_429(self, ts_ms: int, count: int = 1) -> None:
+        """Record rate-limit (429) event(s) on this node and its ancestors."""
+        self._add_count(_RATE_LIMITS, ts_ms, count)
+
+    def record_reconnect(self, ts_ms: int, count: int = 1) -> None:
+        """Record reconnect event(s) on this node and its ancestors."""
+        self._add_count(_RECONNECTS, ts_ms, count)
+
+    def record_latency(self, latency_ms: float, ts_ms: int) -> None:
+        """Record a latency sample on this node and its ancestors."""
+        node: RollupNode | None = self
+        while node is not None:
+            if node._low_water_ms is None or ts_ms >= node._low_water_ms:
+                node.latency.record(latency_ms, ts_ms)
+                node._cached = None
+            node = node.parent
+
+    # --- reading ---
+
+    def _expire(self, now_ms: int) -> None:
+        """Drop slices entirely before the window (O(1) when nothing expires)."""
+        cutoff_ms = now_ms - self.policy.window_ms
+        if self._low_water_ms is not None and cutoff_ms <= self._low_water_ms:
+            return
+        self._low_water_ms = cutoff_ms
+        heap = self._slice_heap
+        expired = False
+        while heap and (heap[0] + 1) * self.slice_ms <= cutoff_ms:
+            counts = self._slices.pop(heapq.heappop(heap))
+            for kind in (_ERRORS, _RATE_LIMITS, _RECONNECTS):
+                self._totals[kind] -= counts[kind]
+            expired = True
+        if len(self.latency):
+            before = len(self.latency)
+            self.latency.prune(cutoff_ms)
+            expired = expired or len(self.latency) != before
+        if expired:
+            self._cached = None
+
+    def counts(self, now_ms: int) -> tuple[int, int, int]:
+        """Windowed (errors, rate_limits, reconnects) for this subtree."""
+        self._expire(now_ms)
+        errors, rate_limits, reconnects = self._totals
+        return errors, rate_limits, reconnects
+
+    def score(self, now_ms: int) -> tuple[float, HealthState]:
+        """
+        Health score and state for this subtree.
+
+        Returns:
+            Tuple of (score [0.0, 1.0], HealthState)
+        """
+        self._expire(now_ms)
+        if self._cached is None:
+            errors, rate_limits, reconnects = self._totals
+            self._cached = score_from_counts(
+                self.policy, errors, rate_limits, reconnects, self.latency.quantile(0.95)
+            )
+        return self._cached
+
+    def evaluate(self, now_ms: int) -> OpsSignal:
+        """Kill-switch decision for this subtree (node keeps its own cooldown; fail-closed)."""
+        try:
+            score, health_state = self.score(now_ms)
+        except Exception as e:
+            logger.warning("Rollup fail-closed on exception: %s", type(e).__name__)
+            return fail_closed_signal()
+        return apply_kill_switch(self, self.policy, score, health_state, now_ms)
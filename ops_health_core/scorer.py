@@ -3,11 +3,243 @@
 # SPDX-License-Identifier: MIT
 """Health score computation."""
 
-from ops_health_core.model import HealthState, OpsPolicy, OpsState
+import heapq
+from bisect import bisect_left
+from itertools import compress, islice
+
+from ops_health_core.gauges import WindowedGauge
+from ops_health_core.model import (
+    EVENT_429,
+    EVENT_ERROR,
+    EVENT_RECONNECT,
+    HealthState,
+    OpsPolicy,
+    OpsState,
+)
+from ops_health_core.policy import CompiledPolicy, as_compiled
+
+
+def score_from_counts(
+    policy: CompiledPolicy,
+    errors: int,
+    rate_limits: int,
+    reconnects: int,
+    p95_latency_ms: float | None = None,
+    p_saturation: float = 0.0,
+    p_drift: float = 0.0,
+) -> tuple[float, HealthState]:
+    """
+    Compute health score and state from windowed counts (straight-line arithmetic).
+
+    Args:
+        policy: Compiled ops policy
+        errors: Error events in window
+        rate_limits: Rate-limit (429) events in window
+        reconnects: Reconnect events in window
+        p95_latency_ms: p95 latency in window (None if no samples)
+        p_saturation: Saturation penalty [0, 1] (see saturation_penalty)
+        p_drift: Drift penalty [0, 1] (1.0 while a drift flag is raised)
+
+    Returns:
+        Tuple of (score [0.0, 1.0], HealthState)
+    """
+    p_err = min(1.0, errors / policy.max_errors)
+    p_429 = min(1.0, rate_limits / policy.max_429)
+    p_rec = min(1.0, reconnects / policy.max_reconnects)
+    p_lat = 0.0
+    max_p95 = policy.max_p95_latency_ms
+    if p95_latency_ms is not None and p95_latency_ms > max_p95:
+        p_lat = min(1.0, (p95_latency_ms - max_p95) / max_p95)
+
+    w_err, w_429, w_rec, w_lat = policy.weights
+    score = 1.0 - (
+        w_err * p_err
+        + w_429 * p_429
+        + w_rec * p_rec
+        + w_lat * p_lat
+        + policy.weight_saturation * p_saturation
+        + policy.weight_drift * p_drift
+    )
+
+    # Clamp to [0, 1]
+    score = max(0.0, min(1.0, score))
+
+    # Determine state
+    if score >= policy.threshold_yellow:
+        health_state = HealthState.GREEN
+    elif score >= policy.threshold_red:
+        health_state = HealthState.YELLOW
+    else:
+        health_state = HealthState.RED
+
+    return score, health_state
+
+
+def saturation_penalty(
+    gauges: dict[str, WindowedGauge], policy: CompiledPolicy, now_ms: int
+) -> float:
+    """
+    Saturation penalty from windowed gauges.
+
+    Formula:
+        level = (time_weighted_avg + windowed_max) / 2
+        p_sat = max over limited gauges of min(1, level / limit)
+
+    Args:
+        gauges: Gauges by name (pruned to the policy window here)
+        policy: Compiled ops policy
+        now_ms: Current time (ms)
+
+    Returns:
+        Penalty in [0, 1]
+    """
+    p_sat = 0.0
+    for name, inv_limit in policy.saturation_limits:
+        gauge = gauges.get(name)
+        if gauge is None:
+            continue
+        stats = gauge.stats(now_ms, policy.window_ms)
+        if stats is None:
+            continue
+        average, peak = stats
+        p_sat = max(p_sat, min(1.0, 0.5 * (average + peak) * inv_limit))
+    return p_sat
+
+
+def _aggregated_count(state: OpsState, kind: str, cutoff_ms: int) -> int:
+    counted = state.aggregated.get(kind)
+    return counted.count_since(cutoff_ms) if counted is not None else 0
+
+
+def merged_quantile(
+    sorted_samples: list[float], buckets: list[tuple[int, int]], q: float
+) -> float | None:
+    """
+    Quantile over exact samples merged with histogram buckets.
+
+    Args:
+        sorted_samples: Exact samples, ascending
+        buckets: (value, count) pairs, ascending (LatencyHistogram.buckets())
+        q: Quantile in [0, 1]
+
+    Returns:
+        Value at rank min(int(q*n), n-1), or None if both are empty
+    """
+    n = len(sorted_samples) + sum(count for _, count in buckets)
+    if n == 0:
+        return None
+    rank = min(int(q * n), n - 1)
+    i = j = 0
+    cumulative = 0
+    while True:
+        if j == len(buckets) or (i < len(sorted_samples) and sorted_samples[i] <= buckets[j][0]):
+            value = sorted_samples[i]
+            cumulative += 1
+            i += 1
+        else:
+            value, count = buckets[j]
+            cumulative += count
+            j += 1
+        if cumulative > rank:
+            return value
+
+
+def _expired_prefix(timestamps: list[int], cutoff_ms: int) -> int | None:
+    """
+    Number k of expired timestamps if exactly the first k are < cutoff_ms, else None.
+
+    Holds for time-ordered lists (the usual case) and is verified, so out-of-order
+    lists fall back to filtering. C-level scans only; no per-element allocation.
+    """
+    k = bisect_left(timestamps, cutoff_ms)
+    if k and max(islice(timestamps, k)) >= cutoff_ms:
+        return None
+    if k < len(timestamps) and min(islice(timestamps, k, None)) < cutoff_ms:
+        return None
+    return k
+
+
+def _prune_count(timestamps: list[int], cutoff_ms: int) -> int:
+    """Drop timestamps < cutoff_ms in place and return how many remain."""
+    k = _expired_prefix(timestamps, cutoff_ms)
+    if k is None:
+        timestamps[:] = [ts for ts in timestamps if ts >= cutoff_ms]
+    elif k:
+        del timestamps[:k]
+    return len(timestamps)
+
+
+def _prune_latency_lists(state: OpsState, cutoff_ms: int) -> None:
+    """Prune latency_samples/latency_timestamps together (P1 fix)."""
+    samples = state.latency_samples
+    timestamps = state.latency_timestamps
+    if samples and timestamps:
+        if len(samples) == len(timestamps):
+            k = _expired_prefix(timestamps, cutoff_ms)
+            if k is not None:
+                del samples[:k]
+                del timestamps[:k]
+                return
+        # Keep only samples with timestamps within window (truncates to the shorter list)
+        keep = [ts >= cutoff_ms for ts in timestamps[: len(samples)]]
+        samples[:] = compress(samples, keep)
+        timestamps[:] = compress(timestamps, keep)
+    elif timestamps:
+        # Only timestamps exist, prune them
+        _prune_count(timestamps, cutoff_ms)
+    elif samples:
+        # Only samples exist (legacy), clear them
+        samples.clear()
+
+
+def _list_p95(samples: list[int]) -> float | None:
+    """Value at rank min(int(0.95*n), n-1) of ascending samples, without a full sort."""
+    n = len(samples)
+    if n == 0:
+        return None
+    rank = min(int(0.95 * n), n - 1)
+    # The rank-th smallest is the (n - rank)-th largest: a heap of ~5% of n
+    return heapq.nlargest(n - rank, samples)[-1]
+
+
+def prune_window(state: OpsState, policy: CompiledPolicy, now_ms: int) -> tuple[int, int, int]:
+    """
+    Prune all windowed state in place and return the windowed event counts.
+
+    Each event list is walked once: the pruned list's length is its count. Latency
+    samples and timestamps are pruned together; attached stores, aggregated counts
+    and the latency overflow are pruned by cutoff.
+
+    Args:
+        state: Ops state (mutated)
+        policy: Compiled ops policy
+        now_ms: Current time (ms)
+
+    Returns:
+        Tuple of (errors, rate_limits, reconnects) in window
+    """
+    cutoff_ms = now_ms - policy.window_ms
+    errors = _prune_count(state.error_timestamps, cutoff_ms)
+    rate_limits = _prune_count(state.rate_limit_timestamps, cutoff_ms)
+    reconnects = _prune_count(state.reconnect_timestamps, cutoff_ms)
+    if state.latency_store is not None:
+        state.latency_store.prune(cutoff_ms)
+    if state.aggregated:
+        totals = {}
+        for kind, counted in state.aggregated.items():
+            counted.prune(cutoff_ms)
+            totals[kind] = counted.total()  # All remaining entries are in window
+        errors += totals.get(EVENT_ERROR, 0)
+        rate_limits += totals.get(EVENT_429, 0)
+        reconnects += totals.get(EVENT_RECONNECT, 0)
+    if state.latency_overflow is not None:
+        state.latency_overflow.prune(cutoff_ms)
+    _prune_latency_lists(state, cutoff_ms)
+    return errors, rate_limits, reconnects
 
 
 def compute_health_score(
-    state: OpsState, policy: OpsPolicy, now_ms: int
+    state: OpsState, policy: OpsPolicy | CompiledPolicy, now_ms: int, prune: bool = False
 ) -> tuple[float, HealthState]:
     """
     Compute health score and state.
@@ -17,73 +249,60 @@ def compute_health_score(
         p_429 = min(1, rl/max_429)
         p_rec = min(1, rec/max_reconnects)
         p_lat = min(1, max(0, (p95_latency - max_p95_latency) / max_p95_latency))
-        score = 1 - (w1*p_err + w2*p_429 + w3*p_rec + w4*p_lat)
+        score = 1 - (w1*p_err + w2*p_429 + w3*p_rec + w4*p_lat + w5*p_sat + w6*p_drift)
 
     Args:
         state: Current ops state
-        policy: Ops policy
+        policy: Ops policy (raw or compiled; compile once for hot paths)
         now_ms: Current time (ms)
+        prune: Prune the state in the same pass (see prune_window); used by
+            update_kill_switch. Without it the state is only read.
 
     Returns:
         Tuple of (score [0.0, 1.0], HealthState)
     """
     from ops_health_core.windows import count_in_window
 
-    # Count events in window
-    errors = count_in_window(state.error_timestamps, now_ms, policy.window_ms)
-    rate_limits = count_in_window(state.rate_limit_timestamps, now_ms, policy.window_ms)
-    reconnects = count_in_window(state.reconnect_timestamps, now_ms, policy.window_ms)
+    compiled = as_compiled(policy)
 
-    # Compute normalized penalties
-    p_err = (
-        min(1.0, errors / policy.max_errors_per_window) if policy.max_errors_per_window > 0 else 0.0
-    )
-    p_429 = (
-        min(1.0, rate_limits / policy.max_429_per_window) if policy.max_429_per_window > 0 else 0.0
-    )
-    p_rec = (
-        min(1.0, reconnects / policy.max_reconnects_per_window)
-        if policy.max_reconnects_per_window > 0
-        else 0.0
-    )
+    if prune:
+        errors, rate_limits, reconnects = prune_window(state, compiled, now_ms)
+    else:
+        # Count events in window (plus aggregated counts collapsed by OpsState.max_events)
+        errors = count_in_window(state.error_timestamps, now_ms, compiled.window_ms)
+        rate_limits = count_in_window(state.rate_limit_timestamps, now_ms, compiled.window_ms)
+        reconnects = count_in_window(state.reconnect_timestamps, now_ms, compiled.window_ms)
+        if state.aggregated:
+            cutoff_ms = now_ms - compiled.window_ms
+            errors += _aggregated_count(state, EVENT_ERROR, cutoff_ms)
+            rate_limits += _aggregated_count(state, EVENT_429, cutoff_ms)
+            reconnects += _aggregated_count(state, EVENT_RECONNECT, cutoff_ms)
 
     # Latency penalty (window-based pruning, P1 fix)
     # Note: latency_samples and latency_timestamps are pruned together in kill_switch.py
     # Here we compute p95 on windowed samples (already pruned by kill_switch)
-    p_lat = 0.0
-    if state.latency_samples and state.latency_timestamps:
-        # Ensure same length (defensive check)
+    p95_latency = None
+    if state.latency_store is not None:
+        # Windowed store (pruned by kill_switch); O(buckets) or better, no sort
+        p95_latency = state.latency_store.quantile(0.95)
+    elif state.latency_overflow is not None and len(state.latency_overflow):
         min_len = min(len(state.latency_samples), len(state.latency_timestamps))
-        if min_len > 0:
-            windowed_samples = state.latency_samples[:min_len]
-            sorted_latencies = sorted(windowed_samples)
-            n = len(sorted_latencies)
-            if n > 0:
-                p95_idx = int(0.95 * n)
-                p95_latency = sorted_latencies[min(p95_idx, n - 1)]
-                # Guard: avoid division by zero when max_p95_latency_ms is 0 or negative
-                if policy.max_p95_latency_ms > 0 and p95_latency > policy.max_p95_latency_ms:
-                    p_lat = min(
-                        1.0, (p95_latency - policy.max_p95_latency_ms) / policy.max_p95_latency_ms
-                    )
-
-    # Weighted score
-    score = 1.0 - (
-        policy.weight_errors * p_err
-        + policy.weight_429 * p_429
-        + policy.weight_reconnects * p_rec
-        + policy.weight_latency * p_lat
-    )
+        p95_latency = merged_quantile(
+            sorted(state.latency_samples[:min_len]), state.latency_overflow.buckets(), 0.95
+        )
+    elif state.latency_samples and state.latency_timestamps:
+        # Ensure same length (defensive check; equal after pruning)
+        samples = state.latency_samples
+        if len(samples) != len(state.latency_timestamps):
+            samples = samples[: len(state.latency_timestamps)]
+        p95_latency = _list_p95(samples)
 
-    # Clamp to [0, 1]
-    score = max(0.0, min(1.0, score))
+    p_sat = 0.0
+    if compiled.weight_saturation and state.gauges:
+        p_sat = saturation_penalty(state.gauges, compiled, now_ms)
 
-    # Determine state
-    if score >= policy.score_threshold_yellow:
-        health_state = HealthState.GREEN
-    elif score >= policy.score_threshold_red:
-        health_state = HealthState.YELLOW
-    else:
-        health_state = HealthState.RED
+    p_drift = 0.0
+    if compiled.weight_drift and state.drift is not None and state.drift.reasons(now_ms):
+        p_drift = 1.0
 
-    return score, health_state
+    return score_from_counts(compiled, errors, rate_limits, reconnects, p95_latency, p_sat, p_drift)
@@ -0,0 +1,237 @@
+# Decision Ecosystem — ops-health-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Copy-on-write state snapshots (RCU-style: writers publish, readers never lock)."""
+
+import heapq
+import logging
+import threading
+from dataclasses import dataclass
+
+from ops_health_core.kill_switch import CooldownHolder, apply_kill_switch, fail_closed_signal
+from ops_health_core.model import HealthState, OpsPolicy, OpsSignal
+from ops_health_core.policy import CompiledPolicy, as_compiled
+from ops_health_core.scorer import score_from_counts
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class Chunk:
+    """Immutable run of events; latency chunks carry values aligned with ts."""
+
+    min_ts: int
+    max_ts: int
+    ts: tuple[int, ...]
+    values: tuple[float, ...] = ()
+
+    def count_since(self, cutoff_ms: int) -> int:
+        if self.min_ts >= cutoff_ms:
+            return len(self.ts)
+        if self.max_ts < cutoff_ms:
+            return 0
+        return sum(1 for ts in self.ts if ts >= cutoff_ms)
+
+    def values_since(self, cutoff_ms: int) -> tuple[float, ...] | list[float]:
+        if self.min_ts >= cutoff_ms:
+            return self.values
+        return [v for v, ts in zip(self.values, self.ts, strict=True) if ts >= cutoff_ms]
+
+
+def _chunk(ts: list[int], values: list[float] | None = None) -> Chunk:
+    return Chunk(min(ts), max(ts), tuple(ts), tuple(values) if values is not None else ())
+
+
+def _live(chunks: tuple[Chunk, ...], cutoff_ms: int) -> tuple[Chunk, ...]:
+    """Drop chunks entirely before cutoff_ms (shares the rest)."""
+    if not chunks or all(c.max_ts >= cutoff_ms for c in chunks):
+        return chunks
+    return tuple(c for c in chunks if c.max_ts >= cutoff_ms)
+
+
+@dataclass(frozen=True, slots=True)
+class OpsSnapshot:
+    """
+    Immutable, structurally shared view of the recorded events.
+
+    Successive snapshots share every chunk they have in common, so publishing
+    costs O(chunks), not O(events). Latency values and timestamps live in the
+    same chunks, so a snapshot can never be torn between them.
+    """
+
+    version: int
+    errors: tuple[Chunk, ...] = ()
+    rate_limits: tuple[Chunk, ...] = ()
+    reconnects: tuple[Chunk, ...] = ()
+    latencies: tuple[Chunk, ...] = ()
+
+    def counts(self, cutoff_ms: int) -> tuple[int, int, int]:
+        """Events with ts >= cutoff_ms as (errors, rate_limits, reconnects)."""
+        return (
+            sum(c.count_since(cutoff_ms) for c in self.errors),
+            sum(c.count_since(cutoff_ms) for c in self.rate_limits),
+            sum(c.count_since(cutoff_ms) for c in self.reconnects),
+        )
+
+    def p95_latency(self, cutoff_ms: int) -> float | None:
+        """p95 of latency samples with ts >= cutoff_ms (same rank as compute_health_score)."""
+        values = [
+            v for c in self.latencies if c.max_ts >= cutoff_ms for v in c.values_since(cutoff_ms)
+        ]
+        n = len(values)
+        if n == 0:
+            return None
+        rank = min(int(0.95 * n), n - 1)
+        return heapq.nlargest(n - rank, values)[-1]
+
+    def health_score(
+        self, policy: OpsPolicy | CompiledPolicy, now_ms: int
+    ) -> tuple[float, HealthState]:
+        """
+        Health score and state of this snapshot (pure read, no locks).
+
+        Returns:
+            Tuple of (score [0.0, 1.0], HealthState)
+        """
+        compiled = as_compiled(policy)
+        cutoff_ms = now_ms - compiled.window_ms
+        errors, rate_limits, reconnects = self.counts(cutoff_ms)
+        return score_from_counts(
+            compiled, errors, rate_limits, reconnects, self.p95_latency(cutoff_ms)
+        )
+
+
+def evaluate_snapshot(
+    snapshot: OpsSnapshot,
+    holder: CooldownHolder,
+    policy: OpsPolicy | CompiledPolicy,
+    now_ms: int,
+) -> OpsSignal:
+    """
+    Kill-switch decision on a snapshot (fail-closed).
+
+    Args:
+        snapshot: Published snapshot (e.g. writer.current)
+        holder: Object carrying the evaluator's cooldown_until_ms (mutated)
+        policy: Ops policy
+        now_ms: Current time (ms)
+
+    Returns:
+        OpsSignal with kill switch recommendations
+    """
+    try:
+        compiled = as_compiled(policy)
+        score, health_state = snapshot.health_score(compiled, now_ms)
+    except Exception as e:
+        logger.warning("Snapshot fail-closed on exception: %s", type(e).__name__)
+        return fail_closed_signal()
+    return apply_kill_switch(holder, compiled, score, health_state, now_ms)
+
+
+class OpsStateWriter:
+    """
+    Single owner of the mutable side; publishes OpsSnapshot objects.
+
+    record_* calls append to private pending buffers (writers serialize on a
+    lock). publish() freezes the pending buffers into new chunks, drops chunks
+    that left the window, and swaps `current` with one reference assignment.
+    Readers just read `writer.current` and never lock or copy lists. A publish
+    also happens automatically once `chunk_size` events are pending.
+    """
+
+    def __init__(self, window_ms: int, chunk_size: int = 256) -> None:
+        if window_ms <= 0 or chunk_size <= 0:
+            raise ValueError("window_ms and chunk_size must be > 0")
+        self.window_ms = window_ms
+        self.chunk_size = chunk_size
+        self.current = OpsSnapshot(version=0)
+        self._lock = threading.Lock()
+        self._errors: list[int] = []
+        self._rate_limits: list[int] = []
+        self._reconnects: list[int] = []
+        self._latency_ts: list[int] = []
+        self._latency_values: list[float] = []
+        self._pending = 0
+        self._newest_ms: int | None = None
+
+    def _added(self, ts_ms: int) -> None:
+        if self._newest_ms is None or ts_ms > self._newest_ms:
+            self._newest_ms = ts_ms
+        self._pending += 1
+        if self._pending >= self.chunk_size:
+            self._publish_locked(None)
+
+    def record_error(self, ts_ms: int) -> None:
+        """Record an error event (visible to readers after the next publish)."""
+        with self._lock:
+            self._errors.append(ts_ms)
+            self._added(ts_ms)
+
+    def record_429(self, ts_ms: int) -> None:
+        """Record a rate-limit (429) event."""
+        with self._lock:
+            self._rate_limits.append(ts_ms)
+            self._added(ts_ms)
+
+    def record_reconnect(self, ts_ms: int) -> None:
+        """Record a reconnect event."""
+        with self._lock:
+            self._reconnects.append(ts_ms)
+            self._added(ts_ms)
+
+    def record_latency(self, latency_ms: float, ts_ms: int) -> None:
+        """Record a latency sample (value and timestamp stay paired)."""
+        with self._lock:
+            self._latency_ts.append(ts_ms)
+            self._latency_values.append(latency_ms)
+            self._added(ts_ms)
+
+    def _merged(
+        self,
+        chunks: tuple[Chunk, ...],
+        pending: list[int],
+        values: list[float] | None,
+        cutoff_ms: int | None,
+    ) -> tuple[Chunk, ...]:
+        """Old chunks plus the pending events; a small tail chunk is replaced, never mutated."""
+        if pending:
+            last = chunks[-1] if chunks else None
+            if last is not None and len(last.ts) + len(pending) <= self.chunk_size:
+                merged_values = None if values is None else [*last.values, *values]
+                chunks = (*chunks[:-1], _chunk([*last.ts, *pending], merged_values))
+            else:
+                chunks = (*chunks, _chunk(pending, values))
+        return _live(chunks, cutoff_ms) if cutoff_ms is not None else chunks
+
+    def _publish_locked(self, now_ms: int | None) -> OpsSnapshot:
+        old = self.current
+        reference_ms = now_ms if now_ms is not None else self._newest_ms
+        cutoff_ms = reference_ms - self.window_ms if reference_ms is not None else None
+
+        snapshot = OpsSnapshot(
+            version=old.version + 1,
+            errors=self._merged(old.errors, self._errors, None, cutoff_ms),
+            rate_limits=self._merged(old.rate_limits, self._rate_limits, None, cutoff_ms),
+            reconnects=self._merged(old.reconnects, self._reconnects, None, cutoff_ms),
+            latencies=self._merged(
+                old.latencies, self._latency_ts, self._latency_values, cutoff_ms
+            ),
+        )
+        self._errors, self._rate_limits, self._reconnects = [], [], []
+        self._latency_ts, self._latency_values = [], []
+        self._pending = 0
+        self.current = snapshot  # Single reference swap: readers see old or new, never a mix
+        return snapshot
+
+    def publish(self, now_ms: int | None = None) -> OpsSnapshot:
+        """
+        Publish pending events as a new snapshot.
+
+        Args:
+            now_ms: Current time (ms) for dropping expired chunks (default: newest event)
+
+        Returns:
+            The new current snapshot
+        """
+        with self._lock:
+            return self._publish_locked(now_ms)
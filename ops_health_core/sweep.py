@@ -0,0 +1,247 @@
+# Decision Ecosystem — ops-health-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Vectorized policy sweep: replay one event log against many policies (requires numpy)."""
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from ops_health_core.model import (
+    EVENT_429,
+    EVENT_ERROR,
+    EVENT_RECONNECT,
+    STATE_CODES,
+    HealthState,
+    OpsPolicy,
+)
+from ops_health_core.policy import CompiledPolicy, compile_policy
+
+EVENT_LATENCY = "latency"
+
+_RED = STATE_CODES[HealthState.RED]
+_YELLOW = STATE_CODES[HealthState.YELLOW]
+_GREEN = STATE_CODES[HealthState.GREEN]
+
+
+def _numpy() -> Any:
+    try:
+        import numpy as np
+    except ImportError as e:
+        raise ImportError(
+            "ops_health_core.sweep requires numpy (pip install ops-health-core[numpy])"
+        ) from e
+    return np
+
+
+@dataclass
+class SweepSummary:
+    """Per-policy replay summary."""
+
+    policy: OpsPolicy
+    time_in_red_ms: int  # Sum of evaluation intervals that started in RED
+    time_denied_ms: int  # Same, for deny_actions (RED or cooldown)
+    trips: int  # Cooldown activations
+    false_trips: int | None  # Trips outside every labeled incident (None without labels)
+    missed_incidents: int | None  # Labeled incidents with no trip (None without labels)
+
+
+@dataclass
+class PolicySweep:
+    """Sweep output: (policies x evaluations) arrays plus per-policy summaries."""
+
+    eval_times_ms: Any  # int64 (E,)
+    scores: Any  # float64 (P, E)
+    states: Any  # int8 (P, E), STATE_CODES
+    deny: Any  # bool (P, E)
+    trips: Any  # bool (P, E), cooldown activated at this evaluation
+    summaries: list[SweepSummary]
+
+
+def _event_arrays(events: Iterable[dict[str, Any]]) -> dict[str, Any]:
+    """Split an event log (CLI format) into sorted timestamp arrays per kind."""
+    np = _numpy()
+    timestamps: dict[str, list[int]] = {EVENT_ERROR: [], EVENT_429: [], EVENT_RECONNECT: []}
+    latencies: list[tuple[int, float]] = []
+    for event in events:
+        kind = event["type"]
+        if kind == EVENT_LATENCY:
+            latencies.append((event["ts_ms"], event.get("latency_ms", 0)))
+        elif kind in timestamps:
+            timestamps[kind].append(event["ts_ms"])
+        else:
+            raise ValueError(f"unknown event type: {kind!r}")
+    arrays = {kind: np.sort(np.asarray(ts, dtype=np.int64)) for kind, ts in timestamps.items()}
+    latencies.sort(key=lambda item: item[0])
+    arrays["latency_ts"] = np.asarray([ts for ts, _ in latencies], dtype=np.int64)
+    arrays["latency"] = np.asarray([value for _, value in latencies], dtype=np.float64)
+    return arrays
+
+
+def _window_counts(ts: Any, eval_times: Any, window_ms: int) -> Any:
+    """Events in [now - window_ms, now] for every evaluation time."""
+    np = _numpy()
+    return np.searchsorted(ts, eval_times, side="right") - np.searchsorted(
+        ts, eval_times - window_ms, side="left"
+    )
+
+
+def _window_p95(latency_ts: Any, latency: Any, eval_times: Any, window_ms: int) -> Any:
+    """Windowed p95 for every evaluation time (NaN when the window has no samples)."""
+    np = _numpy()
+    hi = np.searchsorted(latency_ts, eval_times, side="right")
+    lo = np.searchsorted(latency_ts, eval_times - window_ms, side="left")
+    p95 = np.full(len(eval_times), np.nan)
+    for i, (start, stop) in enumerate(zip(lo.tolist(), hi.tolist(), strict=True)):
+        n = stop - start
+        if n > 0:
+            rank = min(int(0.95 * n), n - 1)
+            p95[i] = np.partition(latency[start:stop], rank)[rank]
+    return p95
+
+
+def _scores(group: list[CompiledPolicy], counts: tuple[Any, Any, Any], p95: Any) -> Any:
+    """score_from_counts for a policy group as (P, E) array arithmetic (same operation order)."""
+    np = _numpy()
+
+    def column(values: list[float]) -> Any:
+        return np.asarray(values, dtype=np.float64)[:, None]
+
+    errors, rate_limits, reconnects = counts
+    p_err = np.minimum(1.0, errors[None, :] / column([c.max_errors for c in group]))
+    p_429 = np.minimum(1.0, rate_limits[None, :] / column([c.max_429 for c in group]))
+    p_rec = np.minimum(1.0, reconnects[None, :] / column([c.max_reconnects for c in group]))
+    max_p95 = column([c.max_p95_latency_ms for c in group])
+    with np.errstate(invalid="ignore"):
+        over = p95[None, :] > max_p95  # False where p95 is NaN or max_p95 is inf (disabled)
+        p_lat = np.where(
+            over,
+            np.minimum(1.0, (p95[None, :] - max_p95) / max_p95),
+            0.0,
+        )
+    weights = np.asarray([c.weights for c in group], dtype=np.float64)
+    score = 1.0 - (
+        weights[:, 0:1] * p_err
+        + weights[:, 1:2] * p_429
+        + weights[:, 2:3] * p_rec
+        + weights[:, 3:4] * p_lat
+    )
+    return np.maximum(0.0, np.minimum(1.0, score))
+
+
+def sweep_policies(
+    events: Iterable[dict[str, Any]],
+    policies: Sequence[OpsPolicy],
+    eval_times_ms: Sequence[int],
+    incidents: Sequence[tuple[int, int]] | None = None,
+) -> PolicySweep:
+    """
+    Replay one event log against a grid of policies in a single vectorized pass.
+
+    Equivalent to feeding the events (in timestamp order) into one OpsState per
+    policy and calling update_kill_switch at every evaluation time. Window counts
+    and latency percentiles are computed once per distinct window_ms; scores and
+    states are (policies x evaluations) array arithmetic; the cooldown machine
+    steps through time with one vector operation across policies.
+
+    Saturation and drift penalties depend on live components and are not
+    replayed: policies with weight_saturation or weight_drift are rejected.
+
+    Args:
+        events: Event log, [{"type": "error" | "429" | "reconnect" | "latency",
+            "ts_ms": ..., "latency_ms": ...}, ...]
+        policies: Candidate policies (validated)
+        eval_times_ms: Evaluation times (ms), ascending
+        incidents: Optional labeled incident intervals [(start_ms, end_ms), ...]
+            used to estimate false trips and missed incidents
+
+    Returns:
+        PolicySweep with per-evaluation arrays and per-policy summaries
+
+    Raises:
+        ValueError: If a policy is invalid or uses saturation/drift weights,
+            or eval_times_ms is not ascending
+        ImportError: If numpy is not installed
+    """
+    np = _numpy()
+    compiled = [compile_policy(policy) for policy in policies]
+    for c in compiled:
+        if c.weight_saturation or c.weight_drift:
+            raise ValueError("sweep does not replay saturation or drift penalties")
+    eval_times = np.asarray(eval_times_ms, dtype=np.int64)
+    if len(eval_times) > 1 and np.any(np.diff(eval_times) < 0):
+        raise ValueError("eval_times_ms must be ascending")
+    arrays = _event_arrays(events)
+
+    n_policies, n_evals = len(compiled), len(eval_times)
+    scores = np.empty((n_policies, n_evals), dtype=np.float64)
+
+    # Shared window statistics: one pass per distinct window
+    by_window: dict[int, list[int]] = {}
+    for i, c in enumerate(compiled):
+        by_window.setdefault(c.window_ms, []).append(i)
+    for window_ms, rows in by_window.items():
+        counts = tuple(
+            _window_counts(arrays[kind], eval_times, window_ms)
+            for kind in (EVENT_ERROR, EVENT_429, EVENT_RECONNECT)
+        )
+        p95 = _window_p95(arrays["latency_ts"], arrays["latency"], eval_times, window_ms)
+        scores[rows] = _scores([compiled[i] for i in rows], counts, p95)
+
+    thresholds_red = np.asarray([c.threshold_red for c in compiled])[:, None]
+    thresholds_yellow = np.asarray([c.threshold_yellow for c in compiled])[:, None]
+    states = np.where(
+        scores >= thresholds_yellow, _GREEN, np.where(scores >= thresholds_red, _YELLOW, _RED)
+    ).astype(np.int8)
+    red = states == _RED
+
+    # Cooldown machine (apply_kill_switch), vectorized across policies
+    cooldown_ms = np.asarray([c.cooldown_ms for c in compiled], dtype=np.int64)
+    cooldown_until = np.zeros(n_policies, dtype=np.int64)
+    has_cooldown = np.zeros(n_policies, dtype=bool)
+    deny = np.empty((n_policies, n_evals), dtype=bool)
+    trips = np.empty((n_policies, n_evals), dtype=bool)
+    for j, now in enumerate(eval_times.tolist()):
+        in_cooldown = has_cooldown & (now < cooldown_until)
+        trip = red[:, j] & ~in_cooldown
+        cooldown_until = np.where(trip, now + cooldown_ms, cooldown_until)
+        has_cooldown |= trip
+        expired = has_cooldown & (now >= cooldown_until)
+        has_cooldown &= ~expired
+        in_cooldown &= ~expired
+        deny[:, j] = in_cooldown | red[:, j]
+        trips[:, j] = trip
+
+    durations = np.zeros(n_evals, dtype=np.int64)
+    if n_evals > 1:
+        durations[:-1] = np.diff(eval_times)
+    time_in_red = red @ durations
+    time_denied = deny @ durations
+
+    in_incident = None
+    if incidents is not None:
+        in_incident = np.zeros(n_evals, dtype=bool)
+        for start_ms, end_ms in incidents:
+            in_incident |= (eval_times >= start_ms) & (eval_times <= end_ms)
+
+    summaries = []
+    for i, c in enumerate(compiled):
+        false_trips = missed = None
+        if in_incident is not None:
+            false_trips = int(np.count_nonzero(trips[i] & ~in_incident))
+            missed = sum(
+                1
+                for start_ms, end_ms in incidents or ()
+                if not np.any(trips[i] & (eval_times >= start_ms) & (eval_times <= end_ms))
+            )
+        summaries.append(
+            SweepSummary(
+                policy=c.source,
+                time_in_red_ms=int(time_in_red[i]),
+                time_denied_ms=int(time_denied[i]),
+                trips=int(np.count_nonzero(trips[i])),
+                false_trips=false_trips,
+                missed_incidents=missed,
+            )
+        )
+    return PolicySweep(eval_times, scores, states, deny, trips, summaries)
@@ -3,6 +3,10 @@
 # SPDX-License-Identifier: MIT
 """Sliding window counters."""
 
+import sys
+from array import array
+from typing import Any
+
 
 def prune_timestamps(timestamps: list[int], now_ms: int, window_ms: int) -> list[int]:
     """
@@ -48,3 +52,150 @@ def count_in_window(timestamps: list[int], now_ms: int, window_ms: int) -> int:
     """
     pruned = prune_timestamps(timestamps, now_ms, window_ms)
     return len(pruned)
+
+
+def as_int64_array(values: Any) -> array:
+    """
+    Convert timestamps/counts to array('q'), copying raw bytes when possible.
+
+    Accepts array('q'), C-contiguous 1-D int64 buffers (NumPy int64 arrays) in one
+    bulk copy, and any other iterable of ints element-wise.
+
+    Raises:
+        TypeError: If values are not integers
+    """
+    if isinstance(values, array) and values.typecode == "q":
+        return values
+    try:
+        view = memoryview(values)
+    except TypeError:
+        return array("q", values)
+    int64 = view.ndim == 1 and view.itemsize == 8 and view.format.lstrip("<=@") in ("q", "l")
+    if int64 and view.c_contiguous:
+        out = array("q")
+        out.frombytes(view.cast("B"))
+        return out
+    return array("q", view.tolist())
+
+
+class CountedTimestamps:
+    """
+    Aggregated event counts as (timestamp, count) entries.
+
+    Used for events that were collapsed out of a capped timestamp list (OpsState.max_events)
+    or ingested pre-aggregated. Stored in compact int64 arrays; one entry may stand for
+    many events.
+    """
+
+    __slots__ = ("counts", "ts")
+
+    def __init__(self) -> None:
+        self.ts = array("q")
+        self.counts = array("q")
+
+    def add(self, ts_ms: int, count: int = 1) -> None:
+        """Add count events at ts_ms."""
+        self.ts.append(ts_ms)
+        self.counts.append(count)
+
+    def extend(self, ts: Any, counts: Any = None) -> None:
+        """
+        Add many entries at once (bulk copy; counts are never expanded).
+
+        Args:
+            ts: Timestamps (ms) - array('q'), NumPy int64 array or iterable of ints
+            counts: Events per timestamp (same length as ts); None means 1 each
+
+        Raises:
+            ValueError: If lengths differ or a count is negative
+        """
+        ts_values = as_int64_array(ts)
+        if counts is None:
+            count_values = array("q", [1]) * len(ts_values)
+        else:
+            count_values = as_int64_array(counts)
+            if len(count_values) != len(ts_values):
+                raise ValueError("ts and counts must have the same length")
+            if count_values and min(count_values) < 0:
+                raise ValueError("counts must be >= 0")
+        self.ts.extend(ts_values)
+        self.counts.extend(count_values)
+
+    def prune(self, cutoff_ms: int) -> None:
+        """Drop entries with ts < cutoff_ms."""
+        if not self.ts or min(self.ts) >= cutoff_ms:
+            return
+        keep = [i for i, ts in enumerate(self.ts) if ts >= cutoff_ms]
+        self.ts = array("q", [self.ts[i] for i in keep])
+        self.counts = array("q", [self.counts[i] for i in keep])
+
+    def count_since(self, cutoff_ms: int) -> int:
+        """Total count of entries with ts >= cutoff_ms."""
+        return sum(c for ts, c in zip(self.ts, self.counts, strict=True) if ts >= cutoff_ms)
+
+    def compact(self, bucket_ms: int) -> None:
+        """Merge entries sharing a bucket_ms bucket (keeps the newest timestamp per bucket)."""
+        buckets: dict[int, list[int]] = {}
+        for ts, count in zip(self.ts, self.counts, strict=True):
+            entry = buckets.get(ts // bucket_ms)
+            if entry is None:
+                buckets[ts // bucket_ms] = [ts, count]
+            else:
+                entry[0] = max(entry[0], ts)
+                entry[1] += count
+        self.ts = array("q", [entry[0] for entry in buckets.values()])
+        self.counts = array("q", [entry[1] for entry in buckets.values()])
+
+    def shrink(self, max_entries: int, bucket_ms: int) -> None:
+        """
+        Compact into at most max_entries entries, doubling bucket_ms until they fit.
+
+        Coarser buckets still keep the newest timestamp, so events may only stay in
+        the window longer (fail-closed). At least 2 entries are kept (any span fits
+        in two buckets once bucket_ms exceeds it).
+        """
+        max_entries = max(2, max_entries)
+        self.compact(bucket_ms)
+        while len(self.ts) > max_entries:
+            bucket_ms *= 2
+            self.compact(bucket_ms)
+
+    def total(self) -> int:
+        """Total count of all entries."""
+        return sum(self.counts)
+
+    def memory_usage(self) -> int:
+        """Approximate memory footprint (bytes)."""
+        return sys.getsizeof(self) + sys.getsizeof(self.ts) + sys.getsizeof(self.counts)
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+
+def collapse_timestamps(
+    timestamps: list[int], into: CountedTimestamps, n: int, bucket_ms: int
+) -> None:
+    """
+    Collapse the first n timestamps into aggregated counts (mutates both).
+
+    Each bucket of bucket_ms becomes one entry stamped with the newest timestamp
+    of the bucket, so collapsed events never leave the window earlier than they
+    would have individually (fail-closed: counts may only be over-estimated).
+
+    Args:
+        timestamps: Timestamp list (oldest first) - first n items are removed
+        into: Aggregated counts receiving the collapsed events
+        n: Number of timestamps to collapse
+        bucket_ms: Aggregation granularity (ms)
+    """
+    buckets: dict[int, list[int]] = {}
+    for ts in timestamps[:n]:
+        entry = buckets.get(ts // bucket_ms)
+        if entry is None:
+            buckets[ts // bucket_ms] = [ts, 1]
+        else:
+            entry[0] = max(entry[0], ts)
+            entry[1] += 1
+    for newest, count in buckets.values():
+        into.add(newest, count)
+    del timestamps[:n]
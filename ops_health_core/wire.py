@@ -0,0 +1,286 @@
+# Decision Ecosystem — ops-health-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Compact binary wire format for OpsSignal."""
+
+import math
+import struct
+from typing import Any
+
+from decision_schema.types import Action
+
+from ops_health_core.latency import SUMMARY_QUANTILES
+from ops_health_core.model import (
+    REASON_OTHER_BIT,
+    STATE_CODES,
+    STATES_BY_CODE,
+    HealthState,
+    OpsSignal,
+    flags_to_reasons,
+    reasons_to_flags,
+)
+
+WIRE_VERSION = 1
+
+# Fixed header (24 bytes, little-endian):
+#   u8 version | u8 state code | u8 flags | u8 action code | u32 reason flags
+#   f64 score | i64 cooldown_until_ms (valid if FLAG_COOLDOWN)
+# Optional sections follow in this order when their flag is set:
+#   FLAG_RATE         f64 recommended_rate_per_s
+#   FLAG_PERCENTILES  4 x f64 p50, p95, p99, max
+#   FLAG_SAMPLING     2 x f64 latency_sample_rate, latency_rank_error (NaN = None)
+#   FLAG_REASON_LIST  u16 count, then per reason u16 length + UTF-8 (exact list)
+_HEADER = struct.Struct("<4BLdq")  # L is 4 bytes in standard size mode
+_U32 = struct.Struct("<L")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+_PERCENTILES = struct.Struct("<4d")
+_SAMPLING = struct.Struct("<2d")
+_U16 = struct.Struct("<H")
+
+FLAG_DENY = 1 << 0
+FLAG_COOLDOWN = 1 << 1
+FLAG_RATE = 1 << 2
+FLAG_PERCENTILES = 1 << 3
+FLAG_SAMPLING = 1 << 4
+FLAG_REASON_LIST = 1 << 5
+
+PERCENTILE_NAMES: tuple[str, ...] = (*SUMMARY_QUANTILES, "max")
+
+_ACTIONS: tuple[Action, ...] = tuple(Action)
+_ACTION_CODES: dict[Action, int] = {action: i for i, action in enumerate(_ACTIONS)}
+
+
+def encode_signal(signal: OpsSignal) -> bytes:
+    """
+    Encode a signal into the binary wire format.
+
+    Known reasons in canonical order travel as reason flags only; any other
+    reason list is carried verbatim so decoding is always exact.
+
+    Args:
+        signal: Ops signal
+
+    Returns:
+        Encoded bytes (24 bytes for a signal without optional fields)
+
+    Raises:
+        ValueError: If latency_percentiles keys differ from PERCENTILE_NAMES
+    """
+    flags = FLAG_DENY if signal.deny_actions else 0
+    cooldown = signal.cooldown_until_ms
+    if cooldown is not None:
+        flags |= FLAG_COOLDOWN
+    reason_flags = reasons_to_flags(signal.reasons) if signal.reasons else 0
+    parts = []
+    if signal.recommended_rate_per_s is not None:
+        flags |= FLAG_RATE
+        parts.append(_F64.pack(signal.recommended_rate_per_s))
+    percentiles = signal.latency_percentiles
+    if percentiles is not None:
+        if tuple(percentiles) != PERCENTILE_NAMES:
+            raise ValueError(f"latency_percentiles keys must be {PERCENTILE_NAMES}")
+        flags |= FLAG_PERCENTILES
+        parts.append(_PERCENTILES.pack(*percentiles.values()))
+    if signal.latency_sample_rate is not None:
+        flags |= FLAG_SAMPLING
+        rank_error = signal.latency_rank_error
+        parts.append(
+            _SAMPLING.pack(
+                signal.latency_sample_rate, float("nan") if rank_error is None else rank_error
+            )
+        )
+    if reason_flags & REASON_OTHER_BIT or (
+        reason_flags and flags_to_reasons(reason_flags) != signal.reasons
+    ):
+        flags |= FLAG_REASON_LIST
+        parts.append(_U16.pack(len(signal.reasons)))
+        for reason in signal.reasons:
+            text = reason.encode("utf-8")
+            parts.append(_U16.pack(len(text)) + text)
+    header = _HEADER.pack(
+        WIRE_VERSION,
+        STATE_CODES[signal.state],
+        flags,
+        _ACTION_CODES[signal.recommended_action],
+        reason_flags,
+        signal.score,
+        0 if cooldown is None else cooldown,
+    )
+    return header + b"".join(parts) if parts else header
+
+
+class SignalView:
+    """
+    Read-only view over an encoded signal (no copy, fields decoded on access).
+
+    Mirrors the OpsSignal attributes; to_context() and to_signal() materialize it.
+    """
+
+    __slots__ = ("_buffer", "_end", "_flags")
+
+    def __init__(self, buffer: bytes | bytearray | memoryview) -> None:
+        view = memoryview(buffer)
+        if view.format != "B":
+            view = view.cast("B")
+        if view.nbytes < _HEADER.size or view[0] != WIRE_VERSION:
+            raise ValueError("not an ops signal (bad length or version)")
+        if view[1] >= len(STATES_BY_CODE) or view[3] >= len(_ACTIONS):
+            raise ValueError("not an ops signal (unknown state or action code)")
+        self._buffer = view
+        self._flags = view[2]
+        end = self._offset(FLAG_REASON_LIST)
+        if self._flags & FLAG_REASON_LIST:
+            try:
+                (count,) = _U16.unpack_from(view, end)
+                end += _U16.size
+                for _ in range(count):
+                    end += _U16.size + _U16.unpack_from(view, end)[0]
+            except struct.error as e:
+                raise ValueError("truncated ops signal") from e
+        if end > view.nbytes:
+            raise ValueError("truncated ops signal")
+        self._end = end
+
+    def _offset(self, section: int) -> int:
+        """Byte offset of an optional section (sections before it that are present)."""
+        flags = self._flags
+        offset = _HEADER.size
+        if section > FLAG_RATE and flags & FLAG_RATE:
+            offset += _F64.size
+        if section > FLAG_PERCENTILES and flags & FLAG_PERCENTILES:
+            offset += _PERCENTILES.size
+        if section > FLAG_SAMPLING and flags & FLAG_SAMPLING:
+            offset += _SAMPLING.size
+        return offset
+
+    @property
+    def nbytes(self) -> int:
+        """Encoded size (bytes)."""
+        return self._end
+
+    @property
+    def score(self) -> float:
+        return _F64.unpack_from(self._buffer, 8)[0]
+
+    @property
+    def state(self) -> HealthState:
+        return STATES_BY_CODE[self._buffer[1]]
+
+    @property
+    def deny_actions(self) -> bool:
+        return bool(self._flags & FLAG_DENY)
+
+    @property
+    def cooldown_until_ms(self) -> int | None:
+        if not self._flags & FLAG_COOLDOWN:
+            return None
+        return _I64.unpack_from(self._buffer, 16)[0]
+
+    @property
+    def recommended_action(self) -> Action:
+        return _ACTIONS[self._buffer[3]]
+
+    @property
+    def reason_flags(self) -> int:
+        return _U32.unpack_from(self._buffer, 4)[0]
+
+    @property
+    def reasons(self) -> list[str]:
+        if not self._flags & FLAG_REASON_LIST:
+            return flags_to_reasons(self.reason_flags)
+        buffer = self._buffer
+        offset = self._offset(FLAG_REASON_LIST)
+        (count,) = _U16.unpack_from(buffer, offset)
+        offset += _U16.size
+        reasons = []
+        for _ in range(count):
+            (length,) = _U16.unpack_from(buffer, offset)
+            offset += _U16.size
+            reasons.append(str(buffer[offset : offset + length], "utf-8"))
+            offset += length
+        return reasons
+
+    @property
+    def recommended_rate_per_s(self) -> float | None:
+        if not self._flags & FLAG_RATE:
+            return None
+        return _F64.unpack_from(self._buffer, self._offset(FLAG_RATE))[0]
+
+    @property
+    def latency_percentiles(self) -> dict[str, float] | None:
+        if not self._flags & FLAG_PERCENTILES:
+            return None
+        values = _PERCENTILES.unpack_from(self._buffer, self._offset(FLAG_PERCENTILES))
+        return dict(zip(PERCENTILE_NAMES, values, strict=True))
+
+    def _sampling(self) -> tuple[float | None, float | None]:
+        if not self._flags & FLAG_SAMPLING:
+            return None, None
+        rate, rank_error = _SAMPLING.unpack_from(self._buffer, self._offset(FLAG_SAMPLING))
+        return rate, None if math.isnan(rank_error) else rank_error
+
+    @property
+    def latency_sample_rate(self) -> float | None:
+        return self._sampling()[0]
+
+    @property
+    def latency_rank_error(self) -> float | None:
+        return self._sampling()[1]
+
+    def to_signal(self) -> OpsSignal:
+        """Materialize an OpsSignal."""
+        sample_rate, rank_error = self._sampling()
+        return OpsSignal(
+            score=self.score,
+            state=self.state,
+            deny_actions=self.deny_actions,
+            cooldown_until_ms=self.cooldown_until_ms,
+            recommended_action=self.recommended_action,
+            reasons=self.reasons,
+            recommended_rate_per_s=self.recommended_rate_per_s,
+            latency_percentiles=self.latency_percentiles,
+            latency_sample_rate=sample_rate,
+            latency_rank_error=rank_error,
+        )
+
+    def to_context(self) -> dict[str, Any]:
+        """Same dict as OpsSignal.to_context() of the encoded signal (built directly)."""
+        _, state_code, flags, _, reason_flags, score, cooldown = _HEADER.unpack_from(self._buffer)
+        context = {
+            "ops_score": score,
+            "ops_state": STATES_BY_CODE[state_code].value,
+            "ops_deny_actions": bool(flags & FLAG_DENY),
+            "ops_cooldown_until_ms": cooldown if flags & FLAG_COOLDOWN else None,
+            "ops_reasons": flags_to_reasons(reason_flags)
+            if not flags & FLAG_REASON_LIST
+            else self.reasons,
+        }
+        if flags & FLAG_RATE:
+            context["ops_recommended_rate_per_s"] = self.recommended_rate_per_s
+        if flags & FLAG_PERCENTILES:
+            values = _PERCENTILES.unpack_from(self._buffer, self._offset(FLAG_PERCENTILES))
+            for name, value in zip(PERCENTILE_NAMES, values, strict=True):
+                context[f"ops_latency_{name}_ms"] = value
+        if flags & FLAG_SAMPLING:
+            sample_rate, rank_error = self._sampling()
+            context["ops_latency_sample_rate"] = sample_rate
+            context["ops_latency_rank_error"] = rank_error
+        return context
+
+
+def decode_signal(buffer: bytes | bytearray | memoryview) -> SignalView:
+    """
+    Decode an encoded signal without copying.
+
+    Args:
+        buffer: Encoded signal (extra trailing bytes are ignored; see SignalView.nbytes)
+
+    Returns:
+        SignalView over the buffer
+
+    Raises:
+        ValueError: If the buffer is not a complete encoded signal or has an unknown
+            state or action code
+    """
+    return SignalView(buffer)
@@ -0,0 +1,66 @@
+# Decision Ecosystem — ops-health-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for bulk (array / pre-aggregated) event ingestion."""
+
+from array import array
+
+import pytest
+
+from ops_health_core.kill_switch import update_kill_switch
+from ops_health_core.model import EVENT_ERROR, OpsPolicy, OpsState
+from ops_health_core.rollup import RollupNode
+from ops_health_core.windows import as_int64_array
+
+
+def test_counts_are_not_expanded() -> None:
+    """(ts, count) batches score like the equivalent per-event recording."""
+    policy = OpsPolicy(window_ms=1000, max_errors_per_window=100)
+    bulk = OpsState()
+    bulk.record_errors(array("q", [100, 200, 300]), [37, 5, 1])
+    assert len(bulk.aggregated[EVENT_ERROR]) == 3
+    assert bulk.error_timestamps == []
+
+    single = OpsState()
+    for ts, count in ((100, 37), (200, 5), (300, 1)):
+        for _ in range(count):
+            single.record_error(ts)
+    for now in (300, 1150, 1250, 1400):
+        assert update_kill_switch(bulk, policy, now) == update_kill_switch(single, policy, now)
+
+
+def test_numpy_buffers() -> None:
+    """NumPy int64 arrays are copied in bulk; latencies accept float arrays."""
+    np = pytest.importorskip("numpy")
+    ts = np.arange(0, 1000, 10, dtype=np.int64)
+    assert as_int64_array(ts).tolist() == ts.tolist()
+    assert as_int64_array(ts[::2]).tolist() == ts[::2].tolist()  # Non-contiguous fallback
+
+    state = OpsState()
+    state.record_429s(ts, np.full(len(ts), 2, dtype=np.int64))
+    state.record_latencies(np.linspace(10.0, 500.0, len(ts)), ts)
+    assert state.aggregated["429"].total() == 200
+    assert len(state.latency_samples) == len(ts)
+    assert all(type(v) is float for v in state.latency_samples)
+
+
+def test_bulk_feeds_components_and_caps() -> None:
+    """Rollup receives counts; max_events bounds aggregated entries."""
+    policy = OpsPolicy(window_ms=10_000)
+    leaf = RollupNode("root", policy).child("leaf")
+    state = OpsState(rollup=leaf, max_events=10, overflow_bucket_ms=100)
+    state.record_reconnects(range(0, 1000, 5), [3] * 200)
+    assert leaf.parent is not None and leaf.parent.counts(1000)[2] == 600
+    assert len(state.aggregated["reconnect"]) <= 10
+    assert state.aggregated["reconnect"].total() == 600
+
+
+def test_bulk_validation() -> None:
+    """Mismatched lengths and negative counts are rejected."""
+    state = OpsState()
+    with pytest.raises(ValueError):
+        state.record_errors([1, 2], [1])
+    with pytest.raises(ValueError):
+        state.record_errors([1], [-1])
+    with pytest.raises(ValueError):
+        state.record_latencies([1.0, 2.0], [1])
@@ -0,0 +1,175 @@
+# Decision Ecosystem — ops-health-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for compiled policy (precomputed normalizers and validation)."""
+
+import itertools
+import math
+
+import pytest
+
+from ops_health_core.kill_switch import update_kill_switch
+from ops_health_core.model import HealthState, OpsPolicy, OpsState
+from ops_health_core.policy import as_compiled, compile_policy
+from ops_health_core.scorer import compute_health_score, score_from_counts
+
+
+def _legacy_score(
+    policy: OpsPolicy, errors: int, rate_limits: int, reconnects: int, p95: int | None
+) -> tuple[float, HealthState]:
+    """Scorer arithmetic as it was before compiled policies (reference for boundaries)."""
+    p_err = (
+        min(1.0, errors / policy.max_errors_per_window) if policy.max_errors_per_window > 0 else 0.0
+    )
+    p_429 = (
+        min(1.0, rate_limits / policy.max_429_per_window) if policy.max_429_per_window > 0 else 0.0
+    )
+    p_rec = (
+        min(1.0, reconnects / policy.max_reconnects_per_window)
+        if policy.max_reconnects_per_window > 0
+        else 0.0
+    )
+    p_lat = 0.0
+    if p95 is not None and policy.max_p95_latency_ms > 0 and p95 > policy.max_p95_latency_ms:
+        p_lat = min(1.0, (p95 - policy.max_p95_latency_ms) / policy.max_p95_latency_ms)
+    score = 1.0 - (
+        policy.weight_errors * p_err
+        + policy.weight_429 * p_429
+        + policy.weight_reconnects * p_rec
+        + policy.weight_latency * p_lat
+    )
+    score = max(0.0, min(1.0, score))
+    if score >= policy.score_threshold_yellow:
+        return score, HealthState.GREEN
+    if score >= policy.score_threshold_red:
+        return score, HealthState.YELLOW
+    return score, HealthState.RED
+
+
+def test_compile_precomputes_budgets() -> None:
+    """Budgets and weights are precomputed; disabled budgets (0) compile to inf."""
+    compiled = compile_policy(OpsPolicy(max_errors_per_window=4, max_429_per_window=0))
+    assert compiled.max_errors == 4.0
+    assert compiled.max_429 == math.inf
+    assert compiled.weights == (0.4, 0.3, 0.2, 0.1)
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "counts", "expected"),
+    [
+        (
+            {"max_errors_per_window": 5, "weight_errors": 1.0, "score_threshold_red": 0.4},
+            (3, 0, 0),
+            HealthState.YELLOW,
+        ),
+        (
+            {
+                "max_errors_per_window": 7,
+                "weight_errors": 0.7,
+                "max_reconnects_per_window": 3,
+                "weight_reconnects": 0.3,
+                "score_threshold_red": 0.2,
+            },
+            (5, 0, 3),
+            HealthState.RED,
+        ),
+    ],
+)
+def test_compiled_threshold_boundaries(kwargs: dict, counts: tuple, expected: HealthState) -> None:
+    """Counts landing exactly on a threshold keep the legacy state."""
+    zero_weights = {"weight_429": 0.0, "weight_reconnects": 0.0, "weight_latency": 0.0}
+    policy = OpsPolicy(**{**zero_weights, **kwargs})
+    assert score_from_counts(compile_policy(policy), *counts) == _legacy_score(
+        policy, *counts, None
+    )
+    assert score_from_counts(compile_policy(policy), *counts)[1] == expected
+
+
+def test_compiled_bit_identical_to_legacy_arithmetic() -> None:
+    """Scores equal the legacy division-based formula bit for bit across a grid of budgets."""
+    for max_err, max_rec, max_lat in itertools.product((0, 3, 5, 6, 7, 10), (0, 3, 7), (0, 300)):
+        policy = OpsPolicy(
+            max_errors_per_window=max_err,
+            max_reconnects_per_window=max_rec,
+            max_p95_latency_ms=max_lat,
+            weight_errors=0.7,
+            weight_reconnects=0.3,
+            weight_latency=0.1,
+        )
+        compiled = compile_policy(policy)
+        for errors, reconnects, p95 in itertools.product(range(12), range(8), (None, 299, 450)):
+            expected = _legacy_score(policy, errors, 1, reconnects, p95)
+            assert score_from_counts(compiled, errors, 1, reconnects, p95) == expected
+
+
+def test_as_compiled_caches_raw_policy() -> None:
+    """A reused raw policy compiles once; mutating it invalidates the cache."""
+    policy = OpsPolicy(saturation_limits={"queue": 10.0})
+    first = as_compiled(policy)
+    assert as_compiled(policy) is first
+    policy.saturation_limits["queue"] = 20.0
+    second = as_compiled(policy)
+    assert second is not first
+    assert second.saturation_limits == (("queue", 0.05),)
+    policy.max_errors_per_window = 2
+    assert as_compiled(policy).max_errors == 2.0
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"window_ms": 0},
+        {"cooldown_ms": -1},
+        {"max_errors_per_window": -1},
+        {"weight_latency": -0.1},
+        {"weight_errors": float("nan")},
+        {"max_errors_per_window": float("nan")},
+        {"max_p95_latency_ms": "1000"},
+        {"max_errors_per_window": None},
+        {"cooldown_ms": True},
+        {"score_threshold_red": float("nan")},
+        {"saturation_limits": {"queue": "10"}},
+        {"score_threshold_red": 0.7, "score_threshold_yellow": 0.6},
+        {"score_threshold_yellow": 1.5},
+    ],
+)
+def test_compile_rejects_invalid(kwargs: dict) -> None:
+    """Invalid configs are rejected at load time."""
+    with pytest.raises(ValueError):
+        compile_policy(OpsPolicy(**kwargs))
+
+
+def test_compile_error_names_field() -> None:
+    """Non-numeric values raise ValueError (not TypeError) naming the field."""
+    with pytest.raises(ValueError, match="max_p95_latency_ms"):
+        compile_policy(OpsPolicy(max_p95_latency_ms="1000"))  # type: ignore[arg-type]
+
+
+def test_compiled_matches_raw_policy() -> None:
+    """Scorer and kill switch give identical results for raw and compiled policy."""
+    policy = OpsPolicy(max_errors_per_window=3, window_ms=10000, cooldown_ms=5000)
+    compiled = compile_policy(policy)
+    now_ms = 10000
+
+    state_raw = OpsState(error_timestamps=[9000, 9500], latency_samples=[1500, 900])
+    state_raw.latency_timestamps = [9100, 9200]
+    state_compiled = OpsState(error_timestamps=[9000, 9500], latency_samples=[1500, 900])
+    state_compiled.latency_timestamps = [9100, 9200]
+
+    assert compute_health_score(state_raw, policy, now_ms) == compute_health_score(
+        state_compiled, compiled, now_ms
+    )
+    assert update_kill_switch(state_raw, policy, now_ms) == update_kill_switch(
+        state_compiled, compiled, now_ms
+    )
+
+
+def test_compiled_zero_budget_disables_penalty() -> None:
+    """max_* == 0 disables the penalty (legacy zero-guard preserved)."""
+    compiled = compile_policy(OpsPolicy(max_errors_per_window=0, max_p95_latency_ms=0))
+    state = OpsState(error_timestamps=[1000] * 50)
+    state.latency_samples = [5000]
+    state.latency_timestamps = [1000]
+    score, health_state = compute_health_score(state, compiled, 1000)
+    assert score == 1.0
+    assert health_state == HealthState.GREEN
@@ -0,0 +1,96 @@
+# Decision Ecosystem — ops-health-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for the differential equivalence harness."""
+
+import random
+
+import pytest
+
+from ops_health_core.cache import SignalCache
+from ops_health_core.differential import (
+    STEP_FAULT,
+    Candidate,
+    Step,
+    generate_scenario,
+    minimize,
+    replay,
+    run_differential,
+)
+from ops_health_core.kill_switch import apply_kill_switch, update_kill_switch
+from ops_health_core.latency import ExactLatencyStore
+from ops_health_core.model import OpsPolicy, OpsState
+from ops_health_core.scorer import compute_health_score
+
+
+def _cached_engine():
+    caches: dict[int, SignalCache] = {}
+
+    def engine(state, policy, now_ms):
+        cache = caches.get(id(state))
+        if cache is None or cache.state is not state:
+            cache = caches[id(state)] = SignalCache(state, policy)
+        return cache.get(now_ms)
+
+    return engine
+
+
+def test_equivalent_candidates_pass() -> None:
+    """Exact latency store and memoized evaluation trip exactly like the reference."""
+    candidates = [
+        Candidate("exact", state_factory=lambda: OpsState(latency_store=ExactLatencyStore())),
+        Candidate("cache", engine=_cached_engine()),
+    ]
+    report = run_differential(candidates, scenarios=60, steps=120, seed=5)
+    assert report.divergences == {}
+    assert report.evaluations > 0
+    assert set(report.speedups) == {"exact", "cache"}
+    assert all(speedup > 0 for speedup in report.speedups.values())
+
+
+def test_reports_minimal_reproducer() -> None:
+    """A cooldown off-by-one is caught, shrunk to a few steps, and replays."""
+
+    def late_expiry(state, policy, now_ms):
+        score, health_state = compute_health_score(state, policy, now_ms, prune=True)
+        if state.cooldown_until_ms is not None and now_ms == state.cooldown_until_ms:
+            now_ms -= 1  # Bug: cooldown still active at its end
+        return apply_kill_switch(state, policy, score, health_state, now_ms)
+
+    report = run_differential([Candidate("late", engine=late_expiry)], scenarios=100, seed=1)
+    divergence = report.divergences["late"]
+    assert len(divergence.steps) <= 4
+    assert divergence.expected != divergence.actual
+    candidate = Candidate("late", engine=late_expiry)
+    assert replay(candidate, divergence.policy, divergence.steps) == len(divergence.steps) - 1
+    assert "replay(candidate, policy, steps)" in divergence.reproducer()
+    namespace = {"candidate": candidate}
+    # Running the reproducer checks it is valid Python and replays the divergence; the source
+    # is generated by this test's own run, not external input.
+    exec(divergence.reproducer(), namespace)  # noqa: S102
+
+
+def test_fail_closed_path_compared() -> None:
+    """A candidate that does not fail closed diverges on a fault step."""
+
+    def fail_open(state, policy, now_ms):
+        try:
+            score, health_state = compute_health_score(state, policy, now_ms, prune=True)
+        except TypeError:
+            score, health_state = compute_health_score(OpsState(), policy, now_ms)
+        return apply_kill_switch(state, policy, score, health_state, now_ms)
+
+    steps = [Step("error", 0), Step(STEP_FAULT, 1)]
+    candidate = Candidate("open", engine=fail_open)
+    assert replay(candidate, OpsPolicy(), steps) == 1
+    assert minimize(candidate, OpsPolicy(), steps) == [Step(STEP_FAULT, 1)]
+    with pytest.raises(ValueError, match="does not diverge"):
+        minimize(Candidate("same", engine=update_kill_switch), OpsPolicy(), steps)
+
+
+def test_generator_deterministic_and_valid() -> None:
+    policy, steps = generate_scenario(random.Random(3), 50)
+    assert (policy, steps) == generate_scenario(random.Random(3), 50)
+    assert steps[-1].kind == "tick"
+    with pytest.raises(ValueError, match="unique"):
+        run_differential([Candidate("reference")], scenarios=1)
@@ -0,0 +1,107 @@
+# Decision Ecosystem — ops-health-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for streaming drift detection."""
+
+import copy
+import random
+
+import pytest
+
+from ops_health_core.drift import (
+    REASON_ERROR_RATE_DRIFT,
+    REASON_LATENCY_DRIFT,
+    DriftMonitor,
+    DriftPolicy,
+    PageHinkley,
+)
+from ops_health_core.kill_switch import update_kill_switch
+from ops_health_core.model import OpsPolicy, OpsState
+
+
+def test_page_hinkley_stable_stream_no_drift() -> None:
+    """A stationary stream never triggers."""
+    detector = PageHinkley(delta=5.0, threshold=500.0, min_samples=10)
+    assert not any(detector.update(100.0 + (i % 3)) for i in range(10_000))
+
+
+def test_page_hinkley_detects_gradual_increase() -> None:
+    """A gradual upward ramp is detected and the detector resets."""
+    detector = PageHinkley(delta=5.0, threshold=500.0, min_samples=10)
+    for _ in range(200):
+        detector.update(100.0)
+    detections = [i for i in range(500) if detector.update(100.0 + i)]
+    assert detections
+    assert detections[0] < 100
+
+
+def test_update_many_matches_repeated_updates() -> None:
+    """Closed-form repeats give the same detections and statistics as update() calls."""
+    rng = random.Random(7)
+    for _ in range(300):
+        detector = PageHinkley(
+            delta=rng.choice([0.0, 0.005, 0.5]),
+            threshold=rng.choice([0.5, 5.0, 500.0]),
+            min_samples=rng.choice([1, 30, 100]),
+        )
+        for _ in range(rng.randint(0, 300)):
+            detector.update(rng.choice([0.0, 1.0, rng.random() * 3]))
+        bulk = copy.copy(detector)
+        x = rng.choice([0.0, 1.0, 2.5])
+        count = rng.choice([1, 50, 5000])
+        expected = [detector.update(x) for _ in range(count)]
+        assert bulk.update_many(x, count) == any(expected)
+        assert bulk._n == detector._n
+        assert bulk._mean == pytest.approx(detector._mean)
+        assert bulk._cum == pytest.approx(detector._cum)
+        assert bulk._min_cum == pytest.approx(detector._min_cum)
+
+
+def test_bulk_error_count_is_not_expanded() -> None:
+    """on_error with a huge count runs in closed form and still raises the flag."""
+    monitor = DriftMonitor(DriftPolicy(min_samples=10))
+    for ts in range(500):
+        monitor.on_latency(50, ts)
+    monitor.on_error(500, 10**12)
+    assert REASON_ERROR_RATE_DRIFT in monitor.reasons(500)
+    assert monitor.error_rate._n < 10**12
+
+
+def test_monitor_raises_reasons_with_hold() -> None:
+    """Drift reasons stay raised for hold_ms after detection."""
+    monitor = DriftMonitor(DriftPolicy(min_samples=10, hold_ms=1000))
+    for ts in range(100):
+        monitor.on_latency(100, ts)
+    assert monitor.reasons(100) == []
+    ts = 100
+    while REASON_LATENCY_DRIFT not in monitor.reasons(ts):
+        monitor.on_latency(2000, ts)
+        ts += 1
+        assert ts < 200
+    assert monitor.reasons(ts + 5000) == []
+
+
+def test_error_rate_drift_from_outcomes() -> None:
+    """Rising share of errors among outcomes raises the error-rate reason."""
+    state = OpsState(drift=DriftMonitor(DriftPolicy(min_samples=10)))
+    for ts in range(500):
+        state.record_latency(50, ts)
+    for ts in range(500, 540):
+        state.record_error(ts)
+    signal = update_kill_switch(state, OpsPolicy(max_errors_per_window=1000), 540)
+    assert REASON_ERROR_RATE_DRIFT in signal.reasons
+    assert REASON_LATENCY_DRIFT not in signal.reasons
+
+
+def test_drift_penalty_optional() -> None:
+    """weight_drift applies a score penalty only while drift is raised."""
+    state = OpsState(drift=DriftMonitor(DriftPolicy(min_samples=10)))
+    for ts in range(500):
+        state.record_latency(50, ts)
+    for ts in range(500, 540):
+        state.record_error(ts)
+    base = OpsPolicy(max_errors_per_window=1000)
+    penalized = OpsPolicy(max_errors_per_window=1000, weight_drift=0.5)
+    assert update_kill_switch(state, penalized, 540).score == pytest.approx(
+        update_kill_switch(state, base, 540).score - 0.5
+    )
@@ -0,0 +1,68 @@
+# Decision Ecosystem — ops-health-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for change-only signal emission."""
+
+import pytest
+from decision_schema.types import Action
+
+from ops_health_core.emitter import EmitPolicy, SignalEmitter
+from ops_health_core.model import HealthState, OpsPolicy, OpsSignal
+
+
+def _signal(
+    score: float, state: HealthState, deny: bool = False, cooldown: int | None = None
+) -> OpsSignal:
+    return OpsSignal(
+        score=score,
+        state=state,
+        deny_actions=deny,
+        cooldown_until_ms=cooldown,
+        recommended_action=Action.HOLD if deny else Action.ACT,
+    )
+
+
+def test_only_changes_are_published() -> None:
+    """Unchanged signals and small score moves are suppressed."""
+    emitter = SignalEmitter(EmitPolicy(score_epsilon=0.05))
+    assert emitter.offer(_signal(0.9, HealthState.GREEN), 0) is not None
+    assert emitter.offer(_signal(0.9, HealthState.GREEN), 1) is None
+    assert emitter.offer(_signal(0.93, HealthState.GREEN), 2) is None
+    assert emitter.offer(_signal(0.8, HealthState.GREEN), 3) is not None
+    assert emitter.offer(_signal(0.5, HealthState.YELLOW), 4) is not None
+    assert (emitter.published, emitter.suppressed) == (3, 2)
+
+
+def test_deny_bypasses_debounce() -> None:
+    """Kill-switch changes are published immediately, state-only changes wait."""
+    emitter = SignalEmitter(EmitPolicy(debounce_ms=100))
+    emitter.offer(_signal(0.9, HealthState.GREEN), 0)
+    assert emitter.offer(_signal(0.5, HealthState.YELLOW), 10) is None
+    assert emitter.offer(_signal(0.2, HealthState.YELLOW), 50) is None  # Score held while pending
+    assert emitter.offer(_signal(0.5, HealthState.YELLOW), 110) is not None
+    red = _signal(0.1, HealthState.RED, deny=True, cooldown=1000)
+    assert emitter.offer(red, 120) is red
+
+
+def test_debounce_restarts_on_flap() -> None:
+    """Returning to the published state cancels a pending change."""
+    emitter = SignalEmitter(EmitPolicy(debounce_ms=100))
+    emitter.offer(_signal(0.9, HealthState.GREEN), 0)
+    emitter.offer(_signal(0.5, HealthState.YELLOW), 10)
+    emitter.offer(_signal(0.9, HealthState.GREEN), 60)
+    assert emitter.offer(_signal(0.5, HealthState.YELLOW), 120) is None
+    assert emitter.offer(_signal(0.5, HealthState.YELLOW), 220) is not None
+
+
+def test_hysteresis() -> None:
+    """State changes need the score past the threshold by the margin."""
+    ops_policy = OpsPolicy(score_threshold_red=0.3, score_threshold_yellow=0.6)
+    emitter = SignalEmitter(EmitPolicy(hysteresis=0.05), ops_policy)
+    emitter.offer(_signal(0.9, HealthState.GREEN), 0)
+    assert emitter.offer(_signal(0.58, HealthState.YELLOW), 1) is None
+    assert emitter.offer(_signal(0.54, HealthState.YELLOW), 2) is not None
+    assert emitter.offer(_signal(0.62, HealthState.GREEN), 3) is None
+    assert emitter.offer(_signal(0.66, HealthState.GREEN), 4) is not None
+
+    with pytest.raises(ValueError):
+        SignalEmitter(EmitPolicy(hysteresis=0.05))
@@ -0,0 +1,71 @@
+# Decision Ecosystem — ops-health-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for the exact (order-statistic) latency store."""
+
+import random
+
+import pytest
+
+from ops_health_core.kill_switch import update_kill_switch
+from ops_health_core.latency import ExactLatencyStore
+from ops_health_core.model import OpsPolicy, OpsState
+
+
+def _reference_quantile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+
+def test_matches_sorted_list_through_expiry() -> None:
+    """Quantiles equal the sorted-list rank rule as samples expire (duplicates, negatives)."""
+    rng = random.Random(11)
+    store = ExactLatencyStore(expected_size=64)
+    samples = []
+    for i in range(3000):
+        value = rng.choice([rng.randint(-5, 20), rng.expovariate(1 / 300), 42])
+        ts = i + rng.randint(-50, 50)  # Out-of-order timestamps
+        samples.append((ts, value))
+        store.record(value, ts)
+    for cutoff in (-100, 500, 1500, 2900, 3100):
+        store.prune(cutoff)
+        live = [v for ts, v in samples if ts >= cutoff]
+        assert len(store) == len(live)
+        if not live:
+            assert store.quantile(0.95) is None
+            assert store.max_value() is None
+            continue
+        for q in (0.0, 0.5, 0.95, 0.99):
+            assert store.quantile(q) == _reference_quantile(live, q)
+        assert store.quantiles([0.5, 0.99]) == [
+            _reference_quantile(live, 0.5),
+            _reference_quantile(live, 0.99),
+        ]
+        assert store.max_value() == max(live)
+
+
+def test_rejects_non_finite() -> None:
+    """NaN and infinity cannot be ordered into the window."""
+    store = ExactLatencyStore()
+    with pytest.raises(ValueError, match="finite"):
+        store.record(float("nan"), 0)
+    with pytest.raises(ValueError, match="finite"):
+        store.record(float("inf"), 0)
+    assert len(store) == 0
+
+
+def test_drop_in_score_equals_list_path() -> None:
+    """update_kill_switch scores match the raw-list path exactly."""
+    policy = OpsPolicy(window_ms=1000, max_p95_latency_ms=200)
+    rng = random.Random(2)
+    exact = OpsState(latency_store=ExactLatencyStore())
+    plain = OpsState()
+    for ts in range(0, 5000, 7):
+        latency = rng.lognormvariate(5, 0.6)
+        exact.record_latency(latency, ts)
+        plain.record_latency(latency, ts)
+        if ts % 500 == 0:
+            a = update_kill_switch(exact, policy, ts)
+            b = update_kill_switch(plain, policy, ts)
+            assert (a.score, a.state) == (b.score, b.state)
+            assert a.latency_percentiles is not None
@@ -0,0 +1,119 @@
+# Decision Ecosystem — ops-health-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for the Prometheus text exposition endpoint."""
+
+import threading
+import urllib.error
+import urllib.request
+from unittest.mock import patch
+
+import pytest
+
+from ops_health_core.cache import SignalCache
+from ops_health_core.exposition import CONTENT_TYPE, MetricsExposition, serve_metrics
+from ops_health_core.kill_switch import update_kill_switch
+from ops_health_core.model import OpsPolicy, OpsState
+
+POLICY = OpsPolicy(max_errors_per_window=2, weight_errors=0.9, cooldown_ms=1000)
+
+
+def _signal(errors: int, now_ms: int = 1000):
+    state = OpsState()
+    for ts in range(errors):
+        state.record_error(ts)
+    return update_kill_switch(state, POLICY, now_ms)
+
+
+def test_render_groups_families_and_escapes_labels() -> None:
+    """Each family appears once with all entities; label values are escaped."""
+    exposition = MetricsExposition()
+    exposition.update("a", _signal(0))
+    exposition.update('b"\\', _signal(5))
+    body = exposition.render().decode()
+    assert body.count("# TYPE ops_score gauge") == 1
+    assert 'ops_score{entity="a"} 1.0\n' in body
+    assert 'ops_state{entity="b\\"\\\\"} 2\n' in body
+    assert 'ops_reason{entity="b\\"\\\\",reason="health_score_below_red_threshold"} 1\n' in body
+    assert 'ops_cooldown_until_ms{entity="b\\"\\\\"} 2000\n' in body
+    assert "ops_recommended_rate_per_s" not in body  # No rate budget: family omitted
+    score_lines = [i for i, line in enumerate(body.splitlines()) if line.startswith("ops_score")]
+    assert score_lines == [score_lines[0], score_lines[0] + 1]
+
+
+def test_body_cached_until_signal_changes() -> None:
+    """Unchanged signals keep the cached body; a change rebuilds it once."""
+    exposition = MetricsExposition()
+    assert exposition.update("a", _signal(0))
+    first = exposition.render()
+    assert not exposition.update("a", _signal(0))  # Equal signal
+    assert exposition.render() is first
+    assert exposition.renders == 1
+    assert exposition.update("a", _signal(5))
+    assert exposition.render() != first
+    assert exposition.renders == 2
+    exposition.remove("a")
+    assert exposition.render() == b""
+
+
+def test_tracked_registry_evaluates_per_quantum() -> None:
+    """Tracked states are evaluated through SignalCache; new and removed entities follow."""
+    registry = {"a": OpsState()}
+    exposition = MetricsExposition(label="service")
+    exposition.track(registry, POLICY, quantum_ms=1000)
+    body = exposition.render(now_ms=1000)
+    assert b'ops_score{service="a"} 1.0' in body
+    assert exposition.render(now_ms=1500) is body  # Same quantum, same version
+    registry["b"] = OpsState()
+    registry.pop("a")
+    body = exposition.render(now_ms=1600)
+    assert b'service="b"' in body and b'service="a"' not in body
+
+
+def test_pull_refresh_does_not_block_updates() -> None:
+    """Evaluations run outside the body lock; a concurrent scrape serves the cached body."""
+    exposition = MetricsExposition()
+    exposition.update("pushed", _signal(0))
+    exposition.track({"pulled": OpsState()}, POLICY)
+    started, release = threading.Event(), threading.Event()
+    original = SignalCache.get
+
+    def slow_get(cache, now_ms):
+        started.set()
+        release.wait(5)
+        return original(cache, now_ms)
+
+    with patch.object(SignalCache, "get", slow_get):
+        scrape = threading.Thread(target=exposition.render, args=(1000,))
+        scrape.start()
+        assert started.wait(5)
+        assert exposition.update("pushed", _signal(5))  # Not blocked by the evaluation
+        body = exposition.render(1000)  # Refresh in progress: cached body, no wait
+        assert b'ops_state{entity="pushed"} 2' in body
+        assert b"pulled" not in body
+        release.set()
+        scrape.join(5)
+    assert b'entity="pulled"' in exposition.render(1000)
+
+
+def test_single_state_unlabeled() -> None:
+    exposition = MetricsExposition()
+    exposition.track(OpsState(), POLICY)
+    assert b"ops_score 1.0\n" in exposition.render(now_ms=0)
+
+
+def test_http_endpoint() -> None:
+    """GET /metrics serves the cached body; other paths are 404."""
+    exposition = MetricsExposition()
+    exposition.update("a", _signal(5))
+    server = serve_metrics(exposition, port=0)
+    try:
+        host, port = server.server_address[:2]
+        with urllib.request.urlopen(f"http://{host}:{port}/metrics", timeout=5) as response:
+            assert response.headers["Content-Type"] == CONTENT_TYPE
+            assert response.read() == exposition.render()
+        with pytest.raises(urllib.error.HTTPError):
+            urllib.request.urlopen(f"http://{host}:{port}/other", timeout=5)
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -24,3 +24,29 @@ def test_fail_closed_on_exception() -> None:
     assert signal.deny_actions is True
     assert signal.recommended_action == Action.HOLD
     assert "fail_closed_exception" in signal.reasons
+
+
+def test_fail_closed_on_malformed_raw_policy() -> None:
+    """A raw policy that cannot be compiled fails closed instead of raising."""
+    state = OpsState(error_timestamps=[9000])
+    policy = OpsPolicy(max_errors_per_window=None, max_p95_latency_ms="1000")  # type: ignore[arg-type]
+
+    signal = update_kill_switch(state, policy, 10000)
+
+    assert signal.deny_actions is True
+    assert signal.recommended_action == Action.HOLD
+    assert signal.reasons == ["fail_closed_exception"]
+
+
+def test_fail_closed_on_enrichment_exception() -> None:
+    """Exceptions after scoring (drift, rate budget, latency summary) also fail closed."""
+    from unittest.mock import patch
+
+    state = OpsState()
+    with patch(
+        "ops_health_core.kill_switch.apply_kill_switch", side_effect=RuntimeError("simulated")
+    ):
+        signal = update_kill_switch(state, OpsPolicy(), 10000)
+
+    assert signal.deny_actions is True
+    assert "fail_closed_exception" in signal.reasons
@@ -0,0 +1,58 @@
+# Decision Ecosystem — ops-health-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for the fused prune-and-score pass."""
+
+import copy
+import random
+
+from ops_health_core.model import OpsPolicy, OpsState
+from ops_health_core.policy import compile_policy
+from ops_health_core.scorer import compute_health_score, score_from_counts
+from ops_health_core.windows import count_in_window, prune_timestamps
+
+
+def _reference(state: OpsState, policy, now_ms: int) -> tuple:
+    """Two-phase evaluation: filter copies, count and sort (state untouched)."""
+    cutoff_ms = now_ms - policy.window_ms
+    counts = [
+        count_in_window(ts, now_ms, policy.window_ms)
+        for ts in (state.error_timestamps, state.rate_limit_timestamps, state.reconnect_timestamps)
+    ]
+    pairs = [
+        (v, ts) for v, ts in zip(state.latency_samples, state.latency_timestamps) if ts >= cutoff_ms
+    ]
+    latencies = sorted(v for v, _ in pairs)
+    p95 = latencies[min(int(0.95 * len(latencies)), len(latencies) - 1)] if latencies else None
+    return score_from_counts(policy, *counts, p95), pairs
+
+
+def test_fused_matches_two_phase() -> None:
+    """Scores and pruned lists match the two-phase path, in and out of order."""
+    rng = random.Random(5)
+    policy = compile_policy(OpsPolicy(window_ms=1000, max_errors_per_window=20))
+    for trial in range(200):
+        state = OpsState()
+        n = rng.randint(0, 60)
+        ts_values = sorted(rng.randint(0, 3000) for _ in range(n))
+        if trial % 3 == 0:
+            rng.shuffle(ts_values)  # Out-of-order arrivals
+        state.error_timestamps = list(ts_values)
+        state.rate_limit_timestamps = ts_values[: n // 2]
+        state.latency_timestamps = list(ts_values)
+        state.latency_samples = [rng.randint(1, 3000) for _ in range(n + trial % 2)]
+        now_ms = rng.randint(0, 3500)
+
+        expected, pairs = _reference(copy.deepcopy(state), policy, now_ms)
+        assert compute_health_score(state, policy, now_ms, prune=True) == expected
+        assert state.error_timestamps == prune_timestamps(ts_values, now_ms, policy.window_ms)
+        assert list(zip(state.latency_samples, state.latency_timestamps)) == pairs
+
+
+def test_fused_path_skips_work_when_nothing_expires() -> None:
+    """Lists fully inside the window keep their identity and contents."""
+    state = OpsState(error_timestamps=[900, 950, 1000])
+    errors = state.error_timestamps
+    policy = OpsPolicy(window_ms=1000)
+    compute_health_score(state, policy, 1000, prune=True)
+    assert state.error_timestamps is errors and errors == [900, 950, 1000]
@@ -0,0 +1,83 @@
+# Decision Ecosystem — ops-health-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for the log-linear latency histogram store."""
+
+import random
+
+from ops_health_core.kill_switch import update_kill_switch
+from ops_health_core.latency import LatencyHistogram
+from ops_health_core.model import OpsPolicy, OpsState
+from ops_health_core.scorer import compute_health_score
+
+
+def _reference_quantile(values: list[int], q: float) -> int:
+    ordered = sorted(values)
+    return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+
+def test_small_values_exact() -> None:
+    """Values below 2**precision_bits are exact; rank rule matches sorted()[int(q*n)]."""
+    hist = LatencyHistogram(precision_bits=6)
+    values = [5, 60, 7, 33, 12, 1, 63, 40, 2, 9]
+    for ts, v in enumerate(values):
+        hist.record(v, ts)
+    for q in (0.0, 0.5, 0.95, 0.99):
+        assert hist.quantile(q) == _reference_quantile(values, q)
+    assert hist.max_value() == 63
+
+
+def test_relative_error_bound() -> None:
+    """Large values stay within the log-linear relative error bound."""
+    rng = random.Random(7)
+    values = [int(rng.lognormvariate(6, 1.2)) for _ in range(5000)]
+    hist = LatencyHistogram(precision_bits=6)
+    for ts, v in enumerate(values):
+        hist.record(v, ts)
+    got = hist.quantiles([0.5, 0.95, 0.99])
+    for q, estimate in zip((0.5, 0.95, 0.99), got, strict=True):
+        exact = _reference_quantile(values, q)
+        assert exact <= estimate <= exact * (1 + 2 / 64) + 1
+    assert hist.max_value() == max(values)
+
+
+def test_prune_drops_whole_slices() -> None:
+    """Slices entirely before the cutoff are dropped; late samples for them are ignored."""
+    hist = LatencyHistogram(window_ms=1000, slices=10)
+    hist.record(900, 50)
+    hist.record(10, 950)
+    hist.prune(500)
+    assert len(hist) == 1
+    assert hist.max_value() == 10
+    hist.record(999, 100)  # Older than last prune
+    assert len(hist) == 1
+
+
+def test_empty_histogram() -> None:
+    """Empty store yields None."""
+    hist = LatencyHistogram()
+    assert hist.quantile(0.95) is None
+    assert hist.max_value() is None
+
+
+def test_store_feeds_score_and_context() -> None:
+    """Histogram replaces latency_samples for p95 and extends to_context()."""
+    state = OpsState(latency_store=LatencyHistogram(window_ms=1000, slices=10))
+    policy = OpsPolicy(window_ms=1000, max_p95_latency_ms=100, weight_latency=1.0)
+    state.record_latency(5000, 1000)  # Expired by now_ms
+    for ts in range(4500, 4600, 5):
+        state.record_latency(50, ts)
+    assert not state.latency_samples
+
+    signal = update_kill_switch(state, policy, 5000)
+    assert signal.score == 1.0
+    context = signal.to_context()
+    assert context["ops_latency_p50_ms"] == 50
+    assert context["ops_latency_p95_ms"] == 50
+    assert context["ops_latency_p99_ms"] == 50
+    assert context["ops_latency_max_ms"] == 50
+
+    state.record_latency(400, 4990)
+    state.record_latency(400, 4991)
+    score, _ = compute_health_score(state, policy, 5000)
+    assert score < 1.0
@@ -0,0 +1,89 @@
+# Decision Ecosystem — ops-health-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for the synthetic load generator and soak harness."""
+
+import pytest
+
+from ops_health_core.kill_switch import update_kill_switch
+from ops_health_core.loadgen import Incident, LoadProfile, generate_events, run_soak
+from ops_health_core.model import HealthState, OpsPolicy
+
+
+def _incident(**overrides) -> Incident:
+    fields = {
+        "start_ms": 60_000,
+        "duration_ms": 30_000,
+        "error_rate_per_s": 2.0,
+        "rate_limit_rate_per_s": 1.0,
+        "reconnect_rate_per_s": 0.5,
+        "latency_scale": 50.0,
+        "entities": 1,
+    }
+    fields.update(overrides)
+    return Incident(**fields)
+
+
+def test_deterministic_and_rates_close() -> None:
+    """Same seed yields the same stream; baseline counts track the configured rates."""
+    profile = LoadProfile(duration_ms=100_000, entities=3, error_rate_per_s=0.5)
+    events = list(generate_events(profile, seed=4))
+    assert events == list(generate_events(profile, seed=4))
+    errors = sum(1 for e in events if e["type"] == "error")
+    assert 0.8 * 150 < errors < 1.2 * 150  # 0.5/s * 100 s * 3 entities
+    latencies = [e["latency_ms"] for e in events if e["type"] == "latency"]
+    assert sorted(latencies)[len(latencies) // 2] == pytest.approx(50.0, rel=0.1)
+    assert {e["entity"] for e in events} == {0, 1, 2}
+
+
+def test_disorder_bounded() -> None:
+    """Arrival order is monotone; late events are at most disorder_ms behind."""
+    profile = LoadProfile(duration_ms=20_000, disorder_fraction=0.3, disorder_ms=500)
+    events = list(generate_events(profile, seed=1))
+    arrivals = [e["arrival_ms"] for e in events]
+    assert arrivals == sorted(arrivals)
+    assert any(a != b for a, b in zip(arrivals, sorted(e["ts_ms"] for e in events), strict=True))
+    assert all(0 <= e["arrival_ms"] - e["ts_ms"] <= 500 for e in events)
+
+
+def test_invalid_profile() -> None:
+    with pytest.raises(ValueError, match="latency_distribution"):
+        list(generate_events(LoadProfile(latency_distribution="uniform")))
+
+
+def test_soak_trips_only_on_incident() -> None:
+    """Affected entity trips during the incident; the clean entity never trips."""
+    profile = LoadProfile(duration_ms=180_000, entities=2, incidents=[_incident()])
+    report = run_soak(profile, OpsPolicy(), report_interval_ms=60_000, seed=3)
+    assert report.true_trips >= 1
+    assert report.false_trips == 0
+    assert report.missed_incidents == 0
+    assert report.fail_closed == 0
+    assert report.evaluations == 2 * 180
+    assert [s.stream_ms for s in report.samples] == [60_000, 120_000, 180_000]
+    assert all(0 < d <= 30_000 for d in report.detection_delays_ms)
+
+
+def test_soak_alternative_engine_and_missed_incident() -> None:
+    """A never-tripping engine misses the labeled incident."""
+
+    def lenient(state, policy, now_ms):
+        signal = update_kill_switch(state, policy, now_ms)
+        signal.state = HealthState.GREEN
+        signal.cooldown_until_ms = None
+        return signal
+
+    profile = LoadProfile(duration_ms=120_000, incidents=[_incident()])
+    report = run_soak(profile, OpsPolicy(), engine=lenient, seed=3)
+    assert report.trips == 0
+    assert report.missed_incidents == 1
+    assert report.detection_delays_ms == []
+
+
+def test_soak_counts_trips_without_cooldown() -> None:
+    """cooldown_ms=0 never sets a cooldown; every RED evaluation is a trip."""
+    profile = LoadProfile(duration_ms=120_000, incidents=[_incident()])
+    report = run_soak(profile, OpsPolicy(cooldown_ms=0), seed=3)
+    assert report.trips >= 2
+    assert report.missed_incidents == 0
+    assert report.eval_p50_us <= report.eval_p99_us <= report.eval_max_us * 1.01
@@ -0,0 +1,114 @@
+# Decision Ecosystem — ops-health-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for bounded-memory caps and memory accounting."""
+
+from ops_health_core.kill_switch import update_kill_switch
+from ops_health_core.memory import memory_usage
+from ops_health_core.model import EVENT_ERROR, OpsPolicy, OpsState
+from ops_health_core.scorer import compute_health_score, merged_quantile
+
+
+def test_cap_bounds_lists_and_keeps_counts() -> None:
+    """Overflowing events collapse into aggregated counts; totals are preserved."""
+    state = OpsState(max_events=100, overflow_bucket_ms=1000)
+    for ts in range(10_000):
+        state.record_error(ts)
+    assert len(state.error_timestamps) <= 100
+    assert len(state.aggregated[EVENT_ERROR]) <= 100
+    assert len(state.error_timestamps) + state.aggregated[EVENT_ERROR].total() == 10_000
+
+    uncapped = OpsState(error_timestamps=list(range(10_000)))
+    policy = OpsPolicy(window_ms=60_000, max_errors_per_window=20_000)
+    assert compute_health_score(state, policy, 10_000) == compute_health_score(
+        uncapped, policy, 10_000
+    )
+
+
+def test_collapsed_counts_fail_closed() -> None:
+    """Collapsed counts never expire earlier than the individual events would."""
+    state = OpsState(max_events=10, overflow_bucket_ms=1000)
+    for ts in range(0, 5000, 100):
+        state.record_error(ts)
+    policy = OpsPolicy(window_ms=2000, max_errors_per_window=1000)
+    exact = OpsState(error_timestamps=list(range(0, 5000, 100)))
+    capped_score = update_kill_switch(state, policy, 5000).score
+    exact_score = update_kill_switch(exact, policy, 5000).score
+    assert capped_score <= exact_score
+
+
+def test_latency_cap_merges_overflow() -> None:
+    """Latency overflow is collapsed into a histogram and still feeds p95."""
+    state = OpsState(max_events=50)
+    for ts in range(1000):
+        state.record_latency(2000 if ts % 10 == 0 else 10, ts)
+    assert len(state.latency_samples) <= 50
+    assert len(state.latency_samples) + len(state.latency_overflow) == 1000
+    policy = OpsPolicy(max_p95_latency_ms=100, weight_latency=1.0)
+    uncapped = OpsState(
+        latency_samples=[2000 if ts % 10 == 0 else 10 for ts in range(1000)],
+        latency_timestamps=list(range(1000)),
+    )
+    assert compute_health_score(state, policy, 1000) == compute_health_score(uncapped, policy, 1000)
+
+
+def test_merged_quantile() -> None:
+    """Merged rank walk over exact samples and buckets."""
+    assert merged_quantile([1, 5, 9], [(3, 2), (7, 1)], 0.5) == 5
+    assert merged_quantile([], [(3, 2)], 0.99) == 3
+    assert merged_quantile([], [], 0.5) is None
+
+
+def test_memory_usage_state_and_registry() -> None:
+    """memory_usage() grows with events and sums over a registry."""
+    small = OpsState()
+    large = OpsState(error_timestamps=list(range(10_000)))
+    assert memory_usage(large) > memory_usage(small)
+    capped = OpsState(max_events=100)
+    for ts in range(10_000):
+        capped.record_error(ts)
+    assert memory_usage(capped) < memory_usage(large)
+    registry = {"a": small, "b": large}
+    assert memory_usage(registry) > memory_usage(small) + memory_usage(large)
+
+
+def test_cap_is_hard_without_evaluation() -> None:
+    """A long run recorded without evaluating stays within the cap (aggregates coarsen)."""
+    state = OpsState(max_events=100, overflow_bucket_ms=1000)
+    sizes = []
+    for ts in range(0, 200_000_000, 1000):
+        state.record_error(ts)
+        state.record_latency(ts % 997, ts)
+        if ts % 20_000_000 == 0:
+            sizes.append(memory_usage(state))
+    assert len(state.aggregated[EVENT_ERROR]) <= 100
+    assert state.latency_overflow.slice_count() <= 100
+    assert len(state.error_timestamps) + state.aggregated[EVENT_ERROR].total() == 200_000
+    assert len(state.latency_samples) + len(state.latency_overflow) == 200_000
+    assert max(sizes) < 1_500_000  # About 21 MB uncapped
+
+    policy = OpsPolicy(window_ms=10_000_000, max_errors_per_window=1_000_000)
+    exact = OpsState(error_timestamps=list(range(0, 200_000_000, 1000)))
+    now_ms = 200_000_000
+    assert update_kill_switch(state, policy, now_ms).score <= (
+        update_kill_switch(exact, policy, now_ms).score
+    )
+
+
+def test_gauge_cap_is_hard_and_fails_closed() -> None:
+    """Gauge segments stay within the cap; windowed max/average are never under-estimated."""
+    capped = OpsState(max_events=100)
+    uncapped = OpsState()
+    for ts in range(0, 100_000_000, 1000):
+        value = float((ts // 1000) % 37)
+        capped.record_gauge("queue_depth", value, ts)
+        uncapped.record_gauge("queue_depth", value, ts)
+    assert len(capped.gauges["queue_depth"]) <= 100
+    assert memory_usage(capped) < memory_usage(uncapped) // 100
+
+    for window_ms in (100_000_000, 1_000_000, 5_000):  # Widest first (stats() prunes)
+        now_ms = 100_000_000
+        capped_avg, capped_max = capped.gauges["queue_depth"].stats(now_ms, window_ms)
+        exact_avg, exact_max = uncapped.gauges["queue_depth"].stats(now_ms, window_ms)
+        assert capped_max >= exact_max
+        assert capped_avg >= exact_avg
@@ -0,0 +1,78 @@
+# Decision Ecosystem — ops-health-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for sharded registry evaluation."""
+
+import copy
+
+import pytest
+
+from ops_health_core.kill_switch import update_kill_switch
+from ops_health_core.model import REASON_FAIL_CLOSED, OpsPolicy, OpsState
+from ops_health_core.parallel import ShardedEvaluator, evaluate_registry, shard_of
+
+POLICY = OpsPolicy(max_errors_per_window=5, weight_errors=0.9, cooldown_ms=1000)
+
+
+def _registry(n: int) -> dict[str, OpsState]:
+    registry = {}
+    for i in range(n):
+        state = OpsState()
+        for ts in range(i % 9):
+            state.record_error(ts * 100)
+        registry[f"entity-{i}"] = state
+    return registry
+
+
+def test_matches_serial_evaluation() -> None:
+    """Pool results (and cooldown side effects) equal a serial loop, in registry order."""
+    registry = _registry(200)
+    expected_states = copy.deepcopy(registry)
+    expected = {k: update_kill_switch(s, POLICY, 2000) for k, s in expected_states.items()}
+    with ShardedEvaluator(POLICY, workers=4) as evaluator:
+        signals = evaluator.evaluate(registry, 2000)
+        assert list(signals) == list(registry)
+        assert signals == expected
+        assert [s.cooldown_until_ms for s in registry.values()] == [
+            s.cooldown_until_ms for s in expected_states.values()
+        ]
+        assert evaluator.evaluate(registry, 2500) == {
+            k: update_kill_switch(s, POLICY, 2500) for k, s in expected_states.items()
+        }
+
+
+def test_default_workers_and_one_shot() -> None:
+    """Defaults evaluate correctly on any build; shard_of is stable and in range."""
+    registry = _registry(20)
+    expected = {k: update_kill_switch(s, POLICY, 0) for k, s in copy.deepcopy(registry).items()}
+    assert evaluate_registry(registry, POLICY, 0) == expected
+    assert all(0 <= shard_of(k, 7) < 7 for k in registry)
+    assert shard_of("entity-3", 7) == shard_of("entity-3", 7)
+    with pytest.raises(ValueError, match="workers"):
+        ShardedEvaluator(POLICY, workers=0)
+
+
+def test_failed_shard_fails_closed() -> None:
+    """An engine error fails only that entity closed; its shard-mates are unaffected."""
+
+    registry = _registry(30)
+    broken = registry["entity-3"]
+    expected = {
+        k: update_kill_switch(s, POLICY, 1000)
+        for k, s in copy.deepcopy(registry).items()
+        if k != "entity-3"
+    }
+
+    def engine(state, policy, now_ms):
+        if state is broken:
+            raise RuntimeError("boom")
+        return update_kill_switch(state, policy, now_ms)
+
+    with ShardedEvaluator(POLICY, workers=3, engine=engine) as evaluator:
+        signals = evaluator.evaluate(registry, 1000)
+    assert signals["entity-3"].reasons == [REASON_FAIL_CLOSED]
+    same_shard = [
+        k for k in registry if k != "entity-3" and shard_of(k, 3) == shard_of("entity-3", 3)
+    ]
+    assert same_shard
+    assert {k: v for k, v in signals.items() if k != "entity-3"} == expected
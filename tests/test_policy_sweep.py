@@ -0,0 +1,98 @@
+# Decision Ecosystem — ops-health-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for the vectorized policy sweep."""
+
+import random
+
+import pytest
+
+from ops_health_core.kill_switch import update_kill_switch
+from ops_health_core.model import (
+    REASON_COOLDOWN_ACTIVE,
+    STATE_CODES,
+    HealthState,
+    OpsPolicy,
+    OpsState,
+)
+
+np = pytest.importorskip("numpy")
+
+from ops_health_core.sweep import sweep_policies
+
+
+def _events(seed: int) -> list[dict]:
+    rng = random.Random(seed)
+    events = []
+    for ts in range(0, 60_000, 50):
+        burst = 20_000 <= ts < 26_000 or 45_000 <= ts < 47_000
+        if rng.random() < (0.3 if burst else 0.01):
+            events.append({"type": rng.choice(["error", "429", "reconnect"]), "ts_ms": ts})
+        if rng.random() < 0.2:
+            latency = rng.expovariate(1 / (900 if burst else 200))
+            events.append({"type": "latency", "ts_ms": ts, "latency_ms": latency})
+    return events
+
+
+def _replay(events: list[dict], policy: OpsPolicy, eval_times: list[int]) -> list:
+    state = OpsState()
+    pending = sorted(events, key=lambda e: e["ts_ms"])
+    i = 0
+    signals = []
+    for now in eval_times:
+        while i < len(pending) and pending[i]["ts_ms"] <= now:
+            event = pending[i]
+            if event["type"] == "error":
+                state.record_error(event["ts_ms"])
+            elif event["type"] == "429":
+                state.record_429(event["ts_ms"])
+            elif event["type"] == "reconnect":
+                state.record_reconnect(event["ts_ms"])
+            else:
+                state.record_latency(event["latency_ms"], event["ts_ms"])
+            i += 1
+        signals.append(update_kill_switch(state, policy, now))
+    return signals
+
+
+def test_sweep_matches_sequential_replay() -> None:
+    """Every policy's scores, states, deny and trips equal a per-policy replay."""
+    events = _events(7)
+    policies = [
+        OpsPolicy(window_ms=window, max_errors_per_window=max_errors, cooldown_ms=cooldown)
+        for window in (5_000, 10_000)
+        for max_errors in (5, 20)
+        for cooldown in (0, 3_000)
+    ]
+    eval_times = list(range(0, 60_000, 500))
+    sweep = sweep_policies(events, policies, eval_times)
+    for i, policy in enumerate(policies):
+        signals = _replay(events, policy, eval_times)
+        assert sweep.scores[i].tolist() == [s.score for s in signals]
+        assert sweep.states[i].tolist() == [STATE_CODES[s.state] for s in signals]
+        assert sweep.deny[i].tolist() == [s.deny_actions for s in signals]
+        trips = [
+            s.state == HealthState.RED and REASON_COOLDOWN_ACTIVE not in s.reasons for s in signals
+        ]
+        assert sweep.trips[i].tolist() == trips
+        assert sweep.summaries[i].trips == sum(trips)
+
+
+def test_summaries_with_incident_labels() -> None:
+    """False trips and missed incidents are counted against labeled intervals."""
+    events = _events(3)
+    strict = OpsPolicy(max_errors_per_window=2, window_ms=5_000)
+    lax = OpsPolicy(max_errors_per_window=500, window_ms=5_000)
+    eval_times = list(range(0, 60_000, 250))
+    sweep = sweep_policies(events, [strict, lax], eval_times, incidents=[(20_000, 30_000)])
+    strict_summary, lax_summary = sweep.summaries
+    assert strict_summary.trips > 0 and strict_summary.time_in_red_ms > 0
+    assert strict_summary.missed_incidents == 0
+    assert lax_summary.trips == 0 and lax_summary.missed_incidents == 1
+    assert lax_summary.false_trips == 0
+
+
+def test_rejects_unreplayable_policy() -> None:
+    """Saturation/drift penalties cannot be replayed from an event log."""
+    with pytest.raises(ValueError):
+        sweep_policies([], [OpsPolicy(weight_drift=0.2)], [0])
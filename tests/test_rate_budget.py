@@ -0,0 +1,74 @@
+# Decision Ecosystem — ops-health-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for the AIMD rate-limit budget."""
+
+from ops_health_core.budget import RateBudget, RateBudgetPolicy
+from ops_health_core.kill_switch import update_kill_switch
+from ops_health_core.model import OpsPolicy, OpsState
+
+
+def test_429_cuts_rate_multiplicatively_once_per_holdoff() -> None:
+    """A 429 burst halves the rate once, not once per event."""
+    budget = RateBudget(RateBudgetPolicy(initial_rate_per_s=100.0, increase_per_s=0.0))
+    budget.on_429(1000)
+    budget.on_429(1100)
+    budget.on_429(1500)
+    assert budget.recommended_rate(1500) == 50.0
+    budget.on_429(2000)  # Holdoff elapsed
+    assert budget.recommended_rate(2000) == 25.0
+
+
+def test_rate_recovers_additively_and_is_bounded() -> None:
+    """Without congestion the rate grows linearly up to max_rate_per_s."""
+    policy = RateBudgetPolicy(initial_rate_per_s=10.0, increase_per_s=5.0, max_rate_per_s=30.0)
+    budget = RateBudget(policy)
+    budget.recommended_rate(0)
+    assert budget.recommended_rate(2000) == 20.0
+    assert budget.recommended_rate(60_000) == 30.0
+
+
+def test_rate_never_below_min() -> None:
+    """Multiplicative decrease is floored at min_rate_per_s."""
+    policy = RateBudgetPolicy(initial_rate_per_s=4.0, min_rate_per_s=2.0, decrease_holdoff_ms=0)
+    budget = RateBudget(policy)
+    for ts in range(10):
+        budget.on_429(ts)
+    assert budget.rate_per_s == 2.0
+
+
+def test_latency_above_target_is_congestion() -> None:
+    """Slow responses decrease the rate when latency_target_ms is set."""
+    policy = RateBudgetPolicy(initial_rate_per_s=100.0, latency_target_ms=200, increase_per_s=0.0)
+    budget = RateBudget(policy)
+    budget.on_latency(150, 1000)
+    assert budget.rate_per_s == 100.0
+    budget.on_latency(500, 1001)
+    assert budget.rate_per_s == 90.0
+
+
+def test_token_bucket_throttles() -> None:
+    """try_acquire() admits at most rate * burst_s tokens, then replenishes over time."""
+    policy = RateBudgetPolicy(initial_rate_per_s=10.0, increase_per_s=0.0, burst_s=1.0)
+    budget = RateBudget(policy)
+    admitted = sum(budget.try_acquire(0) for _ in range(20))
+    assert admitted == 10
+    assert budget.try_acquire(100) is True  # 0.1 s at 10/s => one token
+    assert budget.try_acquire(100) is False
+
+
+def test_signal_publishes_recommended_rate() -> None:
+    """Kill switch signal carries the budget recommendation in its context."""
+    state = OpsState(rate_budget=RateBudget(RateBudgetPolicy(initial_rate_per_s=40.0)))
+    state.record_429(1000)
+    signal = update_kill_switch(state, OpsPolicy(), 1000)
+    assert signal.recommended_rate_per_s == 20.0
+    assert signal.to_context()["ops_recommended_rate_per_s"] == 20.0
+    assert state.rate_limit_timestamps == [1000]
+
+
+def test_signal_without_budget_has_no_rate() -> None:
+    """Context is unchanged when no budget is attached."""
+    signal = update_kill_switch(OpsState(), OpsPolicy(), 1000)
+    assert signal.recommended_rate_per_s is None
+    assert "ops_recommended_rate_per_s" not in signal.to_context()
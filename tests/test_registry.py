@@ -0,0 +1,132 @@
+# Decision Ecosystem — ops-health-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for the evicting entity registry and the spill store."""
+
+import copy
+
+import pytest
+
+from ops_health_core.budget import RateBudget
+from ops_health_core.drift import DriftMonitor, DriftPolicy
+from ops_health_core.kill_switch import update_kill_switch
+from ops_health_core.model import HealthState, OpsPolicy, OpsState
+from ops_health_core.registry import EvictionPolicy, OpsRegistry, SpillStore
+
+POLICY = OpsPolicy(window_ms=100, cooldown_ms=1000, max_errors_per_window=1, weight_errors=1.0)
+
+
+def test_ttl_drops_idle_and_keeps_active() -> None:
+    """Idle entities with empty windows are dropped; entities with events stay."""
+    registry = OpsRegistry(POLICY, EvictionPolicy(idle_ttl_ms=50))
+    registry.state("quiet", 0).record_latency(5, 0)
+    registry.state("busy", 0).record_latency(5, 190)  # Still in window at 200
+    stats = registry.evict(200)
+    assert (stats.dropped, stats.spilled, stats.resident) == (1, 0, 1)
+    assert list(registry) == ["busy"]
+
+
+def test_cooldown_spilled_and_rehydrated_exactly() -> None:
+    """A tripped entity is spilled, then rehydrated with identical decisions."""
+    spill = SpillStore()
+    registry = OpsRegistry(POLICY, EvictionPolicy(idle_ttl_ms=100), spill=spill)
+    state = registry.state("a", 0)
+    state.record_error(0)
+    assert update_kill_switch(state, POLICY, 10).cooldown_until_ms == 1010
+    twin = copy.deepcopy(state)
+    stats = registry.evict(300)
+    assert (stats.dropped, stats.spilled) == (0, 1)
+    assert "a" not in registry and registry.is_spilled("a") and len(spill) == 1
+
+    restored = registry.state("a", 400)
+    assert registry.rehydrated == 1 and not registry.is_spilled("a")
+    assert update_kill_switch(restored, POLICY, 400) == update_kill_switch(twin, POLICY, 400)
+
+
+def test_expired_spill_records_discarded() -> None:
+    spill = SpillStore()
+    registry = OpsRegistry(POLICY, EvictionPolicy(idle_ttl_ms=100), spill=spill)
+    state = registry.state("a", 0)
+    state.record_error(0)
+    update_kill_switch(state, POLICY, 10)
+    registry.evict(300)
+    assert registry.evict(1010).expired == 1
+    assert len(spill) == 0
+    assert registry.state("a", 1100).cooldown_until_ms is None  # Fresh state
+
+
+def test_cooldown_kept_resident_without_spill_store() -> None:
+    registry = OpsRegistry(POLICY, EvictionPolicy(idle_ttl_ms=100))
+    state = registry.state("a", 0)
+    state.record_error(0)
+    update_kill_switch(state, POLICY, 10)
+    assert registry.evict(300).resident == 1
+
+
+def test_lru_cap_and_memory_budget() -> None:
+    """Caps evict least recently used eligible entities until within budget."""
+    registry = OpsRegistry(POLICY, EvictionPolicy(max_entities=2))
+    for i in range(5):
+        registry.state(f"e{i}", i)
+    registry.state("e0", 10)  # Most recently used now
+    registry.evict(10)
+    assert list(registry) == ["e4", "e0"]
+
+    registry = OpsRegistry(POLICY, EvictionPolicy(memory_budget_bytes=0))
+    for i in range(3):
+        registry.state(f"e{i}", 0).record_error(0)  # In window: not eligible
+    assert registry.evict(50).resident == 3
+    assert registry.evict(500).resident == 0
+    assert registry.memory_usage() > 0
+
+
+def test_spill_store_on_disk(tmp_path) -> None:
+    """Records survive reopening the database file."""
+    path = tmp_path / "spill.db"
+    state = OpsState(cooldown_until_ms=5000)
+    state.record_error(1)
+    spill = SpillStore(path)
+    spill.put("a", state)
+    assert spill.size_bytes() > 0
+    spill.close()
+    reopened = SpillStore(path)
+    assert reopened.take("a") == state
+    assert reopened.take("a") is None
+    with pytest.raises(ValueError, match="cooldown"):
+        reopened.put("b", OpsState())
+    reopened.close()
+
+
+def test_invalid_eviction_policy() -> None:
+    with pytest.raises(ValueError, match="idle_ttl_ms"):
+        OpsRegistry(POLICY, EvictionPolicy(idle_ttl_ms=-1))
+
+
+def test_drift_hold_and_rate_budget_keep_entity_resident() -> None:
+    """Eviction never clears a drift hold or an unrecovered rate budget (no fail-open)."""
+    policy = OpsPolicy(window_ms=10_000, cooldown_ms=5000, weight_drift=1.0)
+    registry = OpsRegistry(
+        policy,
+        EvictionPolicy(idle_ttl_ms=1000),
+        state_factory=lambda: OpsState(drift=DriftMonitor(DriftPolicy(min_samples=10))),
+    )
+    state = registry.state("a", 0)
+    for ts in range(500):
+        state.record_latency(50, ts)
+    for ts in range(500, 540):
+        state.record_error(ts)
+    reference = copy.deepcopy(state)
+    assert registry.evict(20_000).resident == 1
+    expected = update_kill_switch(reference, policy, 20_000)
+    assert expected.state == HealthState.RED
+    assert update_kill_switch(registry.state("a", 20_000), policy, 20_000) == expected
+    assert registry.evict(600_000).dropped == 1  # Hold over
+
+    registry = OpsRegistry(
+        POLICY,
+        EvictionPolicy(idle_ttl_ms=100),
+        state_factory=lambda: OpsState(rate_budget=RateBudget()),
+    )
+    registry.state("b", 0).record_429(0)  # Rate halved; recovers at 5/s
+    assert registry.evict(1000).resident == 1
+    assert registry.evict(11_000).dropped == 1
@@ -0,0 +1,84 @@
+# Decision Ecosystem — ops-health-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for the hierarchical health rollup tree."""
+
+from decision_schema.types import Action
+
+from ops_health_core.model import HealthState, OpsPolicy, OpsState
+from ops_health_core.rollup import RollupNode
+from ops_health_core.scorer import compute_health_score
+
+
+def _tree(policy: OpsPolicy) -> tuple[RollupNode, RollupNode, RollupNode, RollupNode]:
+    fleet = RollupNode("fleet", policy, slices=10)
+    svc = fleet.child("svc")
+    inst_a = svc.child("a")
+    inst_b = svc.child("b")
+    return fleet, svc, inst_a, inst_b
+
+
+def test_leaf_events_propagate_to_ancestors() -> None:
+    """Counts recorded through OpsState reach every ancestor, not siblings."""
+    policy = OpsPolicy(window_ms=10_000)
+    fleet, svc, inst_a, inst_b = _tree(policy)
+    state_a = OpsState(rollup=inst_a)
+    state_b = OpsState(rollup=inst_b)
+    state_a.record_error(1000)
+    state_a.record_429(1000)
+    state_b.record_error(2000)
+    state_b.record_latency(250, 2000)
+
+    assert inst_a.counts(2000) == (1, 1, 0)
+    assert inst_b.counts(2000) == (1, 0, 0)
+    assert svc.counts(2000) == (2, 1, 0)
+    assert fleet.counts(2000) == (2, 1, 0)
+    assert len(fleet.latency) == 1
+    assert inst_b.path() == ["fleet", "svc", "b"]
+
+
+def test_leaf_score_matches_state_score() -> None:
+    """A leaf's rolled-up score equals the state's own score (events inside window)."""
+    policy = OpsPolicy(window_ms=10_000)
+    _, _, inst_a, _ = _tree(policy)
+    state = OpsState(rollup=inst_a)
+    for ts in (5000, 6000, 7000):
+        state.record_error(ts)
+        state.record_latency(40, ts)
+    assert inst_a.score(8000) == compute_health_score(state, policy, 8000)
+
+
+def test_slices_expire() -> None:
+    """Events leave the rollup once their slice is outside the window."""
+    policy = OpsPolicy(window_ms=10_000)
+    fleet, _, inst_a, _ = _tree(policy)
+    inst_a.record_error(500)
+    assert fleet.counts(5000) == (1, 0, 0)
+    assert fleet.counts(11_000) == (0, 0, 0)
+    inst_a.record_error(200)  # Already outside fleet's window
+    assert fleet.counts(11_000) == (0, 0, 0)
+
+
+def test_score_cached_until_path_changes() -> None:
+    """Reading a node does not recompute unless its subtree changed."""
+    policy = OpsPolicy(window_ms=10_000, max_errors_per_window=2, weight_errors=1.0)
+    fleet, _svc, inst_a, inst_b = _tree(policy)
+    inst_a.record_error(1000)
+    first = fleet.score(1000)
+    assert fleet.score(1000) is first
+    inst_b.record_error(1000)
+    assert fleet.score(1000) is not first
+    assert fleet.score(1000)[1] == HealthState.RED
+
+
+def test_node_kill_switch_has_own_cooldown() -> None:
+    """Each node trips its own kill switch independently."""
+    policy = OpsPolicy(window_ms=10_000, max_errors_per_window=2, weight_errors=1.0)
+    _fleet, _svc, inst_a, inst_b = _tree(policy)
+    inst_a.record_error(1000, count=2)
+    signal = inst_a.evaluate(1000)
+    assert signal.deny_actions is True
+    assert signal.recommended_action == Action.HOLD
+    assert inst_a.cooldown_until_ms == 1000 + policy.cooldown_ms
+    assert inst_b.evaluate(1000).deny_actions is False
+    assert inst_b.cooldown_until_ms is None
@@ -0,0 +1,69 @@
+# Decision Ecosystem — ops-health-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for the sampled (reservoir) latency store."""
+
+import random
+
+from ops_health_core.kill_switch import update_kill_switch
+from ops_health_core.latency import SampledLatencyStore
+from ops_health_core.model import OpsPolicy, OpsState
+
+
+def _reference_quantile(values: list[int], q: float) -> int:
+    ordered = sorted(values)
+    return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+
+def test_exact_below_cap() -> None:
+    """Without overflow, quantiles equal the exact list computation."""
+    store = SampledLatencyStore(window_ms=1000, max_samples=160, slices=16)
+    values = [random.Random(1).randint(1, 500) for _ in range(5)] + [7, 900, 3]
+    for ts, v in enumerate(values):
+        store.record(v, ts * 10)
+    for q in (0.5, 0.95, 0.99):
+        assert store.quantile(q) == _reference_quantile(values, q)
+    assert store.sampling_rate() == 1.0
+    assert store.rank_error() == 0.0
+
+
+def test_caps_retained_samples_and_stays_close() -> None:
+    """Retained samples are capped; weighted p95 stays within the rank error bound."""
+    rng = random.Random(3)
+    store = SampledLatencyStore(window_ms=10_000, max_samples=1600, slices=16, seed=5)
+    values = []
+    for i in range(100_000):
+        v = int(rng.lognormvariate(5, 0.8))
+        values.append(v)
+        store.record(v, i // 10)
+    assert store.sampling_rate() <= 1600 / 100_000 + 1e-12
+    eps = store.rank_error()
+    assert 0.0 < eps < 0.05
+    estimate = store.quantile(0.95)
+    assert _reference_quantile(values, 0.95 - eps) <= estimate
+    assert estimate <= _reference_quantile(values, min(0.999, 0.95 + eps))
+    assert store.max_value() == max(values)
+    assert len(store) == 100_000
+
+
+def test_deterministic_for_seed() -> None:
+    """Same seed and inputs give the same estimate."""
+    results = []
+    for _ in range(2):
+        store = SampledLatencyStore(window_ms=1000, max_samples=32, slices=4, seed=9)
+        for i in range(5000):
+            store.record((i * 7919) % 1000, i % 1000)
+        results.append(store.quantiles([0.5, 0.95]))
+    assert results[0] == results[1]
+
+
+def test_signal_reports_sampling() -> None:
+    """Kill switch publishes sampling rate and rank error in the context."""
+    state = OpsState(latency_store=SampledLatencyStore(window_ms=1000, max_samples=16, slices=4))
+    for i in range(400):
+        state.record_latency(10 + i % 50, 4000 + i)
+    signal = update_kill_switch(state, OpsPolicy(window_ms=1000), 4500)
+    context = signal.to_context()
+    assert context["ops_latency_sample_rate"] == signal.latency_sample_rate < 1.0
+    assert context["ops_latency_rank_error"] > 0.0
+    assert "ops_latency_p95_ms" in context
@@ -0,0 +1,64 @@
+# Decision Ecosystem — ops-health-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for saturation gauges and the saturation penalty."""
+
+import pytest
+
+from ops_health_core.gauges import GAUGE_QUEUE_DEPTH, WindowedGauge
+from ops_health_core.model import OpsPolicy, OpsState
+from ops_health_core.policy import compile_policy
+from ops_health_core.scorer import compute_health_score
+
+
+def test_windowed_max_expires() -> None:
+    """Monotonic deque keeps the max of samples still in effect in the window."""
+    gauge = WindowedGauge()
+    gauge.record(50, 0)
+    gauge.record(10, 100)
+    gauge.record(30, 200)
+    assert gauge.stats(250, 1000)[1] == 50
+    # Window [150, 350]: 10 is the carry-in value, 30 recorded at 200
+    assert gauge.stats(350, 200)[1] == 30
+
+
+def test_time_weighted_average() -> None:
+    """Average weights each value by how long it held, including the carry-in."""
+    gauge = WindowedGauge()
+    gauge.record(0, 0)
+    gauge.record(10, 500)
+    # [0, 1000]: 0 for 500 ms, 10 for 500 ms
+    assert gauge.stats(1000, 1000)[0] == pytest.approx(5.0)
+    # [750, 1250]: 10 held throughout
+    assert gauge.stats(1250, 500)[0] == pytest.approx(10.0)
+
+
+def test_out_of_order_sample_ignored() -> None:
+    """Samples older than the latest are dropped."""
+    gauge = WindowedGauge()
+    gauge.record(5, 100)
+    gauge.record(99, 50)
+    assert gauge.stats(200, 1000) == (5, 5)
+    assert WindowedGauge().stats(200, 1000) is None
+
+
+def test_saturation_penalty_lowers_score() -> None:
+    """A saturated gauge applies weight_saturation; without weight the score is unchanged."""
+    state = OpsState()
+    for ts in range(0, 10_000, 1000):
+        state.record_gauge(GAUGE_QUEUE_DEPTH, 200, ts)
+
+    no_weight = OpsPolicy(saturation_limits={GAUGE_QUEUE_DEPTH: 100})
+    assert compute_health_score(state, no_weight, 10_000)[0] == 1.0
+
+    policy = compile_policy(
+        OpsPolicy(saturation_limits={GAUGE_QUEUE_DEPTH: 100}, weight_saturation=0.5)
+    )
+    score, _ = compute_health_score(state, policy, 10_000)
+    assert score == pytest.approx(0.5)
+
+
+def test_saturation_limit_validation() -> None:
+    """Non-positive limits are rejected at compile time."""
+    with pytest.raises(ValueError):
+        compile_policy(OpsPolicy(saturation_limits={GAUGE_QUEUE_DEPTH: 0}))
@@ -0,0 +1,81 @@
+# Decision Ecosystem — ops-health-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for the memoized signal cache."""
+
+from unittest.mock import patch
+
+from decision_schema.types import Action
+
+from ops_health_core.cache import SignalCache
+from ops_health_core.kill_switch import update_kill_switch
+from ops_health_core.model import (
+    REASON_COOLDOWN_ACTIVE,
+    REASON_HEALTH_RED,
+    OpsPolicy,
+    OpsState,
+)
+
+
+def test_hits_until_version_or_quantum_changes() -> None:
+    """Repeated calls in one quantum reuse the signal; record_* invalidates."""
+    state = OpsState()
+    cache = SignalCache(state, OpsPolicy(), quantum_ms=10)
+    first = cache.get(1000)
+    assert cache.get(1005) is first
+    state.record_error(1006)
+    assert cache.get(1007) is not first
+    assert cache.get(1012) is not cache.get(1025)
+    assert (cache.hits, cache.misses) == (1, 4)
+
+
+def test_cooldown_expiry_is_exact() -> None:
+    """A cached signal is never served at or after its cooldown end."""
+    policy = OpsPolicy(window_ms=100, cooldown_ms=50, max_errors_per_window=1, weight_errors=1.0)
+    state = OpsState()
+    state.record_error(0)
+    cache = SignalCache(state, policy, quantum_ms=1000)
+    tripped = cache.get(10)
+    assert tripped.deny_actions and tripped.cooldown_until_ms == 60
+    held = cache.get(59)  # Cooldown now active: re-evaluated once, then cached
+    assert held.reasons == [REASON_HEALTH_RED, REASON_COOLDOWN_ACTIVE]
+    assert cache.get(58) is held
+    after = cache.get(200)  # Same quantum, cooldown over and window empty
+    assert not after.deny_actions and after.cooldown_until_ms is None
+
+
+def test_matches_direct_evaluation() -> None:
+    """With quantum_ms=1 the cached stream equals update_kill_switch at distinct times."""
+    policy = OpsPolicy(window_ms=500, cooldown_ms=200, max_errors_per_window=3, weight_errors=0.8)
+    cached_state, direct_state = OpsState(), OpsState()
+    cache = SignalCache(cached_state, policy)
+    for ts in range(0, 3000, 37):
+        if ts % 300 < 120:
+            cached_state.record_error(ts)
+            direct_state.record_error(ts)
+        assert cache.get(ts) == update_kill_switch(direct_state, policy, ts)
+
+
+def test_fail_closed_is_not_cached() -> None:
+    """Fail-closed results are returned but never memoized."""
+    state = OpsState()
+    cache = SignalCache(state, OpsPolicy())
+    with patch(
+        "ops_health_core.kill_switch.compute_health_score", side_effect=RuntimeError("simulated")
+    ):
+        signal = cache.get(1000)
+    assert signal.deny_actions and signal.recommended_action == Action.HOLD
+    assert not cache.get(1000).deny_actions
+    assert cache.misses == 2
+
+
+def test_repeated_call_after_trip_matches_direct() -> None:
+    """A second call at the trip time reports the cooldown it started, like update_kill_switch."""
+    policy = OpsPolicy(window_ms=5, cooldown_ms=1, max_errors_per_window=5, weight_errors=0.9)
+    policy.score_threshold_red = policy.score_threshold_yellow = 1.0
+    cached_state, direct_state = OpsState(), OpsState()
+    cache = SignalCache(cached_state, policy)
+    cached_state.record_error(73)
+    direct_state.record_error(73)
+    for _ in range(3):
+        assert cache.get(75) == update_kill_switch(direct_state, policy, 75)
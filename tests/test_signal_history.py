@@ -0,0 +1,97 @@
+# Decision Ecosystem — ops-health-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for the columnar signal history ring buffer."""
+
+import io
+
+import pytest
+
+from ops_health_core.history import NO_COOLDOWN, SignalHistory
+from ops_health_core.kill_switch import update_kill_switch
+from ops_health_core.model import (
+    REASON_COOLDOWN_ACTIVE,
+    REASON_HEALTH_RED,
+    REASON_OTHER_BIT,
+    STATE_CODES,
+    HealthState,
+    OpsPolicy,
+    OpsState,
+    flags_to_reasons,
+    reasons_to_flags,
+)
+
+
+def _run(history: SignalHistory, steps: int) -> list:
+    policy = OpsPolicy(window_ms=1000, cooldown_ms=500, max_errors_per_window=3, weight_errors=0.8)
+    state = OpsState()
+    signals = []
+    for ts in range(0, steps * 100, 100):
+        if ts % 700 < 300:
+            state.record_error(ts)
+        signal = update_kill_switch(state, policy, ts)
+        history.append(signal, ts)
+        signals.append((ts, signal))
+    return signals
+
+
+def test_reason_flags_round_trip() -> None:
+    """Known reasons encode to bits and decode in production order."""
+    flags = reasons_to_flags([REASON_COOLDOWN_ACTIVE, REASON_HEALTH_RED])
+    assert flags_to_reasons(flags) == [REASON_HEALTH_RED, REASON_COOLDOWN_ACTIVE]
+    assert reasons_to_flags(["custom"]) == REASON_OTHER_BIT
+    with pytest.raises(ValueError):
+        flags_to_reasons(REASON_OTHER_BIT)
+
+
+def test_ring_buffer_keeps_last_rows_in_order() -> None:
+    """Only the last `capacity` signals are kept, oldest first."""
+    history = SignalHistory(capacity=8)
+    signals = _run(history, 20)
+    assert len(history) == 8
+    kept = signals[-8:]
+    assert history.column("ts_ms") == [ts for ts, _ in kept]
+    assert history.column("score") == [s.score for _, s in kept]
+    assert history.column("state") == [STATE_CODES[s.state] for _, s in kept]
+    assert history.column("deny") == [int(s.deny_actions) for _, s in kept]
+    assert history.column("cooldown_until_ms") == [
+        NO_COOLDOWN if s.cooldown_until_ms is None else s.cooldown_until_ms for _, s in kept
+    ]
+    assert [flags_to_reasons(f) for f in history.column("reason_flags")] == [
+        s.reasons for _, s in kept
+    ]
+    assert any(s.state == HealthState.RED for _, s in kept)
+
+
+def test_numpy_export_zero_copy_until_wrap() -> None:
+    """Before wrapping, NumPy columns share memory with the ring buffer."""
+    np = pytest.importorskip("numpy")
+    history = SignalHistory(capacity=16)
+    _run(history, 10)
+    columns = history.to_numpy()
+    assert columns["ts_ms"].dtype == np.int64 and len(columns["ts_ms"]) == 10
+    columns["score"][0] = -1.0
+    assert history.column("score")[0] == -1.0
+
+    _run(history, 10)  # Wraps
+    ordered = history.to_numpy()
+    assert ordered["ts_ms"].tolist() == history.column("ts_ms")
+    raw = history.to_numpy(ordered=False)
+    start = history.start()
+    assert np.concatenate((raw["ts_ms"][start:], raw["ts_ms"][:start])).tolist() == (
+        history.column("ts_ms")
+    )
+
+
+def test_arrow_ipc_round_trip() -> None:
+    """Arrow IPC stream carries every column, oldest row first."""
+    pa = pytest.importorskip("pyarrow")
+    history = SignalHistory(capacity=8)
+    _run(history, 13)
+    sink = io.BytesIO()
+    history.write_arrow_ipc(sink)
+    table = pa.ipc.open_stream(sink.getvalue()).read_all()
+    assert table.num_rows == 8
+    assert table.column("ts_ms").to_pylist() == history.column("ts_ms")
+    assert table.column("reason_flags").to_pylist() == history.column("reason_flags")
+    assert table.schema.field("state").type == pa.int8()
@@ -0,0 +1,80 @@
+# Decision Ecosystem — ops-health-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for copy-on-write state snapshots."""
+
+import random
+import threading
+
+from ops_health_core.kill_switch import update_kill_switch
+from ops_health_core.model import OpsPolicy, OpsState
+from ops_health_core.scorer import compute_health_score
+from ops_health_core.snapshot import OpsStateWriter, evaluate_snapshot
+
+
+class _Holder:
+    cooldown_until_ms: int | None = None
+
+
+def test_snapshot_scores_match_ops_state() -> None:
+    """Published snapshots score exactly like an OpsState holding the same events."""
+    rng = random.Random(11)
+    policy = OpsPolicy(window_ms=2000, max_errors_per_window=15, weight_errors=0.7)
+    writer = OpsStateWriter(window_ms=policy.window_ms, chunk_size=16)
+    state = OpsState()
+    holder = _Holder()
+    for ts in range(0, 20_000, 10):
+        if rng.random() < 0.2:
+            writer.record_error(ts)
+            state.record_error(ts)
+        if rng.random() < 0.3:
+            latency = rng.randint(1, 3000)
+            writer.record_latency(latency, ts)
+            state.record_latency(latency, ts)
+        if ts % 250 == 0:
+            snapshot = writer.publish(ts)
+            assert snapshot.health_score(policy, ts) == compute_health_score(state, policy, ts)
+            assert evaluate_snapshot(snapshot, holder, policy, ts) == update_kill_switch(
+                state, policy, ts
+            )
+    assert len(writer.current.latencies) <= 2 * 600 // 16 + 2  # Expired chunks dropped
+
+
+def test_old_snapshots_are_unchanged_and_shared() -> None:
+    """Publishing never mutates an earlier snapshot; unchanged chunks are shared."""
+    writer = OpsStateWriter(window_ms=10_000, chunk_size=4)
+    for ts in range(8):
+        writer.record_error(ts)  # Two full chunks, auto-published
+    first = writer.current
+    writer.record_error(8)
+    second = writer.publish()
+    assert first.counts(0) == (8, 0, 0) and second.counts(0) == (9, 0, 0)
+    assert second.errors[:2] == first.errors and second.errors[0] is first.errors[0]
+
+
+def test_readers_never_see_torn_latency() -> None:
+    """Concurrent readers always see paired latency values and timestamps."""
+    writer = OpsStateWriter(window_ms=1_000_000, chunk_size=8)
+    stop = threading.Event()
+    errors: list[str] = []
+
+    def reader() -> None:
+        while not stop.is_set():
+            for chunk in writer.current.latencies:
+                if len(chunk.ts) != len(chunk.values) or any(
+                    v != ts * 2 for v, ts in zip(chunk.values, chunk.ts, strict=True)
+                ):
+                    errors.append("torn")
+
+    threads = [threading.Thread(target=reader) for _ in range(2)]
+    for t in threads:
+        t.start()
+    for ts in range(5000):
+        writer.record_latency(ts * 2, ts)
+        if ts % 3 == 0:
+            writer.publish()
+    stop.set()
+    for t in threads:
+        t.join()
+    assert not errors
+    assert writer.current.p95_latency(0) is not None
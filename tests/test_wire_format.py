@@ -0,0 +1,99 @@
+# Decision Ecosystem — ops-health-core
+# Copyright (c) 2026 Mücahit Muzaffer Karafil (MchtMzffr)
+# SPDX-License-Identifier: MIT
+"""Tests for the binary OpsSignal wire format."""
+
+import pytest
+from decision_schema.types import Action
+
+from ops_health_core.kill_switch import fail_closed_signal, update_kill_switch
+from ops_health_core.latency import SampledLatencyStore
+from ops_health_core.model import (
+    REASON_COOLDOWN_ACTIVE,
+    REASON_HEALTH_RED,
+    HealthState,
+    OpsPolicy,
+    OpsSignal,
+    OpsState,
+)
+from ops_health_core.wire import decode_signal, encode_signal
+
+
+def _signals() -> list[OpsSignal]:
+    policy = OpsPolicy(window_ms=10_000, max_errors_per_window=2, weight_errors=0.9)
+    plain = OpsState()
+    full = OpsState(latency_store=SampledLatencyStore(window_ms=10_000, max_samples=8, slices=4))
+    signals = [fail_closed_signal()]
+    for ts in range(0, 5000, 250):
+        for state in (plain, full):
+            state.record_error(ts)
+            state.record_latency(100 + ts % 700, ts)
+            signals.append(update_kill_switch(state, policy, ts))
+    return signals
+
+
+def test_round_trip_matches_to_context() -> None:
+    """Decoded views reproduce to_context() and the signal exactly."""
+    signals = _signals()
+    assert any(s.cooldown_until_ms is not None for s in signals)
+    assert any(s.latency_sample_rate is not None for s in signals)
+    for signal in signals:
+        data = encode_signal(signal)
+        view = decode_signal(data)
+        assert view.to_context() == signal.to_context()
+        assert [type(v) for v in view.to_context().values()] == [
+            type(v) for v in signal.to_context().values()
+        ]
+        assert view.to_signal() == signal
+        assert view.nbytes == len(data)
+
+
+def test_minimal_signal_is_header_only() -> None:
+    """A signal without optional fields encodes to the fixed 24-byte header."""
+    signal = OpsSignal(
+        score=0.75,
+        state=HealthState.GREEN,
+        deny_actions=False,
+        cooldown_until_ms=None,
+        recommended_action=Action.ACT,
+    )
+    data = encode_signal(signal)
+    assert len(data) == 24
+    view = decode_signal(memoryview(bytearray(data) + b"trailing"))
+    assert (view.score, view.state, view.deny_actions) == (0.75, HealthState.GREEN, False)
+    assert view.cooldown_until_ms is None and view.reasons == []
+
+
+def test_non_canonical_reasons_are_exact() -> None:
+    """Unknown or reordered reasons are carried verbatim."""
+    for reasons in (
+        ["custom_reason", REASON_HEALTH_RED],
+        [REASON_COOLDOWN_ACTIVE, REASON_HEALTH_RED],
+        ["é", ""],
+    ):
+        signal = OpsSignal(
+            score=0.1,
+            state=HealthState.RED,
+            deny_actions=True,
+            cooldown_until_ms=123,
+            recommended_action=Action.HOLD,
+            reasons=reasons,
+        )
+        assert decode_signal(encode_signal(signal)).reasons == reasons
+
+
+def test_rejects_bad_buffers() -> None:
+    """Wrong version, unknown state/action codes or truncated buffers raise ValueError."""
+    data = encode_signal(fail_closed_signal())
+    with pytest.raises(ValueError):
+        decode_signal(data[:10])
+    with pytest.raises(ValueError):
+        decode_signal(b"\x09" + data[1:])
+    with pytest.raises(ValueError):
+        decode_signal(data[:1] + b"\xff" + data[2:])
+    with pytest.raises(ValueError):
+        decode_signal(data[:3] + b"\xff" + data[4:])
+    signal = fail_closed_signal()
+    signal.reasons = ["custom"]
+    with pytest.raises(ValueError):
+        decode_signal(encode_signal(signal)[:-2])